@@ -8,10 +8,12 @@
 """Used typically to calculate if all the files in the context of building a Docker image have changed or not."""
 
 import argparse
+import hashlib
 import subprocess
 import sys
 import zlib
 from pathlib import Path
+from typing import NamedTuple
 
 DEVCONTAINER_COMMENT_LINE_PREFIX = (
     "  // Devcontainer context hash (do not manually edit this, it's managed by a pre-commit hook): "
@@ -21,6 +23,10 @@ DEVCONTAINER_COMMENT_LINE_SUFFIX = (
     " # spellchecker:disable-line"  # the typos hook can sometimes mess with the hash without this
 )
 
+GIT_SYMLINK_MODE = "120000"
+GIT_SUBMODULE_MODE = "160000"
+SHA256_OBJECT_ID_LENGTH = 64
+
 
 def get_tracked_files(repo_path: Path) -> list[str]:
     """Return a list of files tracked by Git in the given repository folder, using the 'git ls-files' command."""
@@ -38,6 +44,42 @@ def get_tracked_files(repo_path: Path) -> list[str]:
         sys.exit(1)
 
 
+class GitIndexEntry(NamedTuple):
+    mode: str
+    object_id: str
+
+
+def _run_git_ls_files(repo_path: Path, *args: str) -> list[str]:
+    try:
+        result = subprocess.run(  # noqa: S603 # there's no concern about executing untrusted input, only we will call this script
+            ["git", "-C", str(repo_path), "ls-files", "-z", *args],  # noqa: S607 # yes, this is not using a complete executable path, but it's just git and git should always be present in PATH
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError:
+        print("Error: The directory does not appear to be a Git repository or Git is not installed.", file=sys.stderr)  # noqa: T201 # this just runs as a simple script, so using print instead of log
+        sys.exit(1)
+    return [entry for entry in result.stdout.split("\0") if entry]
+
+
+def get_git_index_entries(repo_path: Path) -> dict[str, GitIndexEntry]:
+    """Return the mode and blob ID git has recorded in its index for every tracked file."""
+    # this only reads the index itself, unlike e.g. --eol, which has to read every blob to report its line endings
+    entries: dict[str, GitIndexEntry] = {}
+    for line in _run_git_ls_files(repo_path, "--stage"):
+        # <mode> <object id> <stage>\t<path>
+        stage_info, file = line.split("\t", 1)
+        mode, object_id, _ = stage_info.split(" ")
+        entries[file] = GitIndexEntry(mode=mode, object_id=object_id)
+    return entries
+
+
+def get_worktree_modified_files(repo_path: Path) -> set[str]:
+    """Return the tracked files whose worktree copy may differ from the index (including deleted ones)."""
+    return set(_run_git_ls_files(repo_path, "--modified"))
+
+
 def filter_files_for_devcontainer_context(files: list[str]) -> tuple[list[str], Path]:
     devcontainer_context: list[str] = []
     devcontainer_json_file_path: str | None = None
@@ -109,6 +151,52 @@ def compute_adler32(repo_path: Path, files: list[str], extra_paths: list[Path] |
     return checksum
 
 
+def git_blob_id(content: bytes, *, object_id_length: int) -> bytes:
+    """Return the object ID git gives a blob with this content, using the hash the repository's object IDs use."""
+    hash_name = "sha256" if object_id_length == SHA256_OBJECT_ID_LENGTH else "sha1"
+    return hashlib.new(hash_name, b"blob %d\0" % len(content) + content).digest()
+
+
+def compute_git_blob_checksum(
+    repo_path: Path, files: list[str], index_entries: dict[str, GitIndexEntry], extra_paths: list[Path] | None = None
+) -> int:
+    """Compute an overall Adler-32 checksum of the provided files, identifying each file's content by its git blob ID.
+
+    Git's blob IDs are already hashes of the content, so only the files whose content can't be taken from the index
+    are read: those modified in the worktree, symlinks (whose target is hashed, as in compute_adler32) and uv.lock
+    (whose root package version line is left out). Those are CRLF-normalized like compute_adler32 does, so a checkout
+    that only differs in line endings (e.g. on Windows, whether or not git converts them) hashes the same. Files
+    committed with CRLF line endings are identified by that committed content.
+    """
+    modified_files = get_worktree_modified_files(repo_path)
+    checksum = 1  # Adler-32 default starting value
+
+    for file in sorted(files):
+        entry = index_entries[file]
+        checksum = zlib.adler32(file.encode("utf-8"), checksum)
+        if entry.mode == GIT_SUBMODULE_MODE:
+            continue  # the checkout is a directory, which compute_adler32 skips too
+        file_path = repo_path / file
+        if file_path.name == "uv.lock":
+            content_id = git_blob_id(get_uv_lock_bytes_for_hashing(file_path), object_id_length=len(entry.object_id))
+        elif file in modified_files or entry.mode == GIT_SYMLINK_MODE:
+            try:
+                content = file_path.read_bytes().replace(b"\r\n", b"\n")
+            except IsADirectoryError:
+                # Ignore symlinks that on windows sometimes get confused as being directories
+                continue
+            content_id = git_blob_id(content, object_id_length=len(entry.object_id))
+        else:
+            content_id = bytes.fromhex(entry.object_id)
+        checksum = zlib.adler32(content_id, checksum)
+
+    for extra_path in sorted(extra_paths or []):
+        checksum = zlib.adler32(str(extra_path).encode("utf-8"), checksum)
+        checksum = zlib.adler32(extra_path.read_bytes().replace(b"\r\n", b"\n"), checksum)
+
+    return checksum
+
+
 def find_devcontainer_hash_line(lines: list[str]) -> tuple[int, str | None]:
     """Find the line index and current hash in the devcontainer.json file."""
     for i in reversed(range(len(lines))):
@@ -180,6 +268,14 @@ def main():
         help="Update the hash in the devcontainer.json file based on all files relevant to devcontainer context",
     )
     _ = parser.add_argument("--exit-zero", action="store_true", help="Exit with code 0 even if the hash changes")
+    _ = parser.add_argument(
+        "--git-blob-ids",
+        action="store_true",
+        help=(
+            "Identify file contents by the blob IDs in git's index, only reading the files that can't be taken from it "
+            "(e.g. ones modified in the worktree). Gives a different hash than the default mode"
+        ),
+    )
     args = parser.parse_args()
 
     repo_path = args.folder
@@ -188,7 +284,12 @@ def main():
         sys.exit(1)
 
     # Retrieve the list of Git-tracked files.
-    files = get_tracked_files(repo_path)
+    index_entries: dict[str, GitIndexEntry] = {}
+    if args.git_blob_ids:
+        index_entries = get_git_index_entries(repo_path)
+        files = list(index_entries)
+    else:
+        files = get_tracked_files(repo_path)
     devcontainer_json_file: Path | None = None
     if args.for_devcontainer_config_update:
         files, devcontainer_json_file = filter_files_for_devcontainer_context(files)
@@ -200,7 +301,11 @@ def main():
             print(file)  # noqa: T201 # this just runs as a simple script, so using print instead of log
 
     # Compute the overall Adler-32 checksum.
-    overall_checksum = compute_adler32(repo_path, files, args.extra_paths)
+    overall_checksum = (
+        compute_git_blob_checksum(repo_path, files, index_entries, args.extra_paths)
+        if args.git_blob_ids
+        else compute_adler32(repo_path, files, args.extra_paths)
+    )
     overall_checksum_str = f"{overall_checksum:08x}"  # Format the checksum as an 8-digit hexadecimal value.
     if args.for_devcontainer_config_update:
         assert devcontainer_json_file is not None, (
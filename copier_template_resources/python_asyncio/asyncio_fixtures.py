@@ -16,6 +16,10 @@ async def _wait_for_tasks(tasks_list: list[asyncio.Task[None]]):
     _, pending = await asyncio.wait(tasks_list, timeout=5.0)
     if len(pending) > 0:
         raise RuntimeError(f"There are still pending tasks: {pending}")
+    # a finishing task can register another (e.g. a bounded task pool starting the next queued one), so wait for those too
+    started_meanwhile = [task for task in background_tasks_set if task not in tasks_list]
+    if len(started_meanwhile) > 0:
+        await _wait_for_tasks(started_meanwhile)
 
 
 @pytest.fixture(autouse=True)
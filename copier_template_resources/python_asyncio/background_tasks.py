@@ -6,9 +6,11 @@
 # but if the change should be shared with other projects, please backport it to the template repo.
 # =====================================================================================================
 import asyncio
+import inspect
 import logging
 import traceback
 from collections import deque
+from types import CodeType
 from weakref import WeakSet
 
 logger = logging.getLogger(__name__)
@@ -16,8 +18,63 @@ background_tasks_set: WeakSet[asyncio.Task[None]] = WeakSet()
 background_task_exceptions: deque[Exception] = deque(
     maxlen=100  # don't grow infinitely in production
 )
-# Store creation tracebacks for debugging
-_task_creation_tracebacks: dict[int, str] = {}
+type CreationStack = tuple[tuple[CodeType, int], ...]
+# Store where each task was created for debugging, as (code, line number) pairs that are only formatted (and have their
+# source lines read) if the task's exception gets logged, since backends can spawn thousands of short tasks a minute
+_task_creation_tracebacks: dict[int, CreationStack] = {}
+# bounded in case a done callback never fires (e.g. the loop closed first), so the oldest entries are dropped
+MAX_TRACKED_CREATION_STACKS = 10_000
+MAX_CREATION_STACK_DEPTH = 50
+_creation_stack_sample_rate = 1.0
+# sampled by spreading the rate evenly over the registered tasks (e.g. every 100th at 0.01), rather than at random
+_creation_stack_sample_credit = 0.0
+
+
+class SampleRateOutOfRangeError(ValueError):
+    def __init__(self, rate: float):
+        super().__init__(f"The sample rate must be between 0 and 1, got {rate}")
+
+
+def set_creation_stack_sample_rate(rate: float) -> None:
+    """Record the creation stack of only this fraction of tasks (e.g. 0.01 in a backend that spawns many short tasks)."""
+    global _creation_stack_sample_rate, _creation_stack_sample_credit  # noqa: PLW0603 # a process-wide setting, like the logging config
+    if not 0.0 <= rate <= 1.0:
+        raise SampleRateOutOfRangeError(rate)
+    _creation_stack_sample_rate = rate
+    _creation_stack_sample_credit = 0.0
+
+
+def _is_sampled() -> bool:
+    global _creation_stack_sample_credit  # noqa: PLW0603 # goes with the process-wide sample rate
+    _creation_stack_sample_credit += _creation_stack_sample_rate
+    if _creation_stack_sample_credit < 1.0:
+        return False
+    _creation_stack_sample_credit -= 1.0
+    return True
+
+
+def _capture_creation_stack() -> CreationStack:
+    frames: list[tuple[CodeType, int]] = []
+    frame = inspect.currentframe()
+    if frame is not None:
+        frame = frame.f_back  # excluding this function
+    if frame is not None:
+        frame = frame.f_back  # and register_task
+    while frame is not None and len(frames) < MAX_CREATION_STACK_DEPTH:
+        frames.append((frame.f_code, frame.f_lineno))
+        frame = frame.f_back
+    return tuple(reversed(frames))  # outermost first, like a traceback
+
+
+def format_creation_stack(creation_stack: CreationStack) -> str:
+    return "".join(
+        traceback.StackSummary.from_list(
+            [
+                traceback.FrameSummary(code.co_filename, line_number, code.co_name)
+                for code, line_number in creation_stack
+            ]
+        ).format()
+    )
 
 
 def _task_done_callback(  # pragma: no cover # when we move this into a library, we'll remove this. It's already tested in some repos, but it's complicated to hit the coverage requirements when instantiating a new template that uses this
@@ -33,7 +90,10 @@ def _task_done_callback(  # pragma: no cover # when we move this into a library,
         _ = _task_creation_tracebacks.pop(task_id, None)
         return
     except Exception as e:  # pragma: no cover # hard to unit test this, but it'd be good to think of a way to do so
-        creation_tb = _task_creation_tracebacks.pop(task_id, "No traceback available")
+        creation_stack = _task_creation_tracebacks.pop(task_id, None)
+        creation_tb = (
+            "No traceback available (not sampled)" if creation_stack is None else format_creation_stack(creation_stack)
+        )
         logger.exception(f"Unhandled exception in background task\nTask was created from:\n{creation_tb}")
         background_task_exceptions.append(e)
     else:
@@ -44,9 +104,14 @@ def _task_done_callback(  # pragma: no cover # when we move this into a library,
 def register_task(  # pragma: no cover # when we move this into a library, we'll remove this. It's already tested in some repos, but it's complicated to hit the coverage requirements when instantiating a new template that uses this
     task: asyncio.Task[None],
 ) -> None:
-    # Capture the stack trace at task creation time (excluding this function)
-    creation_stack = "".join(traceback.format_stack()[:-1])
-    _task_creation_tracebacks[id(task)] = creation_stack
+    # an entry left behind by an earlier task with the same id would otherwise be logged as this one's (or, if this one
+    # is sampled, keep that task's place in the eviction order)
+    _ = _task_creation_tracebacks.pop(id(task), None)
+    if _is_sampled():
+        if len(_task_creation_tracebacks) >= MAX_TRACKED_CREATION_STACKS:
+            # dicts keep insertion order, so this is the oldest
+            _ = _task_creation_tracebacks.pop(next(iter(_task_creation_tracebacks)))
+        _task_creation_tracebacks[id(task)] = _capture_creation_stack()
 
     background_tasks_set.add(task)
     task.add_done_callback(_task_done_callback)
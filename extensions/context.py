@@ -84,6 +84,7 @@ class ContextUpdater(ContextHook):
         context["zod_version"] = "^4.3.6"
         context["zod_from_json_schema_version"] = "^0.5.1"
         context["nuxt_apollo_version"] = "5.0.0-alpha.15"
+        context["apollo_client_version"] = "^3.13.9"
         context["graphql_codegen_cli_version"] = "^7.1.2"
         context["graphql_tools_mock_version"] = "^9.1.0"
         context["tailwindcss_version"] = "^4.2.0"
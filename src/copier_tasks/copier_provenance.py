@@ -9,6 +9,8 @@ import argparse
 import json
 import os
 import re
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
@@ -133,73 +135,106 @@ def _build_specific_header(comment_type: CommentType, template_src: str = "") ->
     return None
 
 
+_HEADER_PATTERNS: dict[CommentType, re.Pattern[str]] = {
+    "hash": re.compile(r"# ={14} WARNING[^\n]*\n(?:.*\n)*?# ={50,}\n"),
+    "batch": re.compile(r"REM ={14} WARNING[^\n]*\n(?:.*\n)*?REM ={50,}\n"),
+    "block": re.compile(r"/\*\n \* ={14} WARNING[^\n]*\n(?: \*.*\n)*? \*/\n"),
+    "jinja": re.compile(r"\{#\n ={14} WARNING[^\n]*\n(?:.*\n)*?#\}\n"),
+    "markdown": re.compile(r"<!--\n={14} WARNING[^\n]*\n(?:.*\n)*?-->\n"),
+}
+# A bottom header is preferably stripped together with the newline that separated it from the content.
+_BOTTOM_HEADER_PATTERNS: dict[CommentType, re.Pattern[str]] = {
+    comment_type: re.compile(r"\n" + pattern.pattern) for comment_type, pattern in _HEADER_PATTERNS.items()
+}
+# Headers are only ever written at the very top or bottom of a file, so only this many characters at each end
+# are searched for one. That keeps the check cheap for large files, and a header-like block in the middle of a
+# file (e.g. documentation quoting it) is left alone.
+_HEADER_SCAN_CHARS = 8 * 1024
+
+
+def _search_head_and_tail(pattern: re.Pattern[str], content: str) -> re.Match[str] | None:
+    if len(content) <= 2 * _HEADER_SCAN_CHARS:
+        return pattern.search(content)
+    match = pattern.search(content, 0, _HEADER_SCAN_CHARS)
+    if match is None:
+        match = pattern.search(content, len(content) - _HEADER_SCAN_CHARS)
+    return match
+
+
 def _strip_existing_header(content: str, comment_format: CommentFormat) -> str:
     """Strip any existing copier header block regardless of template URL inside."""
-    t = comment_format.comment_type
-    loc = comment_format.location
-    if t == "hash":
-        pattern = r"# ={14} WARNING[^\n]*\n(?:.*\n)*?# ={50,}\n"
-    elif t == "batch":
-        pattern = r"REM ={14} WARNING[^\n]*\n(?:.*\n)*?REM ={50,}\n"
-    elif t == "block":
-        pattern = r"/\*\n \* ={14} WARNING[^\n]*\n(?: \*.*\n)*? \*/\n"
-    elif t == "jinja":
-        pattern = r"\{#\n ={14} WARNING[^\n]*\n(?:.*\n)*?#\}\n"
-    elif t == "markdown":
-        pattern = r"<!--\n={14} WARNING[^\n]*\n(?:.*\n)*?-->\n"
-    else:
+    pattern = _HEADER_PATTERNS.get(comment_format.comment_type)
+    if pattern is None:
         return content
-    if loc == "bottom":
-        result = re.sub(r"\n" + pattern, "", content, count=1)
-        if result == content:
-            result = re.sub(pattern, "", content, count=1)
-        return result
-    return re.sub(pattern, "", content, count=1)
-
-
-def _write_file_marker(file: Path, comment_format: CommentFormat, specific_header: str) -> None:
-    with Path.open(file, "r+") as f:
-        content = f.read()
-        content = _strip_existing_header(content, comment_format)
-        _ = f.seek(0)
-        _ = f.truncate()
-        if comment_format.location == "top":
-            _ = f.write(specific_header + "\n")
-        _ = f.write(content)
-        if comment_format.location == "bottom":
-            _ = f.write("\n" + specific_header + "\n")
-
-
-def _resolve_file_src(
-    rel_str: str,
-    template_src: str,
-    ancestor_managed_by_src: dict[str, set[str]] | None,
-) -> str:
-    """Return the template src that originally contributed this file path."""
-    if ancestor_managed_by_src is not None:
-        for origin_src, origin_files in ancestor_managed_by_src.items():
-            if rel_str in origin_files:
-                return origin_src
-    return template_src
-
-
-def _get_comment_format_for_file(file: Path, default_format: CommentFormat) -> CommentFormat | None:
-    """Return the effective CommentFormat, or None if the file is binary (track but skip marking)."""
-    if default_format.location != "top" or default_format.comment_type == "none":
-        return default_format
+    candidate_patterns = [pattern]
+    if comment_format.location == "bottom":
+        candidate_patterns.insert(0, _BOTTOM_HEADER_PATTERNS[comment_format.comment_type])
+    for candidate_pattern in candidate_patterns:
+        match = _search_head_and_tail(candidate_pattern, content)
+        if match is not None:
+            return content[: match.start()] + content[match.end() :]
+    return content
+
+
+def _stamp_content(content: str, comment_format: CommentFormat, specific_header: str) -> str:
+    content = _strip_existing_header(content, comment_format)
+    if comment_format.location == "top":
+        return specific_header + "\n" + content
+    if comment_format.location == "bottom":
+        return content + "\n" + specific_header + "\n"
+    return content
+
+
+def _read_text_file(file: Path) -> tuple[bytes, str] | None:
+    """Return the raw bytes and the newline-normalized text of a file, or None if the file is binary."""
+    raw_content = file.read_bytes()
     try:
-        first_line = file.read_text(encoding="utf-8").split("\n", 1)[0]
+        content = raw_content.decode("utf-8")
     except UnicodeDecodeError:
         return None
-    if first_line.startswith("#!/"):
+    # same universal-newline translation as reading in text mode, so CRLF files are rewritten with LF endings
+    return raw_content, content.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _write_file_marker(file: Path, base_format: CommentFormat, template_src: str) -> bool:
+    """Stamp the header onto a file with a single read, only writing it back if that changed anything.
+
+    Returns whether the file was written. An already-stamped file is left untouched, so its mtime is preserved.
+    """
+    if base_format.comment_type == "none" or base_format.location == "none":
+        return False
+    read_result = _read_text_file(file)
+    if read_result is None:
+        return False  # binary files are tracked in the manifest but never marked
+    raw_content, content = read_result
+    comment_format = _get_comment_format_for_content(content, base_format)
+    specific_header = _build_specific_header(comment_format.comment_type, template_src)
+    if specific_header is None:
+        return False
+    stamped_content = _stamp_content(content, comment_format, specific_header).encode("utf-8")
+    if stamped_content == raw_content:
+        return False
+    _ = file.write_bytes(stamped_content)
+    return True
+
+
+def _get_comment_format_for_content(content: str, default_format: CommentFormat) -> CommentFormat:
+    """Return the effective CommentFormat: a shebang forces a top header to the bottom."""
+    if default_format.location == "top" and content.startswith("#!/"):
         return CommentFormat(default_format.comment_type, "bottom")
     return default_format
 
 
+# Tool output directories that no template ships, but that can hold most of the entries in a checkout
+# (e.g. when a template directory is stamped in place), so they're never descended into.
+_PRUNED_DIRECTORY_NAMES = frozenset({".git", ".venv", "node_modules", "dist", "mutants", "__pycache__"})
+
+
 def _collect_template_base_paths(src_template_directory: Path) -> set[Path]:
     """Walk src_template_directory (following symlinks) and return resolved base paths."""
     paths: set[Path] = set()
-    for root, _, files in os.walk(src_template_directory, followlinks=True):
+    for root, dirs, files in os.walk(src_template_directory, followlinks=True):
+        dirs[:] = [d for d in dirs if d not in _PRUNED_DIRECTORY_NAMES]
         for fname in files:
             f = Path(root) / fname
             parts = [get_base_filename(p) for p in f.relative_to(src_template_directory).parts]
@@ -212,41 +247,40 @@ def apply_file_markers(
     src_template_directory: Path,
     dst_directory: Path,
     template_src: str = "",
-    ancestor_managed_by_src: dict[str, set[str]] | None = None,
+    ancestor_src_by_path: dict[str, str] | None = None,
 ) -> dict[str, list[str]]:
     """Stamp managed files with provenance headers.
 
     Returns files bucketed by originating template src. Files listed in
-    ancestor_managed_by_src are attributed to their originating ancestor template;
+    ancestor_src_by_path are attributed to their originating ancestor template;
     remaining files are attributed to template_src.
     """
+    if ancestor_src_by_path is None:
+        ancestor_src_by_path = {}
     template_base_paths = _collect_template_base_paths(src_template_directory)
 
     managed: dict[str, list[str]] = {}
-
-    dst_files: list[Path] = []
-    for root, _, files in os.walk(dst_directory, followlinks=True):
-        dst_files.extend(Path(root) / fname for fname in files)
-
-    for file in sorted(dst_files):
-        rel = file.relative_to(dst_directory)
-        if rel not in template_base_paths:
-            continue
-
-        rel_str = str(rel)
-        file_src = _resolve_file_src(rel_str, template_src, ancestor_managed_by_src)
-        managed.setdefault(file_src, []).append(rel_str)
-
-        base_format = custom_filename_handling.get(
-            file.name, custom_file_handling.get(file.suffix, default_comment_format)
-        )
-        comment_formatting = _get_comment_format_for_file(file, base_format)
-        if comment_formatting is None:
-            continue
-
-        specific_header = _build_specific_header(comment_formatting.comment_type, file_src)
-        if specific_header is not None:
-            _write_file_marker(file, comment_formatting, specific_header)
+    stamp_futures: list[Future[bool]] = []
+    # Stamping is file I/O, which releases the GIL, so the files are read and written on a thread pool.
+    with ThreadPoolExecutor() as executor:
+        # Only the paths the template can produce are looked up in the destination, rather than walking all of
+        # it (node_modules, .venv, ...) just to discard nearly everything found there.
+        for rel in sorted(template_base_paths):
+            file = dst_directory / rel
+            if not file.is_file():
+                continue
+
+            rel_str = str(rel)
+            file_src = ancestor_src_by_path.get(rel_str, template_src)
+            managed.setdefault(file_src, []).append(rel_str)
+
+            base_format = custom_filename_handling.get(
+                file.name, custom_file_handling.get(file.suffix, default_comment_format)
+            )
+            stamp_futures.append(executor.submit(_write_file_marker, file, base_format, file_src))
+
+    for stamp_future in stamp_futures:
+        _ = stamp_future.result()  # re-raise any error from stamping a file
 
     for file_list in managed.values():
         file_list.sort()
@@ -267,71 +301,79 @@ def _read_parent_src(src_template_directory: Path) -> str | None:
     return m.group(1).strip()
 
 
-def update_manifest(
-    *,
-    dst_directory: Path,
-    template_src: str,
-    managed_files: list[str],
-    parent_src: str | None = None,
-) -> None:
-    manifest_path = dst_directory / _MANIFEST_RELPATH
-    manifest_path.parent.mkdir(parents=True, exist_ok=True)
-
-    existing: Manifest = {"templates": []}
-    if manifest_path.exists():
-        existing = json.loads(manifest_path.read_text(encoding="utf-8"))
+def _load_manifest(manifest_path: Path) -> Manifest:
+    if not manifest_path.exists():
+        return {"templates": []}
+    manifest: Manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    return manifest
 
-    templates: list[TemplateEntry] = []
-    for t in existing["templates"]:
-        if t["src"] == template_src:
-            continue
-        templates.append(t)
 
+def _build_template_entry(template_src: str, managed_files: list[str], parent_src: str | None) -> TemplateEntry:
     # Both branches spell the whole entry out so the JSON key order stays src, parent_src, managed_files.
     if parent_src is None:
-        entry: TemplateEntry = {"src": template_src, "managed_files": managed_files}
-    else:
-        entry = {"src": template_src, "parent_src": parent_src, "managed_files": managed_files}
-    templates.append(entry)
+        return {"src": template_src, "managed_files": managed_files}
+    return {"src": template_src, "parent_src": parent_src, "managed_files": managed_files}
+
 
-    _ = manifest_path.write_text(
+def update_manifest(*, dst_directory: Path, entries: list[TemplateEntry]) -> None:
+    """Replace the manifest entries for the given template srcs, reading and writing the manifest once.
+
+    Entries for other templates keep their place; the given entries are appended in order (a later entry for
+    the same src replaces an earlier one). The manifest is written to a temporary file and renamed over the
+    original, so an interrupted run never leaves a truncated manifest behind.
+    """
+    manifest_path = dst_directory / _MANIFEST_RELPATH
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+    updated_entries: dict[str, TemplateEntry] = {}
+    for entry in entries:
+        _ = updated_entries.pop(entry["src"], None)
+        updated_entries[entry["src"]] = entry
+    templates = [t for t in _load_manifest(manifest_path)["templates"] if t["src"] not in updated_entries]
+    templates.extend(updated_entries.values())
+
+    temporary_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+    _ = temporary_path.write_text(
         json.dumps({"templates": templates}, indent=2) + "\n",
         encoding="utf-8",
     )
+    _ = temporary_path.replace(manifest_path)
 
 
-def _read_ancestor_manifest(src_template_dir: Path) -> tuple[dict[str, set[str]], dict[str, str]]:
-    """Return each ancestor template's managed paths and its own parent, keyed by template src.
+def _read_ancestor_manifest(src_template_dir: Path) -> tuple[dict[str, str], dict[str, str]]:
+    """Return the ancestor template src of each managed path, and each ancestor template's own parent.
+
+    Paths map straight to their template src so attributing a file is a single lookup; when several ancestor
+    templates list the same path, the first one in the manifest wins.
 
     The ancestor manifest may contain paths with a "template/" prefix (from self-stamp tasks that run
     with src=dst=template/). Both the prefixed and stripped spellings are recorded so lookups match the
     destination repo's layout (where "template/" doesn't exist).
     """
-    ancestor_managed_by_src: dict[str, set[str]] = {}
+    ancestor_src_by_path: dict[str, str] = {}
     ancestor_parent_by_src: dict[str, str] = {}
     ancestor_manifest_path = _find_manifest(src_template_dir.parent)
     if not ancestor_manifest_path.exists():
-        return ancestor_managed_by_src, ancestor_parent_by_src
+        return ancestor_src_by_path, ancestor_parent_by_src
 
-    data: Manifest = json.loads(ancestor_manifest_path.read_text(encoding="utf-8"))
+    data = _load_manifest(ancestor_manifest_path)
     subdir_prefix = src_template_dir.name + "/"
     for t in data["templates"]:
-        path_set: set[str] = set()
+        src = t["src"]
         for f in t["managed_files"]:
-            path_set.add(f)
+            _ = ancestor_src_by_path.setdefault(f, src)
             stripped = f.removeprefix(subdir_prefix)
-            path_set.add(stripped)
+            _ = ancestor_src_by_path.setdefault(stripped, src)
             # Apply get_base_filename to each part so .jinja/.jinja-base suffixes
             # and Jinja conditional names resolve to the final destination filename.
             parts = Path(stripped).parts
             if len(parts) > 0:
                 resolved = str(Path(*[get_base_filename(p) for p in parts]))
-                path_set.add(resolved)
-        ancestor_managed_by_src[t["src"]] = path_set
+                _ = ancestor_src_by_path.setdefault(resolved, src)
         ancestor_parent = t.get("parent_src")
         if ancestor_parent is not None:
-            ancestor_parent_by_src[t["src"]] = ancestor_parent
-    return ancestor_managed_by_src, ancestor_parent_by_src
+            ancestor_parent_by_src[src] = ancestor_parent
+    return ancestor_src_by_path, ancestor_parent_by_src
 
 
 def main() -> None:
@@ -355,22 +397,19 @@ def main() -> None:
     else:
         manifest_src = template_src
 
-    ancestor_managed_by_src, ancestor_parent_by_src = _read_ancestor_manifest(src_template_dir)
-
-    ancestor_argument: dict[str, set[str]] | None = None
-    if len(ancestor_managed_by_src) > 0:
-        ancestor_argument = ancestor_managed_by_src
+    ancestor_src_by_path, ancestor_parent_by_src = _read_ancestor_manifest(src_template_dir)
 
     managed_by_src = apply_file_markers(
         src_template_directory=src_template_dir,
         dst_directory=dst_dir,
         template_src=header_src,
-        ancestor_managed_by_src=ancestor_argument,
+        ancestor_src_by_path=ancestor_src_by_path,
     )
     # Always write an entry for the current template even when no files matched.
     _ = managed_by_src.setdefault(header_src, [])
 
     parent_src = _read_parent_src(src_template_dir)
+    entries: list[TemplateEntry] = []
     for src, files in managed_by_src.items():
         if src == header_src:
             effective_src = manifest_src
@@ -382,12 +421,8 @@ def main() -> None:
             effective_parent = parent_src
         else:
             effective_parent = ancestor_parent_by_src.get(src)
-        update_manifest(
-            dst_directory=dst_dir,
-            template_src=effective_src,
-            managed_files=files,
-            parent_src=effective_parent,
-        )
+        entries.append(_build_template_entry(effective_src, files, effective_parent))
+    update_manifest(dst_directory=dst_dir, entries=entries)
 
 
 if __name__ == "__main__":
@@ -6,20 +6,30 @@
 # but if the change should be shared with other projects, please backport it to the template repo.
 # =====================================================================================================
 import argparse
+import contextlib
+import hashlib
 import json
 import os
 import platform
 import shutil
+import signal
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
 from pathlib import Path
 from typing import Any
+from typing import override
 
 REPO_ROOT_DIR = Path(__file__).parent.parent.resolve()
 ENVS_CONFIG = REPO_ROOT_DIR / ".devcontainer" / "envs.json"
 PULUMI_CLI_INSTALL_SCRIPT = REPO_ROOT_DIR / ".devcontainer" / "install-pulumi-cli.sh"
 UV_PYTHON_ALREADY_CONFIGURED = "UV_PYTHON" in os.environ
+IS_WINDOWS = platform.system() == "Windows"
+# kept inside the installed environment (.venv / node_modules), so deleting that also forces a reinstall
+INSTALL_STAMP_FILE_NAME = ".manual-setup-deps-stamp"
 parser = argparse.ArgumentParser(description="Manual setup for dependencies in the repo")
 _ = parser.add_argument(
     "--python-version",
@@ -58,6 +68,18 @@ _ = parser.add_argument(
     default=False,
     help="Do not install the Pulumi CLI even if the lock file references it",
 )
+_ = parser.add_argument(
+    "--force",
+    action="store_true",
+    default=False,
+    help="Install every environment even if nothing has changed since it was last installed",
+)
+_ = parser.add_argument(
+    "--parallel",
+    action="store_true",
+    default=False,
+    help="Install the environments concurrently, prefixing each line of output with the environment it came from",
+)
 
 
 class PackageManager(StrEnum):
@@ -72,17 +94,281 @@ class EnvConfig:
         self.path = REPO_ROOT_DIR
         if "relative_directory" in json_dict:
             self.path = REPO_ROOT_DIR / json_dict["relative_directory"]
+        self.description = json_dict.get("description", str(self.path))
         if self.package_manager == PackageManager.UV:
             self.lock_file = self.path / "uv.lock"
+            self.manifest_file = self.path / "pyproject.toml"
+            self.install_dir = self.path / os.environ.get("UV_PROJECT_ENVIRONMENT", ".venv")
         elif self.package_manager == PackageManager.PNPM:
             self.lock_file = self.path / "pnpm-lock.yaml"
+            self.manifest_file = self.path / "package.json"
+            self.install_dir = self.path / "node_modules"
         else:
             raise NotImplementedError(f"Package manager {self.package_manager} is not supported")
 
 
-def main():  # noqa: C901,PLR0912,PLR0915 # TODO: cleanup into some subfunctions
+class EnvInstall:
+    """What to run for one environment, settled before any installs start so --parallel can't change the outcome."""
+
+    def __init__(self, env: EnvConfig, *, uv_env: dict[str, str], check_lock_file: bool):
+        super().__init__()
+        self.env = env
+        self.uv_env = uv_env
+        self.check_lock_file = check_lock_file
+
+
+class CommandRunner:
+    """Runs an environment's commands with their output going straight to the console."""
+
+    def run(self, command: list[str], *, env: dict[str, str] | None = None) -> None:
+        _ = subprocess.run(  # noqa: S603 # this is all our own input
+            command, check=True, env=env
+        )
+
+    def print(self, message: str) -> None:
+        print(  # noqa: T201 # we want this to print to console for easy viewing
+            message
+        )
+
+
+class EnvironmentCancelledError(Exception):
+    pass
+
+
+class ParallelRun:
+    """Shared state for --parallel: serializes console output and cancels every environment once one fails."""
+
+    def __init__(self):
+        super().__init__()
+        self.cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._processes: set[subprocess.Popen[str]] = set()
+
+    def print(self, message: str) -> None:
+        with self._lock:
+            print(  # noqa: T201 # we want this to print to console for easy viewing
+                message, flush=True
+            )
+
+    def start(self, command: list[str], env: dict[str, str] | None) -> subprocess.Popen[str]:
+        with self._lock:
+            if self.cancelled.is_set():
+                raise EnvironmentCancelledError
+            # each command gets its own process group, so cancelling also stops whatever it spawned (e.g. pnpm's
+            # lifecycle scripts), which would otherwise hold the output pipe open until they finished
+            process = subprocess.Popen(  # noqa: S603 # this is all our own input
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                env=env,
+                start_new_session=not IS_WINDOWS,
+            )
+            self._processes.add(process)
+        return process
+
+    def finish(self, process: subprocess.Popen[str]) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled.set()
+            for process in self._processes:
+                if IS_WINDOWS:
+                    process.terminate()
+                else:
+                    with contextlib.suppress(ProcessLookupError):  # it already exited
+                        os.killpg(process.pid, signal.SIGTERM)
+
+
+class PrefixedCommandRunner(CommandRunner):
+    """Runs an environment's commands for --parallel, prefixing each output line with the environment."""
+
+    def __init__(self, description: str, parallel_run: ParallelRun):
+        super().__init__()
+        self.prefix = f"[{description}]"
+        self.parallel_run = parallel_run
+
+    @override
+    def run(self, command: list[str], *, env: dict[str, str] | None = None) -> None:
+        process = self.parallel_run.start(command, env)
+        try:
+            assert process.stdout is not None
+            for line in process.stdout:
+                self.print(line.rstrip("\n"))
+            returncode = process.wait()
+        finally:
+            self.parallel_run.finish(process)
+        if self.parallel_run.cancelled.is_set():
+            raise EnvironmentCancelledError
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, command)
+
+    @override
+    def print(self, message: str) -> None:
+        self.parallel_run.print(f"{self.prefix} {message}")
+
+
+def install_uv_env(env_install: EnvInstall, *, runner: CommandRunner, args: argparse.Namespace) -> None:
+    env = env_install.env
+    generate_lock_file_only = args.only_create_lock
+    if env_install.check_lock_file or generate_lock_file_only:
+        uv_args = [
+            "uv",
+            "lock",
+        ]
+        if not generate_lock_file_only:
+            uv_args.append("--check")
+        uv_args.extend(["--directory", str(env.path)])
+        runner.run(uv_args, env=env_install.uv_env)
+    sync_command = ["uv", "sync", "--directory", str(env.path)]
+    if env_install.check_lock_file:
+        sync_command.append("--frozen")
+    if not generate_lock_file_only:
+        runner.run(sync_command, env=env_install.uv_env)
+    if (
+        not generate_lock_file_only
+        and not args.skip_installing_pulumi_cli
+        and platform.system() == "Linux"
+        and env.lock_file.exists()
+        and '"pulumi"' in env.lock_file.read_text()
+    ):
+        if not PULUMI_CLI_INSTALL_SCRIPT.exists():
+            runner.print(
+                f"Pulumi CLI install script not found at {PULUMI_CLI_INSTALL_SCRIPT}, skipping Pulumi CLI installation"
+            )
+        else:
+            runner.run(["sh", str(PULUMI_CLI_INSTALL_SCRIPT), str(env.lock_file)])  # sh should always be on PATH
+
+
+def install_pnpm_env(env_install: EnvInstall, *, runner: CommandRunner) -> None:
+    # pnpm has no way to only check the lock file https://github.com/orgs/pnpm/discussions/3202
+    pnpm_command = ["pnpm", "install", "--dir", str(env_install.env.path)]
+    if env_install.check_lock_file:
+        pnpm_command[1] = "ci"
+    if IS_WINDOWS:
+        pwsh = shutil.which("pwsh") or shutil.which("powershell")
+        if not pwsh:
+            raise FileNotFoundError("Neither 'pwsh' nor 'powershell' found on PATH")
+        pnpm_command = [
+            pwsh,
+            "-NoProfile",
+            "-NonInteractive",
+            "-Command",
+            " ".join(pnpm_command),
+        ]
+    runner.run(pnpm_command)
+
+
+def get_package_manager_version(package_manager: PackageManager) -> str | None:
+    executable = shutil.which(package_manager)
+    if executable is None:
+        return None
+    result = subprocess.run(  # noqa: S603 # this is all our own input
+        [executable, "--version"], capture_output=True, text=True, check=False
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def _hash_file(path: Path) -> str | None:
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def compute_install_fingerprint(
+    env_install: EnvInstall, *, package_manager_version: str, args: argparse.Namespace
+) -> str:
+    """Return a fingerprint of everything that decides what installing the environment produces."""
+    env = env_install.env
+    inputs = {
+        "package_manager_version": package_manager_version,
+        "lock_file": _hash_file(env.lock_file),
+        "manifest_file": _hash_file(env.manifest_file),
+        # the resolved value covers the environment's own .python-version, the repo root's, and --python-version
+        "uv_python": env_install.uv_env.get("UV_PYTHON"),
+        "uv_python_preference": env_install.uv_env.get("UV_PYTHON_PREFERENCE"),
+        "check_lock_file": env_install.check_lock_file,
+        "skip_installing_pulumi_cli": args.skip_installing_pulumi_cli,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def install_env(env_install: EnvInstall, *, runner: CommandRunner, args: argparse.Namespace) -> None:
+    env = env_install.env
+    stamp_file = env.install_dir / INSTALL_STAMP_FILE_NAME
+    # only a real install is stamped; without a package manager version there's nothing safe to compare against
+    package_manager_version = None if args.only_create_lock else get_package_manager_version(env.package_manager)
+    if package_manager_version is not None:
+        fingerprint = compute_install_fingerprint(
+            env_install, package_manager_version=package_manager_version, args=args
+        )
+        if not args.force and stamp_file.exists() and stamp_file.read_text() == fingerprint:
+            runner.print(
+                f"Skipping environment {env.path} as nothing has changed since it was last installed (use --force to reinstall)"
+            )
+            return
+        stamp_file.unlink(missing_ok=True)  # so an install that fails part way isn't skipped next time
+
+    if env.package_manager == PackageManager.UV:
+        install_uv_env(env_install, runner=runner, args=args)
+    elif env.package_manager == PackageManager.PNPM:
+        install_pnpm_env(env_install, runner=runner)
+    else:
+        raise NotImplementedError(f"Package manager {env.package_manager} is not supported for installation")
+
+    if package_manager_version is not None and env.install_dir.is_dir():
+        # fingerprinted again, since installing without --frozen can update the lock file
+        _ = stamp_file.write_text(
+            compute_install_fingerprint(env_install, package_manager_version=package_manager_version, args=args)
+        )
+
+
+def install_envs_in_parallel(env_installs: list[EnvInstall], *, args: argparse.Namespace) -> None:
+    """Install every environment at once; the first failure cancels the rest, and the script exits once all stop."""
+    parallel_run = ParallelRun()
+    outcomes: dict[str, str] = {}
+
+    def install(env_install: EnvInstall) -> None:
+        description = env_install.env.description
+        runner = PrefixedCommandRunner(description, parallel_run)
+        start = time.perf_counter()
+        try:
+            install_env(env_install, runner=runner, args=args)
+        except EnvironmentCancelledError:
+            outcome = "cancelled"
+        except Exception as e:  # noqa: BLE001 # any failure has to cancel the other environments rather than be lost in a thread
+            parallel_run.cancel()
+            runner.print(f"Failed: {e}")
+            outcome = "failed"
+        else:
+            outcome = "succeeded"
+        outcomes[description] = f"{outcome} after {time.perf_counter() - start:.1f}s"
+        runner.print(outcomes[description])
+
+    executor = ThreadPoolExecutor(max_workers=max(len(env_installs), 1))
+    for env_install in env_installs:
+        _ = executor.submit(install, env_install)
+    try:
+        executor.shutdown(wait=True)
+    except KeyboardInterrupt:
+        # the commands run in their own process groups, so Ctrl+C only reached this process
+        parallel_run.cancel()
+        raise
+
+    if parallel_run.cancelled.is_set():
+        print(  # noqa: T201 # we want this to print to console for easy viewing
+            "Not all environments were installed: "
+            + ", ".join(f"{description} {outcome}" for description, outcome in outcomes.items())
+        )
+        sys.exit(1)
+
+
+def main():  # noqa: C901,PLR0912 # TODO: cleanup into some subfunctions
     args = parser.parse_args(sys.argv[1:])
-    is_windows = platform.system() == "Windows"
     uv_env = dict(os.environ)
     if not args.allow_uv_to_install_python:
         uv_env.update({"UV_PYTHON_PREFERENCE": "only-system"})
@@ -97,6 +383,8 @@ def main():  # noqa: C901,PLR0912,PLR0915 # TODO: cleanup into some subfunctions
     with ENVS_CONFIG.open("r") as f:
         envs = json.load(f)
 
+    # an environment without its own .python-version inherits the UV_PYTHON of the one before it, so this stays in order
+    env_installs: list[EnvInstall] = []
     for env_dict in envs:
         env = EnvConfig(env_dict)
         if args.no_python and env.package_manager == PackageManager.UV:
@@ -123,73 +411,24 @@ def main():  # noqa: C901,PLR0912,PLR0915 # TODO: cleanup into some subfunctions
         env_check_lock = check_lock_file
         if args.optionally_check_lock and env.lock_file.exists():
             env_check_lock = True
-        if env_check_lock or generate_lock_file_only:
-            if env.package_manager == PackageManager.UV:
-                uv_args = [
-                    "uv",
-                    "lock",
-                ]
-                if not generate_lock_file_only:
-                    uv_args.append("--check")
-                uv_args.extend(["--directory", str(env.path)])
-                _ = subprocess.run(  # noqa: S603 # this is all our own input
-                    uv_args, check=True, env=uv_env
-                )
-            elif env.package_manager == PackageManager.PNPM:
-                pass  # doesn't seem to be a way to do this https://github.com/orgs/pnpm/discussions/3202
-            else:
-                raise NotImplementedError(f"Package manager {env.package_manager} does not support lock file checking")
-        if env.package_manager == PackageManager.UV:
-            sync_command = ["uv", "sync", "--directory", str(env.path)]
-            if env_check_lock:
-                sync_command.append("--frozen")
-            if not generate_lock_file_only:
-                _ = subprocess.run(  # noqa: S603 # this is all our own input
-                    sync_command,
-                    check=True,
-                    env=uv_env,
-                )
-            if (
-                not generate_lock_file_only
-                and not args.skip_installing_pulumi_cli
-                and platform.system() == "Linux"
-                and env.lock_file.exists()
-                and '"pulumi"' in env.lock_file.read_text()
-            ):
-                if not PULUMI_CLI_INSTALL_SCRIPT.exists():
-                    print(  # noqa: T201 # we want this to print to console for easy viewing
-                        f"Pulumi CLI install script not found at {PULUMI_CLI_INSTALL_SCRIPT}, skipping Pulumi CLI installation"
-                    )
-                else:
-                    _ = subprocess.run(  # noqa: S603 # this is all our own input
-                        ["sh", str(PULUMI_CLI_INSTALL_SCRIPT), str(env.lock_file)],  # noqa: S607 # sh should always be on PATH
-                        check=True,
-                    )
-        elif env.package_manager == PackageManager.PNPM:
-            pnpm_command = ["pnpm", "install", "--dir", str(env.path)]
-            if env_check_lock:
-                pnpm_command[1] = "ci"
-            if is_windows:
-                pwsh = shutil.which("pwsh") or shutil.which("powershell")
-                if not pwsh:
-                    raise FileNotFoundError("Neither 'pwsh' nor 'powershell' found on PATH")
-                pnpm_command = [
-                    pwsh,
-                    "-NoProfile",
-                    "-NonInteractive",
-                    "-Command",
-                    " ".join(pnpm_command),
-                ]
-            _ = subprocess.run(  # noqa: S603 # this is all our own input
-                pnpm_command,
-                check=True,
-            )
-        else:
-            raise NotImplementedError(f"Package manager {env.package_manager} is not supported for installation")
+        env_installs.append(EnvInstall(env, uv_env=dict(uv_env), check_lock_file=env_check_lock))
+
+    if args.parallel:
+        install_envs_in_parallel(env_installs, args=args)
+    else:
+        for env_install in env_installs:
+            install_env(env_install, runner=CommandRunner(), args=args)
     if args.skip_updating_devcontainer_hash:
         return
     result = subprocess.run(  # update the devcontainer hash after changing lock files
-        [sys.executable, ".github/workflows/hash_git_files.py", ".", "--for-devcontainer-config-update", "--exit-zero"],
+        [
+            sys.executable,
+            ".github/workflows/hash_git_files.py",
+            ".",
+            "--git-blob-ids",
+            "--for-devcontainer-config-update",
+            "--exit-zero",
+        ],
         capture_output=True,
         text=True,
         check=True,
@@ -27,6 +27,7 @@ DEFAULT_OPENAPI_SCHEMA = (
     / "test_openapi_schema.json"
 )
 DEFAULT_MODELS_DIR = Path(__file__).parent / "app" / "generated" / "open-api" / "backend" / "models"
+_BRACE_PATTERN = re.compile(r"[{}]")
 
 
 def load_openapi_schema(source: str) -> dict[str, Any]:
@@ -80,55 +81,25 @@ def get_required_non_nullable_fields(schema: dict[str, Any]) -> dict[str, set[st
     return result
 
 
-def extract_model_block(content: str, model_name: str) -> tuple[str | None, int, int]:
-    """Extract the specific model block from the file content.
+def index_model_blocks(content: str) -> dict[str, tuple[int, int]]:
+    """Locate the block of every exported interface or type in a single scan of the file content.
 
-    Returns: (block_content, start_pos, end_pos) or (None, -1, -1) if not found
+    Returns: model_name -> (start_pos, end_pos) of its first declaration, for every block whose braces close
     """
     # Look for "export interface ModelName" or "export type ModelName"
-    pattern = rf"export\s+(?:interface|type)\s+{re.escape(model_name)}\s.*\{{"
-    match = re.search(pattern, content)
-
-    if not match:
-        print(f"Could not find model {model_name} in content")  # noqa: T201 # this just runs as a simple script, so using print instead of log
-        return None, -1, -1
-
-    start_pos = match.start()
-
-    # Find the matching closing brace
-    brace_count = 0
-    in_block = False
-    end_pos = -1
-
-    for i in range(match.end() - 1, len(content)):
-        if content[i] == "{":
-            brace_count += 1
-            in_block = True
-        elif content[i] == "}":
-            brace_count -= 1
-            if in_block and brace_count == 0:
-                end_pos = i + 1
-                break
-
-    if end_pos == -1:
-        return None, -1, -1
-
-    return content[start_pos:end_pos], start_pos, end_pos
-
-
-def fix_typescript_file(file_path: Path, model_name: str, fields: set[str]) -> bool:
-    """Fix nullable issues in a TypeScript model file."""
-    content = file_path.read_text()
-
-    # Extract the specific model block
-    block_content, start_pos, end_pos = extract_model_block(content, model_name)
-
-    if block_content is None:
-        print(f"Could not find block content for {model_name} in {file_path}")  # noqa: T201 # this just runs as a simple script, so using print instead of log
-        return False
-
-    original_block = block_content
-
+    block_offsets: dict[str, tuple[int, int]] = {}
+    for match in re.finditer(r"export\s+(?:interface|type)\s+(\w+)\s.*\{", content):
+        if match[1] in block_offsets:
+            continue
+        # Find the matching closing brace
+        end_pos = _find_closing_brace_end(content, match.end() - 1)
+        if end_pos is not None:
+            block_offsets[match[1]] = (match.start(), end_pos)
+    return block_offsets
+
+
+def fix_model_block(block_content: str, fields: set[str]) -> str:
+    """Fix nullable issues in the block of a TypeScript model."""
     for field in fields:
         # Convert snake_case to camelCase for field matching
         camel_field = re.sub(r"_([a-z])", lambda m: m.group(1).upper(), field)
@@ -144,16 +115,80 @@ def fix_typescript_file(file_path: Path, model_name: str, fields: set[str]) -> b
         replacement_optional = rf"{camel_field}: \1;"
         block_content = re.sub(pattern_optional, replacement_optional, block_content)
 
-    if block_content != original_block:
-        # Replace the block in the original content
-        new_content = content[:start_pos] + block_content + content[end_pos:]
-        _ = file_path.write_text(new_content)
-        print(f"Fixed {model_name}: {', '.join(fields)}")  # noqa: T201 # this just runs as a simple script, so using print instead of log
-        return True
-    return False
+    return block_content
+
+
+def fix_required_fields(content: str, required_fields: dict[str, set[str]]) -> tuple[str, int]:
+    """Fix nullable issues in every model with required non-nullable fields.
+
+    The blocks are located once up front and don't overlap, so each is fixed in isolation and the file content is
+    rebuilt once from the fixed blocks and the untouched text between them.
+
+    Returns: (new_content, number of models fixed)
+    """
+    block_offsets = index_model_blocks(content)
+    fixed_blocks: list[tuple[int, int, str]] = []
+    for model_name, fields in required_fields.items():
+        if model_name not in block_offsets:
+            print(f"Could not find model {model_name} in content")  # noqa: T201 # this just runs as a simple script, so using print instead of log
+            continue
+        start_pos, end_pos = block_offsets[model_name]
+        block_content = fix_model_block(content[start_pos:end_pos], fields)
+        if block_content != content[start_pos:end_pos]:
+            fixed_blocks.append((start_pos, end_pos, block_content))
+            print(f"Fixed {model_name}: {', '.join(fields)}")  # noqa: T201 # this just runs as a simple script, so using print instead of log
+
+    spans: list[str] = []
+    copied_up_to = 0
+    for start_pos, end_pos, block_content in sorted(fixed_blocks):
+        spans.extend((content[copied_up_to:start_pos], block_content))
+        copied_up_to = end_pos
+    spans.append(content[copied_up_to:])
+    return "".join(spans), len(fixed_blocks)
+
+
+def _sub_member1_types(pattern: str, replacement: str, content: str, member1_types: set[str]) -> tuple[str, set[str]]:
+    """Apply a substitution to every match whose ``base`` group is one of the Member1 base types.
+
+    This is one pass over the file for all the base types, rather than a pass per type with the type spelled out in the
+    pattern. Matches for other words are left as they are.
+
+    Returns: (new_content, base types that were substituted)
+    """
+    substituted: set[str] = set()
+
+    def replace(match: re.Match[str]) -> str:
+        if match["base"] not in member1_types:
+            return match[0]
+        substituted.add(match["base"])
+        return match.expand(replacement)
 
+    return re.sub(pattern, replace, content), substituted
 
-def fix_anyof_nullable_types(file_path: Path) -> int:  # noqa: C901, PLR0912, PLR0915 # TODO: decide what to do about these fixer scripts long term
+
+def _find_closing_brace_end(content: str, open_brace_pos: int) -> int | None:
+    """Return the position just past the brace that closes the one at open_brace_pos, or None if it's never closed."""
+    brace_count = 1
+    for brace in _BRACE_PATTERN.finditer(content, open_brace_pos + 1):
+        brace_count += 1 if brace[0] == "{" else -1
+        if brace_count == 0:
+            return brace.end()
+    return None
+
+
+def fix_anyof_nullable_types(file_path: Path) -> int:
+    """Fix Kiota's bogus Member1 interfaces for anyOf nullable types in a file.
+
+    Returns: Number of fixes applied
+    """
+    original_content = file_path.read_text()
+    content, fixes_applied = fix_anyof_nullable_content(original_content)
+    if content != original_content:
+        _ = file_path.write_text(content)
+    return fixes_applied
+
+
+def fix_anyof_nullable_content(content: str) -> tuple[str, int]:  # noqa: PLR0915 # TODO: decide what to do about these fixer scripts long term
     """Fix Kiota's bogus Member1 interfaces for anyOf nullable types.
 
     Kiota generates empty Member1 interfaces for fields with anyOf: [type, null].
@@ -166,9 +201,8 @@ def fix_anyof_nullable_types(file_path: Path) -> int:  # noqa: C901, PLR0912, PL
     4. Cleans up resulting syntax errors
     5. Preserves legitimate entity functions
 
-    Returns: Number of fixes applied
+    Returns: (new_content, number of fixes applied)
     """
-    content = file_path.read_text()
     original_content = content
     fixes_applied = 0
 
@@ -183,68 +217,67 @@ def fix_anyof_nullable_types(file_path: Path) -> int:  # noqa: C901, PLR0912, PL
     fixes_applied += count
 
     # Step 2: Remove Member1 from type definitions
-    for base_type in member1_types:
-        member1_type = f"{base_type}Member1"
-
-        # Pattern: export type BaseType = Member1 | OtherType;
-        # Replace with: export type BaseType = OtherType | null;
-        type_pattern1 = rf"(export\s+type\s+{re.escape(base_type)}\s*=\s*){re.escape(member1_type)}\s*\|\s*([^;]+);"
-        if re.search(type_pattern1, content):
-            content = re.sub(type_pattern1, r"\1\2 | null;", content)
-            fixes_applied += 1
-
-        # Pattern: export type BaseType = OtherType | Member1;
-        type_pattern2 = rf"(export\s+type\s+{re.escape(base_type)}\s*=\s*)([^;|]+)\s*\|\s*{re.escape(member1_type)}\s*;"
-        if re.search(type_pattern2, content):
-            content = re.sub(type_pattern2, r"\1\2 | null;", content)
-            fixes_applied += 1
+    # Each pattern is a single pass covering every base type at once (the backreference ties the Member1 to the type
+    # being declared), counted once per base type it fixed
+    # Pattern: export type BaseType = Member1 | OtherType;
+    # Replace with: export type BaseType = OtherType | null;
+    type_pattern1 = r"(export\s+type\s+(?P<base>\w+)\s*=\s*)(?P=base)Member1\s*\|\s*([^;]+);"
+    content, fixed_bases = _sub_member1_types(type_pattern1, r"\1\3 | null;", content, member1_types)
+    fixes_applied += len(fixed_bases)
+
+    # Pattern: export type BaseType = OtherType | Member1;
+    type_pattern2 = r"(export\s+type\s+(?P<base>\w+)\s*=\s*)([^;|]+)\s*\|\s*(?P=base)Member1\s*;"
+    content, fixed_bases = _sub_member1_types(type_pattern2, r"\1\3 | null;", content, member1_types)
+    fixes_applied += len(fixed_bases)
 
     # Step 3: Fix deserialization patterns that call Member1 functions
     # Pattern: field = n.getObjectValue<Member1Type>(createXxxMember1...) ?? n.getPrimitiveValue()
     # Replace with: field = n.getPrimitiveValue()
+    # The leading \b only rules out starting a match mid-identifier (which could never be the leftmost match anyway), but it
+    # stops the regex engine re-scanning every identifier once per character
 
     # Handle string fields - two patterns for different orderings
     # Pattern 1: getObjectValue first
-    deser_string_pattern1 = r"(\w+\.\w+\s*=\s*)n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)\s*\?\?\s*(n\.getString(?:Value)?\(\)[^;]*)"
+    deser_string_pattern1 = r"\b(\w+\.\w+\s*=\s*)n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)\s*\?\?\s*(n\.getString(?:Value)?\(\)[^;]*)"
     content, count = re.subn(deser_string_pattern1, r"\1\3", content)
     fixes_applied += count
 
     # Pattern 2: getString first
-    deser_string_pattern2 = r"(\w+\.\w+\s*=\s*)(n\.getString(?:Value)?\(\)[^;]*?)\s*\?\?\s*n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)"
+    deser_string_pattern2 = r"\b(\w+\.\w+\s*=\s*)(n\.getString(?:Value)?\(\)[^;]*?)\s*\?\?\s*n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)"
     content, count = re.subn(deser_string_pattern2, r"\1\2", content)
     fixes_applied += count
 
     # Handle boolean fields - two patterns for different orderings
     # Pattern 1: getObjectValue first
-    deser_bool_pattern1 = r"(\w+\.\w+\s*=\s*)n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)\s*\?\?\s*n\.getBooleanValue\(\)"
+    deser_bool_pattern1 = r"\b(\w+\.\w+\s*=\s*)n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)\s*\?\?\s*n\.getBooleanValue\(\)"
     content, count = re.subn(deser_bool_pattern1, r"\1n.getBooleanValue()", content)
     fixes_applied += count
 
     # Pattern 2: getBooleanValue first
-    deser_bool_pattern2 = r"(\w+\.\w+\s*=\s*)n\.getBooleanValue\(\)\s*\?\?\s*n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)"
+    deser_bool_pattern2 = r"\b(\w+\.\w+\s*=\s*)n\.getBooleanValue\(\)\s*\?\?\s*n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)"
     content, count = re.subn(deser_bool_pattern2, r"\1n.getBooleanValue()", content)
     fixes_applied += count
 
     # Handle number fields - two patterns for different orderings
     # Pattern 1: getObjectValue first
-    deser_number_pattern1 = r"(\w+\.\w+\s*=\s*)n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)\s*\?\?\s*n\.getNumberValue\(\)"
+    deser_number_pattern1 = r"\b(\w+\.\w+\s*=\s*)n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)\s*\?\?\s*n\.getNumberValue\(\)"
     content, count = re.subn(deser_number_pattern1, r"\1n.getNumberValue()", content)
     fixes_applied += count
 
     # Pattern 2: getNumberValue first
-    deser_number_pattern2 = r"(\w+\.\w+\s*=\s*)n\.getNumberValue\(\)\s*\?\?\s*n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)"
+    deser_number_pattern2 = r"\b(\w+\.\w+\s*=\s*)n\.getNumberValue\(\)\s*\?\?\s*n\.getObjectValue<?(\w+Member1)?>?\(create\w+Member1FromDiscriminatorValue\)"
     content, count = re.subn(deser_number_pattern2, r"\1n.getNumberValue()", content)
     fixes_applied += count
 
     # Handle collection fields - two patterns depending on order
     # Pattern 1: getObjectValue first, then getCollectionOfPrimitiveValues
-    deser_collection_pattern = r"(\w+\.\w+\s*=\s*)n\.getObjectValue<\w+Member1>\(create\w+Member1FromDiscriminatorValue\)\s*\?\?\s*(n\.getCollectionOfPrimitiveValues<[^>]+>\([^)]*\)[^;]*)"
+    deser_collection_pattern = r"\b(\w+\.\w+\s*=\s*)n\.getObjectValue<\w+Member1>\(create\w+Member1FromDiscriminatorValue\)\s*\?\?\s*(n\.getCollectionOfPrimitiveValues<[^>]+>\([^)]*\)[^;]*)"
     content, count = re.subn(deser_collection_pattern, r"\1\2", content)
     fixes_applied += count
 
     # Pattern 2: getCollectionOfPrimitiveValues first, then getObjectValue (with Member1)
     # Handle both with and without type parameter: getObjectValue<Member1>(...) or getObjectValue(...)
-    deser_collection_pattern2 = r"(\w+\.\w+\s*=\s*)(n\.getCollectionOfPrimitiveValues<[^>]+>\([^)]*\))\s*\?\?\s*n\.getObjectValue(?:<\w+Member1>)?\(create\w+Member1FromDiscriminatorValue\)"
+    deser_collection_pattern2 = r"\b(\w+\.\w+\s*=\s*)(n\.getCollectionOfPrimitiveValues<[^>]+>\([^)]*\))\s*\?\?\s*n\.getObjectValue(?:<\w+Member1>)?\(create\w+Member1FromDiscriminatorValue\)"
     content, count = re.subn(deser_collection_pattern2, r"\1\2", content)
     fixes_applied += count
 
@@ -291,31 +324,26 @@ def fix_anyof_nullable_types(file_path: Path) -> int:  # noqa: C901, PLR0912, PL
 
     # Step 3.5: Remove remaining Member1 references from type parameters and casts
     # Pattern: <XxxMember1> in generic type parameters
-    for base_type in member1_types:
-        member1_type = f"{base_type}Member1"
-        # Remove from type parameters: <Member1Type>
-        content = re.sub(rf"<{re.escape(member1_type)}>", "", content)
-        # Remove from union in type parameters: <Foo | Member1Type> -> <Foo>
-        # Use [^<>]+ to match the other type, which preserves [] brackets
-        content = re.sub(rf"<([^<>]+)\|\s*{re.escape(member1_type)}>", r"<\1>", content)
-        content = re.sub(rf"<{re.escape(member1_type)}\s*\|([^<>]+)>", r"<\1>", content)
+    # Remove from type parameters: <Member1Type>
+    content, _ = _sub_member1_types(r"<(?P<base>\w+)Member1>", "", content, member1_types)
+    # Remove from union in type parameters: <Foo | Member1Type> -> <Foo>
+    # Use [^<>]+ to match the other type, which preserves [] brackets
+    content, _ = _sub_member1_types(r"<([^<>]+)\|\s*(?P<base>\w+)Member1>", r"<\1>", content, member1_types)
+    content, _ = _sub_member1_types(r"<(?P<base>\w+)Member1\s*\|([^<>]+)>", r"<\2>", content, member1_types)
 
     # Step 4: Remove Member1 from union types ONLY (not from function names!)
     # This handles property types, parameters, casts, etc.
     # But we must NOT remove Member1 from function names - those functions will be removed entirely in Step 5
 
-    for base_type in member1_types:
-        member1_type = f"{base_type}Member1"
+    # Remove "| Member1Type" with various spacing
+    content, _ = _sub_member1_types(r"\|\s*(?P<base>\w+)Member1\b", "", content, member1_types)
 
-        # Remove "| Member1Type" with various spacing
-        content = re.sub(rf"\|\s*{re.escape(member1_type)}\b", "", content)
+    # Remove "Member1Type |" with various spacing
+    content, _ = _sub_member1_types(r"\b(?P<base>\w+)Member1\s*\|", "", content, member1_types)
 
-        # Remove "Member1Type |" with various spacing
-        content = re.sub(rf"\b{re.escape(member1_type)}\s*\|", "", content)
-
-        # Remove from type casts: "(foo as Member1Type)" -> "(foo as )"
-        # We'll clean up the dangling "as" in the next step
-        content = re.sub(rf"\bas\s+{re.escape(member1_type)}\b", "as ", content)
+    # Remove from type casts: "(foo as Member1Type)" -> "(foo as )"
+    # We'll clean up the dangling "as" in the next step
+    content, _ = _sub_member1_types(r"\bas\s+(?P<base>\w+)Member1\b", "as ", content, member1_types)
 
     # Step 4.25: Fix writeObjectValue issues that are only visible after Member1 removal
     # Handle fields where Kiota incorrectly generated primitive instead of primitive[]
@@ -399,32 +427,25 @@ def fix_anyof_nullable_types(file_path: Path) -> int:  # noqa: C901, PLR0912, PL
     # Pattern matches JSDoc (non-greedy, stops at first */), then function with Member1 in name
     func_pattern_with_jsdoc = r"/\*\*[^*]*(?:\*(?!/)[^*]*)*\*/\s*(?://\s*@ts-ignore\s+)?export\s+function\s+(\w*Member1\w*)\s*\([^\)]*\)\s*:\s*[^{]+\s*\{"
 
-    while True:
-        match = re.search(func_pattern_with_jsdoc, content)
-        if not match:
-            break
-
+    # Removing a function leaves everything before it untouched, so each search carries on from where the previous
+    # removed function ended rather than starting over from the top of the file, and the kept spans are joined once
+    func_regex = re.compile(func_pattern_with_jsdoc)
+    kept_spans: list[str] = []
+    search_pos = 0
+    while (match := func_regex.search(content, search_pos)) is not None:
         # Find matching closing brace
-        start_pos = match.end() - 1  # Position of opening {
-        brace_count = 1
-        pos = start_pos + 1
-
-        while pos < len(content) and brace_count > 0:
-            if content[pos] == "{":
-                brace_count += 1
-            elif content[pos] == "}":
-                brace_count -= 1
-            pos += 1
-
-        if brace_count == 0:
-            # Remove from start of JSDoc to end of closing brace (including newline)
-            end_pos = pos
-            if end_pos < len(content) and content[end_pos] == "\n":
-                end_pos += 1
-            content = content[: match.start()] + content[end_pos:]
-            fixes_applied += 1
-        else:
-            break  # Couldn't find matching brace, stop to avoid infinite loop
+        end_pos = _find_closing_brace_end(content, match.end() - 1)
+        if end_pos is None:
+            break  # Couldn't find matching brace, so leave the rest of the file as it is
+
+        # Remove from start of JSDoc to end of closing brace (including newline)
+        if end_pos < len(content) and content[end_pos] == "\n":
+            end_pos += 1
+        kept_spans.append(content[search_pos : match.start()])
+        search_pos = end_pos
+        fixes_applied += 1
+    kept_spans.append(content[search_pos:])
+    content = "".join(kept_spans)
 
     # Pattern B: We DON'T need this pattern anymore!
     # The Member1 union types (like CreateDeviceMetricsViewPayload_id) should be kept
@@ -435,11 +456,10 @@ def fix_anyof_nullable_types(file_path: Path) -> int:  # noqa: C901, PLR0912, PL
     content = re.sub(r"\n{3,}", "\n\n", content)
 
     if content != original_content:
-        _ = file_path.write_text(content)
         print(f"Applied {fixes_applied} anyOf nullable fixes")  # noqa: T201 # this just runs as a simple script, so using print instead of log
-        return fixes_applied
+        return content, fixes_applied
 
-    return 0
+    return content, 0
 
 
 def get_models_with_primitive_array_fields(schema: dict[str, Any]) -> dict[str, dict[str, tuple[str, str, str]]]:  # noqa: C901 # TODO: decide what to do about these fixer scripts long term
@@ -578,23 +598,23 @@ def main(schema: dict[str, Any] | None = None):
                 print("Error: Failed to load OpenAPI schema from default path")  # noqa: T201 # this just runs as a simple script, so using print instead of log
                 sys.exit(1)
 
+    # All three fixes edit the same in-memory content, which is read once and written once
     index_file = MODELS_DIR / "index.ts"
+    original_content = index_file.read_text()
+    content = original_content
 
     # Fix 1: Required non-nullable fields (original functionality)
     required_fields = get_required_non_nullable_fields(schema)
     if required_fields:
         print(f"Found {len(required_fields)} models with required non-nullable fields")  # noqa: T201 # this just runs as a simple script, so using print instead of log
-        fixed_count = 0
-        for model_name, fields in required_fields.items():
-            if fix_typescript_file(index_file, model_name, fields):
-                fixed_count += 1
+        content, fixed_count = fix_required_fields(content, required_fields)
         print(f"Fixed {fixed_count} models for required fields")  # noqa: T201 # this just runs as a simple script, so using print instead of log
     else:
         print("No required non-nullable field fixes needed")  # noqa: T201 # this just runs as a simple script, so using print instead of log
 
     # Fix 2: anyOf nullable types with Member1 interfaces
     print("\nFixing anyOf nullable types...")  # noqa: T201 # this just runs as a simple script, so using print instead of log
-    anyof_fixes = fix_anyof_nullable_types(index_file)
+    content, anyof_fixes = fix_anyof_nullable_content(content)
     if anyof_fixes > 0:
         print(f"✓ Fixed {anyof_fixes} types with anyOf nullable issues")  # noqa: T201 # this just runs as a simple script, so using print instead of log
 
@@ -605,12 +625,13 @@ def main(schema: dict[str, Any] | None = None):
         print("\nNo models with primitive array fields found")  # noqa: T201 # this just runs as a simple script, so using print instead of log
     else:
         print(f"\nFound {len(models_with_array_fields)} models with primitive array fields to inject")  # noqa: T201 # this just runs as a simple script, so using print instead of log
-        content = index_file.read_text()
         for model_name, fields in models_with_array_fields.items():
             content = inject_missing_typescript_fields(content, model_name, fields)
-        _ = index_file.write_text(content)
     # pylint: enable=duplicate-code
 
+    if content != original_content:
+        _ = index_file.write_text(content)
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
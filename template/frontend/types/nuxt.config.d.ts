@@ -7,6 +7,7 @@ declare module "nuxt/schema" {
       clients: {
         default: {
           httpEndpoint: string;
+          persistedQueries?: boolean; // Apollo's automatic persisted queries, read by app/plugins/apollo-persisted-queries.client.ts
         };
       };
     };
@@ -7,18 +7,40 @@ from pathlib import Path
 import uvicorn
 
 from .app_def import app
+from .graceful_shutdown import GRACEFUL_SHUTDOWN
 from .jinja_constants import APP_NAME
+from .logger_config import LogQueueConfig
+from .logger_config import LogQueueOverflowPolicy
 from .logger_config import configure_logging
+from .logger_config import flush_log_queue
+from .worker_supervisor import WorkerLogging
+from .worker_supervisor import WorkerSupervisor
 
 logger = logging.getLogger(__name__)
+APP_IMPORT_STRING = (
+    "backend_api.app_def:app"  # spawned worker processes can't be handed the app object, so they import it
+)
 
 
 def app_specific_setup():
     pass
 
 
-def run(*, stop_event: threading.Event, host: str, port: int, log_level: str) -> int:
-    server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level=log_level))
+def run_workers(*, stop_event: threading.Event, config: uvicorn.Config, worker_logging: WorkerLogging) -> int:
+    sock = config.bind_socket()
+    try:
+        WorkerSupervisor(config=config, sockets=[sock], stop_event=stop_event, worker_logging=worker_logging).run()
+    finally:
+        stop_event.set()
+        sock.close()
+        flush_log_queue()
+    return 0
+
+
+def run(*, stop_event: threading.Event, config: uvicorn.Config) -> int:
+    server = uvicorn.Server(config)
+    assert config.timeout_graceful_shutdown is not None, "Expected a drain deadline, so a shutdown can't hang forever"
+    GRACEFUL_SHUTDOWN.install(request_stop=stop_event.set, drain_timeout_seconds=config.timeout_graceful_shutdown)
 
     def watch_for_stop():
         _ = stop_event.wait()
@@ -26,9 +48,12 @@ def run(*, stop_event: threading.Event, host: str, port: int, log_level: str) ->
 
     watcher = threading.Thread(target=watch_for_stop, daemon=True)
     watcher.start()
-    server.run()
-    stop_event.set()
-    watcher.join()
+    try:
+        server.run()
+    finally:
+        stop_event.set()
+        watcher.join()
+        flush_log_queue()
     return 0
 
 
@@ -36,7 +61,16 @@ def start_app(cli_args: argparse.Namespace, *, stop_event: threading.Event | Non
     log_folder = Path("logs")
     if cli_args.log_folder is not None:
         log_folder = Path(cli_args.log_folder)
-    configure_logging(log_level=cli_args.log_level, log_filename_prefix=str(log_folder / f"{APP_NAME}-"))
+    log_filename_prefix = str(log_folder / f"{APP_NAME}-")
+    assert isinstance(cli_args.log_queue_size, int), (
+        f"Expected log_queue_size to be an int, got {type(cli_args.log_queue_size)}"
+    )
+    log_queue = None
+    if cli_args.log_queue_size > 0:
+        log_queue = LogQueueConfig(
+            max_size=cli_args.log_queue_size, overflow_policy=LogQueueOverflowPolicy(cli_args.log_queue_overflow)
+        )
+    configure_logging(log_level=cli_args.log_level, log_filename_prefix=log_filename_prefix, log_queue=log_queue)
     app_specific_setup()
     logger.info(f"Starting uvicorn server based on CLI arguments: {cli_args}")
     if stop_event is None:
@@ -46,9 +80,30 @@ def start_app(cli_args: argparse.Namespace, *, stop_event: threading.Event | Non
     else:
         effective_stop_event = stop_event
     assert isinstance(cli_args.log_level, str), f"Expected log_level to be a str, got {type(cli_args.log_level)}"
+    assert isinstance(cli_args.workers, int), f"Expected workers to be an int, got {type(cli_args.workers)}"
+    assert isinstance(cli_args.shutdown_drain_timeout, int), (
+        f"Expected shutdown_drain_timeout to be an int, got {type(cli_args.shutdown_drain_timeout)}"
+    )
+    if cli_args.workers > 1:
+        return run_workers(
+            stop_event=effective_stop_event,
+            config=uvicorn.Config(
+                APP_IMPORT_STRING,
+                host=cli_args.host,
+                port=cli_args.port,
+                log_level=cli_args.log_level.lower(),
+                workers=cli_args.workers,
+                timeout_graceful_shutdown=cli_args.shutdown_drain_timeout,
+            ),
+            worker_logging=WorkerLogging(log_filename_prefix=log_filename_prefix, log_queue=log_queue),
+        )
     return run(
         stop_event=effective_stop_event,
-        host=cli_args.host,
-        port=cli_args.port,
-        log_level=cli_args.log_level.lower(),
+        config=uvicorn.Config(
+            app,
+            host=cli_args.host,
+            port=cli_args.port,
+            log_level=cli_args.log_level.lower(),
+            timeout_graceful_shutdown=cli_args.shutdown_drain_timeout,
+        ),
     )
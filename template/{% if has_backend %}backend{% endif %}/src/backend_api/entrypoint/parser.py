@@ -26,5 +26,30 @@ parser = argparse.ArgumentParser(description=APP_NAME, exit_on_error=False)
 _ = parser.add_argument("--version", action="version", version=get_version(prepend_v=True))
 _ = parser.add_argument("--log-level", type=str, default="INFO", help="The log level to use for the logger")
 _ = parser.add_argument("--log-folder", type=str, help="The folder to write logs to")
+_ = parser.add_argument(
+    "--log-queue-size",
+    type=int,
+    default=0,
+    help="Hand log records to a background thread through a queue of this many records, instead of writing them on the calling thread. 0 disables the queue",
+)
+_ = parser.add_argument(
+    "--log-queue-overflow",
+    type=str,
+    choices=["block", "drop", "count"],  # the values of LogQueueOverflowPolicy
+    default="block",
+    help="What to do with a log record when the queue is full: block until there is room, drop it, or drop it and count it",
+)
+_ = parser.add_argument(
+    "--shutdown-drain-timeout",
+    type=int,  # uvicorn only accepts whole seconds for its own graceful shutdown timeout
+    default=10,  # graceful_shutdown.DEFAULT_DRAIN_TIMEOUT_SECONDS, kept literal so parsing stays light
+    help="How many seconds a shutdown waits for in-flight requests to finish before cancelling them",
+)
 _ = parser.add_argument("--port", type=int, default=DEPLOYED_PORT_NUMBER, help="What port to serve the app on")
 _ = parser.add_argument("--host", type=str, default=DEFAULT_DEPLOYED_HOST, help="What hosts to allow connections from")
+_ = parser.add_argument(
+    "--workers",
+    type=int,
+    default=1,
+    help="How many worker processes to serve the app with. More than 1 pre-forks workers sharing one listening socket",
+)
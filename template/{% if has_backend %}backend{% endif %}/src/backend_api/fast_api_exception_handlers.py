@@ -15,6 +15,7 @@ from starlette.exceptions import HTTPException
 from uuid_utils import uuid7
 
 from .camel_case_model import CamelCaseModel
+from .lazy_routers import load_lazy_routers
 from .openapi_schema_simplifier import collapse_nullable_anyof
 
 logger = logging.getLogger(__name__)
@@ -176,6 +177,9 @@ def custom_openapi(app: FastAPI) -> dict[str, Any]:  # pyrefly: ignore[explicit-
     """
     if app.openapi_schema is not None:  # don't regenerate the schema on subsequent API calls if it's already been done
         return app.openapi_schema
+    load_lazy_routers(
+        app
+    )  # the document describes every route, including optional ones that haven't been requested yet
     oas = get_openapi(
         title=app.title,
         version=app.version,
@@ -0,0 +1,64 @@
+import asyncio
+import logging
+import signal
+from collections.abc import Callable
+from typing import NamedTuple
+
+from .metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+DEFAULT_DRAIN_TIMEOUT_SECONDS = 10
+
+
+def _raise_sigterm() -> None:
+    # when the app is served directly by the uvicorn CLI (e.g. hot-reloading in development), uvicorn's own signal
+    # handler is what turns this into a graceful shutdown
+    signal.raise_signal(signal.SIGTERM)
+
+
+class DrainResult(NamedTuple):
+    drained: int
+    abandoned: int  # still running when the deadline passed, so the server will cancel them
+
+
+class GracefulShutdown:
+    """Stop the server from inside a request, then wait for the other in-flight requests to finish.
+
+    Whoever runs the server installs a ``request_stop`` callback that makes uvicorn stop accepting connections and
+    begin its own graceful shutdown, which waits for open connections (up to the same deadline), runs the lifespan
+    teardown and returns, so the runner can flush the logs before the process exits normally.
+    """
+
+    def __init__(self, *, poll_interval_seconds: float = 0.01) -> None:
+        self._poll_interval_seconds = poll_interval_seconds
+        self._request_stop: Callable[[], None] = _raise_sigterm
+        self.drain_timeout_seconds: float = DEFAULT_DRAIN_TIMEOUT_SECONDS
+
+    def install(self, *, request_stop: Callable[[], None], drain_timeout_seconds: float) -> None:
+        self._request_stop = request_stop
+        self.drain_timeout_seconds = drain_timeout_seconds
+
+    async def drain(self, registry: MetricsRegistry) -> DrainResult:
+        """Request the stop and wait for every in-flight request other than the caller's own. Must be awaited from within a request."""
+        in_flight_at_start = _other_requests_in_progress(registry)
+        logger.info(f"Stopping the server and draining {in_flight_at_start} in-flight requests")
+        self._request_stop()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.drain_timeout_seconds
+        while (  # noqa: ASYNC110 # the count lives in the metrics registry, which keeps per-request work to plain dict updates rather than signalling an event
+            _other_requests_in_progress(registry) > 0 and loop.time() < deadline
+        ):
+            await asyncio.sleep(self._poll_interval_seconds)
+        abandoned = _other_requests_in_progress(registry)
+        if abandoned > 0:
+            logger.warning(
+                f"{abandoned} requests were still in flight when the {self.drain_timeout_seconds}s drain deadline passed"
+            )
+        return DrainResult(drained=max(0, in_flight_at_start - abandoned), abandoned=abandoned)
+
+
+def _other_requests_in_progress(registry: MetricsRegistry) -> int:
+    return sum(registry.requests_in_progress.values()) - 1  # the request asking for the shutdown is in progress too
+
+
+GRACEFUL_SHUTDOWN = GracefulShutdown()
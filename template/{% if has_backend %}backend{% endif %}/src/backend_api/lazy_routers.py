@@ -0,0 +1,93 @@
+import logging
+import threading
+from collections.abc import Callable
+from enum import Enum
+from typing import override
+
+from fastapi import APIRouter
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import URLPath
+from starlette.routing import BaseRoute
+from starlette.routing import Match
+from starlette.routing import NoMatchFound
+from starlette.routing import get_route_path
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRouter(BaseRoute):
+    """Stand in for an optional router until it is first needed, then swap its routes in where this one was.
+
+    Building some routers (e.g. GraphQL, which imports strawberry and builds the schema) costs a noticeable share of
+    the app's startup, so they are loaded the first time a request is sent under their prefix, or when the OpenAPI
+    document is generated (which happens in a background warmup after startup), whichever comes first.
+    """
+
+    def __init__(
+        self, app: FastAPI, *, load: Callable[[], APIRouter], prefix: str, tags: list[str | Enum] | None = None
+    ) -> None:
+        self._app = app
+        self._load = load
+        self.prefix = prefix
+        self._tags = tags
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def load(self) -> None:
+        """Import and include the real router. Safe to call from several threads; only the first call does the work."""
+        with self._lock:
+            if self.loaded:
+                return
+            routes = self._app.router.routes
+            placeholder_index = routes.index(self)
+            first_new_index = len(routes)
+            self._app.include_router(self._load(), prefix=self.prefix, tags=self._tags)
+            new_routes = routes[first_new_index:]
+            del routes[first_new_index:]
+            # a new list rather than an in-place splice, so a request iterating the old one on the event loop can't skip a route
+            self._app.router.routes = [*routes[:placeholder_index], *new_routes, *routes[placeholder_index + 1 :]]
+            self._app.openapi_schema = None  # the cached document doesn't describe the new routes yet
+            self.loaded = True
+        logger.info(f"Loaded the router for {self.prefix}")
+
+    @override
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] not in ("http", "websocket"):
+            return Match.NONE, {}
+        route_path = get_route_path(scope)
+        if route_path == self.prefix or route_path.startswith(f"{self.prefix}/"):
+            return Match.FULL, {}
+        return Match.NONE, {}
+
+    @override
+    def url_path_for(self, name: str, /, **path_params: object) -> URLPath:
+        raise NoMatchFound(name, path_params)  # the real routes can be looked up by name once they are loaded
+
+    @override
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await run_in_threadpool(self.load)  # importing can take a while, so keep it off the event loop
+        await self._app.router(scope, receive, send)  # the real routes have replaced this one by now
+
+
+def include_lazy_router(
+    app: FastAPI, *, load: Callable[[], APIRouter], prefix: str, tags: list[str | Enum] | None = None
+) -> LazyRouter:
+    """Reserve the router's place in the route order now, and only call `load` once it is needed.
+
+    Include it where the real router would have been, since routes are matched in order (e.g. before the catch-all
+    static files mount).
+    """
+    lazy_router = LazyRouter(app, load=load, prefix=prefix, tags=tags)
+    app.router.routes.append(lazy_router)
+    return lazy_router
+
+
+def load_lazy_routers(app: FastAPI) -> None:
+    """Load every router that is still waiting to be, e.g. so the OpenAPI document describes all of them."""
+    for route in list(app.router.routes):
+        if isinstance(route, LazyRouter):
+            route.load()
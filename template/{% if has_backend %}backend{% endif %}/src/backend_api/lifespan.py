@@ -0,0 +1,43 @@
+# FastAPI only takes a lifespan when the app is constructed, so helpers that set up one feature of an already created app
+# (e.g. background task pools) hook into its startup and shutdown by wrapping the lifespan it already has
+from collections.abc import AsyncGenerator
+from collections.abc import Awaitable
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from fastapi import FastAPI
+
+
+def wrap_lifespan(
+    app: FastAPI,
+    on_startup: Callable[[], object],
+    on_shutdown: Callable[[], Awaitable[object]],
+    *,
+    around_app_lifespan: bool = False,
+) -> None:
+    """Call `on_startup` once the app has started, and await `on_shutdown` before the rest of its teardown runs.
+
+    With `around_app_lifespan`, they run before the app's startup and after its teardown instead, and `on_shutdown` is
+    awaited even if the app fails to start.
+    """
+    app_lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(lifespan_app: FastAPI) -> AsyncGenerator[Any]:  # pyrefly: ignore[explicit-any] # Starlette lets a lifespan yield any state
+        if around_app_lifespan:
+            _ = on_startup()
+            try:
+                async with app_lifespan(lifespan_app) as state:
+                    yield state
+            finally:
+                _ = await on_shutdown()
+            return
+        async with app_lifespan(lifespan_app) as state:
+            _ = on_startup()
+            try:
+                yield state
+            finally:
+                _ = await on_shutdown()
+
+    app.router.lifespan_context = lifespan
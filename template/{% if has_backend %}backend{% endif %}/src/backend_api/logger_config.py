@@ -1,6 +1,16 @@
+import copy
+import logging
+import queue
 import socket
+import threading
+from enum import StrEnum
 from logging.config import dictConfig
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from typing import NamedTuple
+from typing import override
 
 import structlog
 
@@ -10,17 +20,156 @@ SYSTEM_NAME = APP_NAME
 SUBSYSTEM_NAME = "backend"
 
 
+class LogQueueOverflowPolicy(StrEnum):
+    BLOCK = "block"  # wait for the listener to make room, so no record is ever lost
+    DROP = "drop"  # silently discard the record, so logging can never stall the caller
+    COUNT = "count"  # discard the record, but count it and log how many were lost once the queue has room again
+
+
+class LogQueueConfig(NamedTuple):
+    max_size: int = 10_000
+    overflow_policy: LogQueueOverflowPolicy = LogQueueOverflowPolicy.BLOCK
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Hand records to a bounded queue, leaving the formatting and file I/O to a ``QueueListener`` thread.
+
+    Unlike the base ``QueueHandler``, ``prepare`` does not format the record: the downstream structlog formatters
+    need the original exception info and extra attributes, and formatting is the expensive part being moved off the
+    calling thread. Only what can't be recovered later is resolved here: the %-style arguments (which may be
+    mutated after the call) and the structlog context vars (which are bound to the calling thread).
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord | None]", *, overflow_policy: LogQueueOverflowPolicy):
+        super().__init__(log_queue)
+        self._records = log_queue  # the base class only types it as a put_nowait-able queue, but blocking needs put
+        self.overflow_policy = overflow_policy
+        self.dropped_count = 0
+        self._unreported_drops = 0
+        self._drops_lock = threading.Lock()
+
+    @override
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        prepared = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        for key, value in structlog.contextvars.get_contextvars().items():
+            if key not in prepared.__dict__:
+                prepared.__dict__[key] = value  # picked up by the ExtraAdder in the formatters' pre-chain
+        return prepared
+
+    @override
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow_policy == LogQueueOverflowPolicy.BLOCK:
+            self._records.put(record)
+            return
+        try:
+            self._records.put_nowait(record)
+        except queue.Full:
+            with self._drops_lock:
+                self.dropped_count += 1
+                self._unreported_drops += 1
+            return
+        if self.overflow_policy == LogQueueOverflowPolicy.COUNT and self._unreported_drops > 0:
+            self._report_drops(record)
+
+    def _report_drops(self, after: logging.LogRecord) -> None:
+        with self._drops_lock:
+            unreported_drops, self._unreported_drops = self._unreported_drops, 0
+        report = logging.LogRecord(
+            name=__name__,
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=0,
+            msg=f"Dropped {unreported_drops} log records because the log queue was full",
+            args=None,
+            exc_info=None,
+        )
+        report.created = after.created
+        try:
+            self._records.put_nowait(report)
+        except queue.Full:
+            with self._drops_lock:  # try again with the next record that fits
+                self._unreported_drops += unreported_drops
+
+
+class DrainingQueueListener(QueueListener):
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord | None]", *handlers: logging.Handler) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self._records = log_queue
+
+    @override
+    def enqueue_sentinel(self) -> None:
+        self._records.put(None)  # the base class uses put_nowait, which raises if the queue is full at shutdown
+
+
+class SingleFormatRotatingFileHandler(RotatingFileHandler):
+    """Format each record once, instead of once to check whether it fits before rolling over and again to write it.
+
+    The structlog JSON formatter is the most expensive part of emitting a record, so this halves the cost per record.
+    """
+
+    def __init__(self, filename: str, *, max_bytes: int, backup_count: int) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count)
+        self._last_record: logging.LogRecord | None = None
+        self._last_formatted = ""
+
+    @override
+    def format(self, record: logging.LogRecord) -> str:
+        if record is not self._last_record:  # emit() runs under the handler lock, so this pair can't be interleaved
+            self._last_formatted = super().format(record)
+            self._last_record = record
+        return self._last_formatted
+
+
+def _start_log_queue(log_queue: LogQueueConfig, *, handler_names: list[str]) -> None:
+    """Move the named root logger handlers behind a bounded queue drained by a background listener thread."""
+    root_logger = logging.getLogger()
+    downstream_handlers = [handler for handler in root_logger.handlers if handler.name in handler_names]
+    records: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=log_queue.max_size)
+    queue_handler = BoundedQueueHandler(records, overflow_policy=log_queue.overflow_policy)
+    queue_handler.listener = DrainingQueueListener(records, *downstream_handlers)
+    for handler in downstream_handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+    queue_handler.listener.start()
+
+
+def flush_log_queue() -> None:
+    """Write out every queued record and go back to handling records on the calling thread.
+
+    Call this before the process exits: the listener is a daemon thread, so anything still queued would otherwise be
+    lost. Records logged after this (e.g. during interpreter teardown) are written directly. Safe to call when the
+    queue isn't in use, and more than once.
+    """
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if not isinstance(handler, BoundedQueueHandler) or handler.listener is None:
+            continue
+        listener = handler.listener
+        handler.listener = None
+        for downstream_handler in listener.handlers:
+            root_logger.addHandler(downstream_handler)
+        root_logger.removeHandler(handler)
+        listener.stop()
+
+
 def configure_logging(
     *,
     log_filename_prefix: str = f"logs/{SYSTEM_NAME}-",
     log_level: str = "INFO",
     suppress_console_logging: bool = False,
+    log_queue: LogQueueConfig | None = None,
 ):
     """Configure structlog to output both to the console and JSON to a file.
 
     This also configures stdlib logging to also use the same structlog formatters using details found here.
     https://www.structlog.org/en/stable/standard-library.html#rendering-using-structlog-based-formatters-within-logging
+
+    With ``log_queue``, the calling thread only enqueues each record; a background thread renders it and does the
+    file and console I/O (including rotation). Call ``flush_log_queue`` before exiting.
     """
+    flush_log_queue()  # in case logging is being reconfigured, don't strand anything queued for the old handlers
     _ = structlog.contextvars.bind_contextvars(
         **{
             "event.dataset": SYSTEM_NAME,
@@ -124,11 +273,11 @@ def configure_logging(
                     "formatter": "colored",
                 },
                 "file": {
-                    "class": "logging.handlers.RotatingFileHandler",
+                    "()": SingleFormatRotatingFileHandler,
                     "filename": log_filename,
                     "formatter": "json",
-                    "maxBytes": log_size_max_bytes,
-                    "backupCount": 5,
+                    "max_bytes": log_size_max_bytes,
+                    "backup_count": 5,
                 },
             },
             "loggers": {
@@ -140,3 +289,5 @@ def configure_logging(
             },
         }
     )
+    if log_queue is not None:
+        _start_log_queue(log_queue, handler_names=handlers)
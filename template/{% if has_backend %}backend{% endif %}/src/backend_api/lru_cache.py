@@ -0,0 +1,48 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from .metrics import CacheStats
+
+
+class LruCache[K: Hashable, V]:
+    """Holds at most ``max_entries`` values, evicting the least recently used one, and counts its hits and misses.
+
+    Like the metrics registry, it has no lock, so only use it from the event loop thread.
+    """
+
+    def __init__(self, *, max_entries: int) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")  # noqa: TRY003 # the message is specific to this one check
+        self.max_entries = max_entries
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        """Check for the key without counting a lookup or refreshing its recency."""
+        return key in self._entries
+
+    def get(self, key: K) -> V | None:
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: K, value: V) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            _ = self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self.hits, misses=self.misses, entries=len(self._entries), max_entries=self.max_entries)
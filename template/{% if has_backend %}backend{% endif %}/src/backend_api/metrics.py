@@ -0,0 +1,397 @@
+import asyncio
+import contextlib
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from anyio.to_thread import current_default_thread_limiter
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# the Prometheus client libraries' defaults, which cover everything from a cached lookup to a slow device call
+DEFAULT_LATENCY_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+# how many keys a GraphQL DataLoader resolved in one call; a sum close to the count means the batching isn't working
+DATALOADER_BATCH_SIZE_BUCKETS = (1.0, 2.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+EVENT_LOOP_LAG_BUCKETS_SECONDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+UNMATCHED_ROUTE_LABEL = "<unmatched>"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Iterable[tuple[str, str]]) -> str:
+    return ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels)
+
+
+def _label_block(labels: Iterable[tuple[str, str]]) -> str:
+    label_text = _format_labels(labels)
+    return f"{{{label_text}}}" if label_text != "" else ""
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Histogram:
+    """Cumulative-bucket histogram, stored as per-bucket counts so an observation is one bisect and two additions."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the final slot is the +Inf bucket
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def render(self, name: str, labels: tuple[tuple[str, str], ...]) -> list[str]:
+        lines: list[str] = []
+        cumulative = 0
+        for upper_bound, count in zip((*self.buckets, float("inf")), self.counts, strict=True):
+            cumulative += count
+            le = "+Inf" if upper_bound == float("inf") else _format_value(upper_bound)
+            lines.append(f"{name}_bucket{_label_block((*labels, ('le', le)))} {cumulative}")
+        lines.append(f"{name}_sum{_label_block(labels)} {_format_value(self.sum)}")
+        lines.append(f"{name}_count{_label_block(labels)} {cumulative}")
+        return lines
+
+
+class RequestKey(NamedTuple):
+    method: str
+    route: str
+    status: str
+
+
+class ThreadpoolStats(NamedTuple):
+    threads_in_use: int
+    threads_limit: float
+    tasks_waiting: int
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+    max_entries: int
+
+
+class TaskPoolStats(NamedTuple):
+    running: int
+    queued: int
+    completed: int
+    failed: int
+    cancelled: int
+    rejected: int  # turned away because the queue was full
+
+
+class MetricsRegistry:
+    """Request, threadpool, event loop and cache metrics for one process, rendered in the Prometheus text format.
+
+    Every update happens on the event loop thread (the middleware wraps the ASGI app, so even sync routes that run
+    in the threadpool are timed from the loop), which is what lets these plain dicts go without a lock. Each
+    ``--workers`` process keeps its own registry, so a scrape reports whichever worker happened to answer it.
+    """
+
+    def __init__(self, *, latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS_SECONDS) -> None:
+        self._latency_buckets = latency_buckets
+        self.request_counts: defaultdict[RequestKey, int] = defaultdict(int)
+        self.request_latencies: dict[tuple[str, str], Histogram] = {}
+        self.requests_in_progress: defaultdict[str, int] = defaultdict(int)
+        self.event_loop_lag = Histogram(EVENT_LOOP_LAG_BUCKETS_SECONDS)
+        self.cache_stats: dict[str, Callable[[], CacheStats]] = {}
+        self.dataloader_batch_sizes: dict[str, Histogram] = {}
+        self.graphql_resolver_latencies: dict[str, Histogram] = {}
+        self.task_pool_stats: dict[str, Callable[[], TaskPoolStats]] = {}
+        self.background_task_durations: dict[str, Histogram] = {}
+        self.scheduled_job_lags: dict[str, Histogram] = {}
+        self.scheduled_job_durations: dict[str, Histogram] = {}
+        self.scheduled_job_runs: defaultdict[tuple[str, str], int] = defaultdict(int)
+
+    def register_cache(self, name: str, get_stats: Callable[[], CacheStats]) -> None:
+        """Report a cache's hits, misses and size on every scrape, read through `get_stats` so the cache stays the only place that counts them."""
+        self.cache_stats[name] = get_stats
+
+    def register_task_pool(self, name: str, get_stats: Callable[[], TaskPoolStats]) -> None:
+        """Report a background task pool's counts on every scrape, read through `get_stats` like a cache's."""
+        self.task_pool_stats[name] = get_stats
+
+    def observe_request(self, key: RequestKey, duration_seconds: float) -> None:
+        self.request_counts[key] += 1
+        latency_key = (key.method, key.route)
+        histogram = self.request_latencies.get(latency_key)
+        if histogram is None:
+            histogram = self.request_latencies[latency_key] = Histogram(self._latency_buckets)
+        histogram.observe(duration_seconds)
+
+    def observe_dataloader_batch(self, loader: str, batch_size: int) -> None:
+        histogram = self.dataloader_batch_sizes.get(loader)
+        if histogram is None:
+            histogram = self.dataloader_batch_sizes[loader] = Histogram(DATALOADER_BATCH_SIZE_BUCKETS)
+        histogram.observe(batch_size)
+
+    def observe_graphql_resolver(self, field: str, duration_seconds: float) -> None:
+        histogram = self.graphql_resolver_latencies.get(field)
+        if histogram is None:
+            histogram = self.graphql_resolver_latencies[field] = Histogram(self._latency_buckets)
+        histogram.observe(duration_seconds)
+
+    def observe_background_task(self, pool: str, duration_seconds: float) -> None:
+        histogram = self.background_task_durations.get(pool)
+        if histogram is None:
+            histogram = self.background_task_durations[pool] = Histogram(self._latency_buckets)
+        histogram.observe(duration_seconds)
+
+    def observe_scheduled_job_lag(self, job: str, lag_seconds: float) -> None:
+        histogram = self.scheduled_job_lags.get(job)
+        if histogram is None:
+            histogram = self.scheduled_job_lags[job] = Histogram(EVENT_LOOP_LAG_BUCKETS_SECONDS)
+        histogram.observe(lag_seconds)
+
+    def observe_scheduled_job_run(self, job: str, result: str, duration_seconds: float | None) -> None:
+        """Count a run by how it ended; one that was skipped never ran, so it has no duration."""
+        self.scheduled_job_runs[job, result] += 1
+        if duration_seconds is None:
+            return
+        histogram = self.scheduled_job_durations.get(job)
+        if histogram is None:
+            histogram = self.scheduled_job_durations[job] = Histogram(self._latency_buckets)
+        histogram.observe(duration_seconds)
+
+    def render(self, threadpool: ThreadpoolStats) -> str:
+        lines = [
+            "# HELP http_requests_total Total HTTP requests handled, by route template, method and status code.",
+            "# TYPE http_requests_total counter",
+        ]
+        for key, count in sorted(self.request_counts.items()):
+            labels = (("method", key.method), ("route", key.route), ("status", key.status))
+            lines.append(f"http_requests_total{_label_block(labels)} {count}")
+        lines += [
+            "# HELP http_request_duration_seconds Time from receiving a request until its response has been sent.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), histogram in sorted(self.request_latencies.items()):
+            lines += histogram.render("http_request_duration_seconds", (("method", method), ("route", route)))
+        lines += [
+            "# HELP http_requests_in_progress HTTP requests currently being handled.",
+            "# TYPE http_requests_in_progress gauge",
+        ]
+        for method, in_progress in sorted(self.requests_in_progress.items()):
+            lines.append(f"http_requests_in_progress{_label_block((('method', method),))} {in_progress}")
+        lines += [
+            "# HELP event_loop_lag_seconds How late the event loop woke up a periodic timer; sustained lag means blocking work is running on the loop.",
+            "# TYPE event_loop_lag_seconds histogram",
+            *self.event_loop_lag.render("event_loop_lag_seconds", ()),
+            "# HELP threadpool_threads_in_use Worker threads currently running sync routes and other offloaded calls.",
+            "# TYPE threadpool_threads_in_use gauge",
+            f"threadpool_threads_in_use {threadpool.threads_in_use}",
+            "# HELP threadpool_threads_limit Maximum number of worker threads in the default threadpool.",
+            "# TYPE threadpool_threads_limit gauge",
+            f"threadpool_threads_limit {_format_value(threadpool.threads_limit)}",
+            "# HELP threadpool_tasks_waiting Calls queued for a worker thread because the threadpool is saturated.",
+            "# TYPE threadpool_tasks_waiting gauge",
+            f"threadpool_tasks_waiting {threadpool.tasks_waiting}",
+            "# HELP cache_lookups_total Lookups in an in-process cache, by whether the entry was found; the hit rate is hits over all lookups.",
+            "# TYPE cache_lookups_total counter",
+        ]
+        stats_by_cache = {name: get_stats() for name, get_stats in sorted(self.cache_stats.items())}
+        for name, stats in stats_by_cache.items():
+            lines += [
+                f"cache_lookups_total{_label_block((('cache', name), ('result', 'hit')))} {stats.hits}",
+                f"cache_lookups_total{_label_block((('cache', name), ('result', 'miss')))} {stats.misses}",
+            ]
+        lines += [
+            "# HELP cache_entries Entries currently held in an in-process cache.",
+            "# TYPE cache_entries gauge",
+        ]
+        lines += [
+            f"cache_entries{_label_block((('cache', name),))} {stats.entries}" for name, stats in stats_by_cache.items()
+        ]
+        lines += [
+            "# HELP cache_max_entries Entries an in-process cache holds before evicting the least recently used one.",
+            "# TYPE cache_max_entries gauge",
+        ]
+        lines += [
+            f"cache_max_entries{_label_block((('cache', name),))} {stats.max_entries}"
+            for name, stats in stats_by_cache.items()
+        ]
+        lines += [
+            "# HELP dataloader_batch_size Keys a GraphQL DataLoader resolved with one call of its batch function.",
+            "# TYPE dataloader_batch_size histogram",
+        ]
+        for loader, histogram in sorted(self.dataloader_batch_sizes.items()):
+            lines += histogram.render("dataloader_batch_size", (("loader", loader),))
+        lines += [
+            "# HELP graphql_resolver_duration_seconds Time a GraphQL field took to resolve, by parent type and field; only recorded while resolver tracing is enabled.",
+            "# TYPE graphql_resolver_duration_seconds histogram",
+        ]
+        for field, histogram in sorted(self.graphql_resolver_latencies.items()):
+            lines += histogram.render("graphql_resolver_duration_seconds", (("field", field),))
+        lines += self._render_background_work()
+        return "\n".join(lines) + "\n"
+
+    def _render_background_work(self) -> list[str]:
+        """Render the background task pools' and periodic jobs' metrics, as part of `render`."""
+        stats_by_pool = {name: get_stats() for name, get_stats in sorted(self.task_pool_stats.items())}
+        lines = [
+            "# HELP background_tasks_running Tasks of a background task pool that are currently running.",
+            "# TYPE background_tasks_running gauge",
+        ]
+        lines += [
+            f"background_tasks_running{_label_block((('pool', name),))} {stats.running}"
+            for name, stats in stats_by_pool.items()
+        ]
+        lines += [
+            "# HELP background_tasks_queued Tasks of a background task pool waiting for one of its running slots.",
+            "# TYPE background_tasks_queued gauge",
+        ]
+        lines += [
+            f"background_tasks_queued{_label_block((('pool', name),))} {stats.queued}"
+            for name, stats in stats_by_pool.items()
+        ]
+        lines += [
+            "# HELP background_tasks_finished_total Tasks of a background task pool that have finished, by how they ended.",
+            "# TYPE background_tasks_finished_total counter",
+        ]
+        for name, stats in stats_by_pool.items():
+            for result, count in (
+                ("completed", stats.completed),
+                ("failed", stats.failed),
+                ("cancelled", stats.cancelled),
+            ):
+                lines.append(
+                    f"background_tasks_finished_total{_label_block((('pool', name), ('result', result)))} {count}"
+                )
+        lines += [
+            "# HELP background_tasks_rejected_total Tasks turned away because their pool's queue was full.",
+            "# TYPE background_tasks_rejected_total counter",
+        ]
+        lines += [
+            f"background_tasks_rejected_total{_label_block((('pool', name),))} {stats.rejected}"
+            for name, stats in stats_by_pool.items()
+        ]
+        lines += [
+            "# HELP background_task_duration_seconds Time a background task ran for, from when its pool started it.",
+            "# TYPE background_task_duration_seconds histogram",
+        ]
+        for pool, histogram in sorted(self.background_task_durations.items()):
+            lines += histogram.render("background_task_duration_seconds", (("pool", pool),))
+        lines += [
+            "# HELP scheduled_job_lag_seconds How late a periodic job's run was started, after its jittered due time.",
+            "# TYPE scheduled_job_lag_seconds histogram",
+        ]
+        for job, histogram in sorted(self.scheduled_job_lags.items()):
+            lines += histogram.render("scheduled_job_lag_seconds", (("job", job),))
+        lines += [
+            "# HELP scheduled_job_duration_seconds Time a periodic job's run took, including ones that failed or timed out.",
+            "# TYPE scheduled_job_duration_seconds histogram",
+        ]
+        for job, histogram in sorted(self.scheduled_job_durations.items()):
+            lines += histogram.render("scheduled_job_duration_seconds", (("job", job),))
+        lines += [
+            "# HELP scheduled_job_runs_total Runs of a periodic job, by how they ended (skipped ones were due while the previous run was still going).",
+            "# TYPE scheduled_job_runs_total counter",
+        ]
+        for (job, result), count in sorted(self.scheduled_job_runs.items()):
+            lines.append(f"scheduled_job_runs_total{_label_block((('job', job), ('result', result)))} {count}")
+        return lines
+
+
+METRICS = MetricsRegistry()
+
+
+def get_threadpool_stats() -> ThreadpoolStats:
+    """Read the saturation of the threadpool that sync routes run in. Must be called from the event loop."""
+    limiter = current_default_thread_limiter()
+    return ThreadpoolStats(
+        threads_in_use=limiter.borrowed_tokens,
+        threads_limit=limiter.total_tokens,
+        tasks_waiting=limiter.statistics().tasks_waiting,
+    )
+
+
+def route_label(scope: Scope) -> str:
+    """Return the route template that handled a request, so path parameters and static file names can't explode the label cardinality."""
+    route_path = getattr(scope.get("route"), "path", "")
+    if route_path != "":
+        return route_path
+    if "app_root_path" in scope:  # served by a Mount, such as the static files
+        return f"{scope['root_path'].removeprefix(scope['app_root_path'])}/{{path}}"
+    if (
+        "endpoint" in scope
+    ):  # a route without a path template of its own, e.g. the OpenAPI schema or an included router's root
+        path: str = scope["path"]
+        return path
+    return UNMATCHED_ROUTE_LABEL
+
+
+async def monitor_event_loop_lag(registry: MetricsRegistry, *, interval_seconds: float) -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        expected_wake = loop.time() + interval_seconds
+        await asyncio.sleep(interval_seconds)
+        registry.event_loop_lag.observe(max(0.0, loop.time() - expected_wake))
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-request counts, latencies and in-progress gauges.
+
+    It deliberately avoids ``BaseHTTPMiddleware`` (which adds a task and a memory stream per request) so the overhead
+    stays at a couple of clock reads and dict updates. It also samples event loop lag for as long as the app's
+    lifespan is running.
+    """
+
+    def __init__(
+        self, app: ASGIApp, *, registry: MetricsRegistry = METRICS, loop_lag_interval_seconds: float = 0.5
+    ) -> None:
+        self.app = app
+        self.registry = registry
+        self.loop_lag_interval_seconds = loop_lag_interval_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._run_lifespan(scope, receive, send)
+            return
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method: str = scope["method"]
+        status_code = 500  # if the app raises before starting a response, the server error middleware will send a 500
+        registry = self.registry
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        registry.requests_in_progress[method] += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            registry.requests_in_progress[method] -= 1
+            registry.observe_request(RequestKey(method, route_label(scope), str(status_code)), duration)
+
+    async def _run_lifespan(self, scope: Scope, receive: Receive, send: Send) -> None:
+        monitor = asyncio.create_task(
+            monitor_event_loop_lag(self.registry, interval_seconds=self.loop_lag_interval_seconds),
+            name="monitor_event_loop_lag",
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _ = monitor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await monitor
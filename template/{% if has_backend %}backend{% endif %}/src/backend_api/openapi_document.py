@@ -0,0 +1,132 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+from typing import Any
+from typing import NamedTuple
+
+from fastapi import FastAPI
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+from starlette.routing import Route
+
+from .lifespan import wrap_lifespan
+from .static_files import REVALIDATE_CACHE_CONTROL
+from .static_files import EncodedVariant
+from .static_files import accepted_encodings
+from .static_files import etag_matches
+from .static_files import quoted_etag
+
+logger = logging.getLogger(__name__)
+
+
+class PreencodedDocument(NamedTuple):
+    etag: str
+    body: bytes
+    gzip_variant: EncodedVariant
+
+
+def encode_openapi_document(schema: dict[str, Any]) -> PreencodedDocument:  # pyrefly: ignore[explicit-any] # FastAPI annotates the OpenAPI schema as dict[str, Any]
+    # byte-for-byte what FastAPI's JSONResponse would have rendered for the same schema
+    body = json.dumps(schema, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+    content_hash = hashlib.sha256(body).hexdigest()[:32]
+    return PreencodedDocument(
+        etag=quoted_etag(content_hash),
+        body=body,
+        gzip_variant=EncodedVariant(
+            "gzip", quoted_etag(content_hash, "gzip"), gzip.compress(body, compresslevel=9, mtime=0)
+        ),
+    )
+
+
+class PreencodedOpenAPI:
+    """Serve the OpenAPI document as bytes encoded once, with a gzip variant, a strong ETag and 304 revalidation.
+
+    FastAPI's own route re-serializes the schema dict on every request. The schema itself is still built (and
+    cached on ``app.openapi_schema``) by ``app.openapi()``; whenever that returns a different object, e.g. because
+    the cache was cleared, the encoded bytes are rebuilt too.
+    """
+
+    def __init__(self, app: FastAPI) -> None:
+        self._app = app
+        self._source: dict[str, Any] | None = None  # pyrefly: ignore[explicit-any] # FastAPI annotates the OpenAPI schema as dict[str, Any]
+        self._documents: dict[str, PreencodedDocument] = {}  # by root path, since that can add to the servers list
+        self._warmup: asyncio.Task[None] | None = None
+
+    def document(self, root_path: str) -> PreencodedDocument:
+        """Build (if needed) and return the encoded document. Building can take seconds for a large app, so call this off the event loop."""
+        schema = self._app.openapi()
+        if schema is not self._source:
+            self._documents = {}
+            self._source = schema
+        document = self._documents.get(root_path)
+        if document is None:
+            document = self._documents[root_path] = encode_openapi_document(self._with_root_path(schema, root_path))
+        return document
+
+    def start_warmup(self) -> asyncio.Task[None]:
+        """Build the document for the bare root path in the background, so startup doesn't wait for it."""
+        self._warmup = asyncio.create_task(self._warm_up())
+        return self._warmup
+
+    async def finish_warmup(self) -> None:
+        if self._warmup is not None:
+            await self._warmup  # the build can't be interrupted once it is running in its thread
+
+    async def _warm_up(self) -> None:
+        try:
+            _ = await run_in_threadpool(self.document, "")
+        except Exception:
+            logger.exception("Failed to build the OpenAPI document in the background, it will be built on request")
+
+    def _with_root_path(self, schema: dict[str, Any], root_path: str) -> dict[str, Any]:  # pyrefly: ignore[explicit-any] # FastAPI annotates the OpenAPI schema as dict[str, Any]
+        # the same adjustment FastAPI's own route makes when the app is served under a path prefix
+        if root_path == "" or not self._app.root_path_in_servers:
+            return schema
+        servers: list[dict[str, Any]] = schema.get("servers", [])  # pyrefly: ignore[explicit-any] # FastAPI annotates the OpenAPI schema as dict[str, Any]
+        if root_path in {server.get("url") for server in servers}:
+            return schema
+        return {**schema, "servers": [{"url": root_path}, *servers]}
+
+    async def endpoint(self, request: Request) -> Response:
+        if self._warmup is not None and not self._warmup.done():
+            await asyncio.shield(self._warmup)  # rather than building it a second time alongside the warmup
+        root_path: str = request.scope.get("root_path", "").rstrip("/")
+        document = self._documents.get(root_path)
+        if document is None or self._app.openapi_schema is not self._source:
+            document = await run_in_threadpool(self.document, root_path)
+
+        headers = {"Cache-Control": REVALIDATE_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+        use_gzip = "gzip" in accepted_encodings(request.headers.get("accept-encoding", ""))
+        headers["ETag"] = document.gzip_variant.etag if use_gzip else document.etag
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        if not use_gzip:
+            return Response(content=document.body, headers=headers, media_type="application/json")
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=document.gzip_variant.body, headers=headers, media_type="application/json")
+
+
+def serve_preencoded_openapi(app: FastAPI) -> PreencodedOpenAPI:
+    """Replace FastAPI's OpenAPI route, and start building the document as soon as the app starts.
+
+    The build runs in the background so the server can start answering (e.g. healthchecks) right away; a request for
+    the document that arrives before it is ready waits for that build instead of starting another one.
+
+    Call this after every route has been added, since the document is generated from them.
+    """
+    assert app.openapi_url is not None, "Expected the app to serve an OpenAPI document"
+    preencoded = PreencodedOpenAPI(app)
+    for index, route in enumerate(app.router.routes):
+        if isinstance(route, Route) and route.path == app.openapi_url:
+            # replaced in place, because a route appended now would come after the catch-all static files mount
+            app.router.routes[index] = Route(app.openapi_url, preencoded.endpoint, include_in_schema=False)
+            break
+    else:
+        raise NotImplementedError(f"No route found for the OpenAPI document at {app.openapi_url}")
+
+    wrap_lifespan(app, preencoded.start_warmup, preencoded.finish_warmup, around_app_lifespan=True)
+    return preencoded
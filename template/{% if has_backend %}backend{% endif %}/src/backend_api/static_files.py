@@ -0,0 +1,179 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple
+from typing import override
+
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.responses import Response
+from starlette.routing import Mount
+from starlette.types import Scope
+
+# mirrors the policy frontend/default.conf.template applies in nginx
+FINGERPRINTED_CACHE_CONTROL = "max-age=604800, private, immutable"
+HTML_CACHE_CONTROL = "no-cache, no-store, must-revalidate"
+REVALIDATE_CACHE_CONTROL = "no-cache"  # anything else may be cached, but must be revalidated (cheaply, via the ETag)
+
+FINGERPRINTED_PATH_PREFIXES = ("_nuxt/",)  # Nuxt puts a content hash in the filename of everything under here
+COMPRESSIBLE_SUFFIXES = frozenset({".css", ".html", ".ico", ".js", ".json", ".map", ".mjs", ".svg", ".txt", ".xml"})
+MIN_COMPRESSIBLE_SIZE_BYTES = 1024  # below roughly one packet, the compression overhead outweighs the savings
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}  # in preference order
+
+
+class EncodedVariant(NamedTuple):
+    content_encoding: str
+    etag: str
+    body: bytes
+
+
+class StaticAsset(NamedTuple):
+    """The content identity and compressed variants of one file, valid for as long as its mtime and size match."""
+
+    mtime_ns: int
+    size: int
+    etag: str
+    variants: tuple[EncodedVariant, ...]
+
+
+def quoted_etag(content_hash: str, content_encoding: str | None = None) -> str:
+    if content_encoding is None:
+        return f'"{content_hash}"'
+    return f'"{content_hash}-{content_encoding}"'
+
+
+def build_static_asset(full_path: Path, stat_result: os.stat_result) -> StaticAsset:
+    """Hash the file for a strong ETag and collect its compressed variants.
+
+    Variants precompressed at build time (``index.js.br`` next to ``index.js``) are used as-is; gzip is otherwise
+    computed here, once, so later requests serve it from memory.
+    """
+    with full_path.open("rb") as file:
+        # hashed in chunks, since only the files compressed below (not e.g. large images or fonts) need to be in memory
+        content_hash = hashlib.file_digest(file, "sha256").hexdigest()[:32]
+    variants: list[EncodedVariant] = []
+    if full_path.suffix in COMPRESSIBLE_SUFFIXES and stat_result.st_size >= MIN_COMPRESSIBLE_SIZE_BYTES:
+        for content_encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+            precompressed_path = full_path.with_name(full_path.name + suffix)
+            if precompressed_path.is_file():
+                body = precompressed_path.read_bytes()
+            elif content_encoding == "gzip":
+                body = gzip.compress(full_path.read_bytes(), compresslevel=9, mtime=0)
+            else:
+                continue  # brotli is only available when precompressed at build time
+            if len(body) < stat_result.st_size:
+                variants.append(EncodedVariant(content_encoding, quoted_etag(content_hash, content_encoding), body))
+    return StaticAsset(
+        mtime_ns=stat_result.st_mtime_ns,
+        size=stat_result.st_size,
+        etag=quoted_etag(content_hash),
+        variants=tuple(variants),
+    )
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    accepted: set[str] = set()
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.strip().partition(";")
+        quality = params.strip().removeprefix("q=").strip()
+        if quality != "" and quality.strip("0.") == "":
+            continue  # q=0 explicitly refuses the coding
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """Serve static files with strong ETags, compressed variants and a cache policy matching the nginx deployment.
+
+    The hashing and compressing happens in ``lookup_path``, which Starlette already runs in a worker thread, so the
+    event loop only ever serves a cached entry. Entries are rebuilt whenever a file's mtime or size changes.
+    """
+
+    def __init__(self, *, directory: str | os.PathLike[str], html: bool = False) -> None:
+        super().__init__(directory=directory, html=html)
+        self._assets: dict[str, StaticAsset] = {}
+        self._assets_lock = threading.Lock()
+
+    def _get_asset(self, full_path: str, stat_result: os.stat_result) -> StaticAsset:
+        asset = self._assets.get(full_path)
+        if asset is not None and asset.mtime_ns == stat_result.st_mtime_ns and asset.size == stat_result.st_size:
+            return asset
+        asset = build_static_asset(Path(full_path), stat_result)
+        with self._assets_lock:
+            self._assets[full_path] = asset
+        return asset
+
+    def cache_control_for(self, full_path: str) -> str:
+        if full_path.endswith(".html"):
+            return HTML_CACHE_CONTROL
+        assert self.directory is not None, "Expected the static files directory to be configured"
+        relative_path = Path(full_path).relative_to(Path(self.directory).resolve()).as_posix()
+        if relative_path.startswith(FINGERPRINTED_PATH_PREFIXES):
+            return FINGERPRINTED_CACHE_CONTROL
+        return REVALIDATE_CACHE_CONTROL
+
+    @override
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is not None and os.path.isfile(full_path):  # noqa: PTH113 # stay consistent with the str paths Starlette hands us
+            _ = self._get_asset(full_path, stat_result)
+        return full_path, stat_result
+
+    @override
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        full_path = str(full_path)
+        asset = self._get_asset(full_path, stat_result)
+        request_headers = Headers(scope=scope)
+        headers = {"Cache-Control": self.cache_control_for(full_path)}
+        if headers["Cache-Control"] == HTML_CACHE_CONTROL:
+            headers["Pragma"] = "no-cache"  # for HTTP/1.0 caches that ignore Cache-Control
+            headers["Expires"] = "0"
+        if len(asset.variants) > 0:
+            headers["Vary"] = "Accept-Encoding"
+        accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+        variant = next((v for v in asset.variants if v.content_encoding in accepted), None)
+        headers["ETag"] = asset.etag if variant is None else variant.etag
+
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None and etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        if variant is None:
+            return FileResponse(full_path, status_code=status_code, stat_result=stat_result, headers=headers)
+        headers["Content-Encoding"] = variant.content_encoding
+        media_type, _ = mimetypes.guess_type(full_path)
+        return Response(
+            content=variant.body,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type if media_type is not None else "text/plain",  # the same fallback FileResponse uses
+        )
+
+
+def use_precompressed_static_files(app: FastAPI, *, mount_name: str) -> None:
+    """Swap the plain ``StaticFiles`` behind an already-mounted route (e.g. the Swagger assets that fastapi_offline mounts)."""
+    for route in app.routes:
+        if isinstance(route, Mount) and route.name == mount_name:
+            existing = route.app
+            assert isinstance(existing, StaticFiles), (
+                f"Expected the {mount_name} mount to be StaticFiles, got {type(existing)}"
+            )
+            assert existing.directory is not None, f"Expected the {mount_name} mount to serve a directory"
+            route.app = PrecompressedStaticFiles(directory=existing.directory, html=existing.html)
+            return
+    raise NotImplementedError(f"No mount named {mount_name} found")
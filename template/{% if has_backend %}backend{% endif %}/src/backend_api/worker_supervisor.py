@@ -0,0 +1,131 @@
+import logging
+import multiprocessing
+import socket
+import threading
+from collections.abc import Callable
+from functools import partial
+from typing import NamedTuple
+from typing import override
+
+import uvicorn
+from uvicorn.config import STARTUP_FAILURE
+from uvicorn.supervisors.multiprocess import Process
+
+from .graceful_shutdown import GRACEFUL_SHUTDOWN
+from .logger_config import LogQueueConfig
+from .logger_config import configure_logging
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerLogging(NamedTuple):
+    log_filename_prefix: str
+    log_queue: LogQueueConfig | None = None
+
+
+class WorkerProcess(Process):
+    """A uvicorn worker process that configures the app's logging before it starts serving.
+
+    Spawned children start from a fresh interpreter, so the logging configured in the supervisor does not carry
+    over. Each worker writes to its own log file, since several processes rotating one file would clobber each other.
+    """
+
+    def __init__(
+        self,
+        config: uvicorn.Config,
+        sockets: list[socket.socket],
+        *,
+        configure_child_logging: Callable[[], None],  # must be picklable, since it is sent to the spawned child
+        request_shutdown: Callable[[], None],  # likewise, so this is bound to an event shared with the supervisor
+    ) -> None:
+        self._configure_child_logging = configure_child_logging
+        self._request_shutdown = request_shutdown
+        super().__init__(config, sockets)
+
+    @override
+    def target(  # pragma: no cover # runs in the child process
+        self, sockets: list[socket.socket] | None = None
+    ) -> None:
+        self._configure_child_logging()
+        # stopping just this worker would only get it respawned, so /api/shutdown asks the supervisor to stop them all
+        assert self.config.timeout_graceful_shutdown is not None, (
+            "Expected a drain deadline, so a shutdown can't hang forever"
+        )
+        GRACEFUL_SHUTDOWN.install(
+            request_stop=self._request_shutdown, drain_timeout_seconds=self.config.timeout_graceful_shutdown
+        )
+        super().target(sockets)
+
+
+class WorkerSupervisor:
+    """Pre-fork a fixed number of uvicorn workers that share one listening socket, respawning any that die.
+
+    This mirrors uvicorn's own ``Multiprocess`` supervisor, but is driven by the same ``stop_event`` as the
+    single-process server instead of installing its own signal handlers, so it works when the app runner is invoked
+    off the main thread (e.g. from the Windows service worker). Setting the event terminates every child
+    (SIGTERM, or CTRL_BREAK on Windows), which uvicorn inside the child turns into a graceful shutdown. A worker
+    serving ``/api/shutdown`` sets a shared event that stops the supervisor the same way.
+    """
+
+    def __init__(
+        self,
+        *,
+        config: uvicorn.Config,
+        sockets: list[socket.socket],
+        stop_event: threading.Event,
+        worker_logging: WorkerLogging,
+        health_check_interval: float = 0.5,
+    ) -> None:
+        self._config = config
+        self._sockets = sockets
+        self._stop_event = stop_event
+        self._worker_logging = worker_logging
+        self._health_check_interval = health_check_interval
+        self.processes: list[WorkerProcess] = []
+        self.shutdown_requested = multiprocessing.get_context(
+            "spawn"
+        ).Event()  # the context uvicorn spawns workers with
+
+    def _spawn(self, worker_index: int) -> WorkerProcess:
+        process = WorkerProcess(
+            self._config,
+            self._sockets,
+            configure_child_logging=partial(
+                configure_logging,
+                log_filename_prefix=f"{self._worker_logging.log_filename_prefix}worker{worker_index}-",
+                log_level=str(self._config.log_level).upper(),
+                log_queue=self._worker_logging.log_queue,
+            ),
+            request_shutdown=self.shutdown_requested.set,
+        )
+        process.start()
+        logger.info(f"Started worker {worker_index} in process [{process.pid}]")
+        return process
+
+    def _respawn_dead_workers(self) -> None:
+        for worker_index, process in enumerate(self.processes):
+            if process.is_alive(timeout=self._config.timeout_worker_healthcheck):
+                continue
+            process.kill()  # it may be alive but hung, so make sure it is gone before replacing it
+            process.join()
+            if process.exitcode == STARTUP_FAILURE:
+                # the app, socket or config is broken and every replacement would fail the same way, so stop instead of crash-looping
+                logger.error(f"Worker {worker_index} [{process.pid}] failed to start up, shutting down all workers")
+                self._stop_event.set()
+                return
+            logger.warning(f"Worker {worker_index} [{process.pid}] died with exit code {process.exitcode}, respawning")
+            self.processes[worker_index] = self._spawn(worker_index)
+
+    def run(self) -> None:
+        self.processes = [self._spawn(worker_index) for worker_index in range(self._config.workers)]
+        while not self._stop_event.wait(self._health_check_interval):
+            if self.shutdown_requested.is_set():
+                logger.info("A worker received a shutdown request")
+                self._stop_event.set()
+                break
+            self._respawn_dead_workers()
+        logger.info(f"Stopping {len(self.processes)} worker processes")
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            process.join()
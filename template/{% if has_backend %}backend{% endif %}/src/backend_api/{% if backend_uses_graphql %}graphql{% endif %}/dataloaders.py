@@ -0,0 +1,78 @@
+# Per-request DataLoaders, so nested resolvers batch their lookups instead of making one call per parent (N+1)
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Sequence
+from typing import cast
+
+from backend_api.metrics import METRICS
+from backend_api.metrics import MetricsRegistry
+from strawberry.dataloader import DataLoader
+from strawberry.fastapi import BaseContext
+
+type BatchLoadFn[K: Hashable, V] = Callable[[list[K]], Awaitable[Sequence[V | BaseException]]]
+
+
+class BatchStats:
+    """How many calls a loader's batch function got during one request, and how many keys they covered."""
+
+    def __init__(self) -> None:
+        self.batches = 0
+        self.keys = 0
+        self.max_batch_size = 0
+
+    def observe(self, batch_size: int) -> None:
+        self.batches += 1
+        self.keys += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+
+
+class DataLoaderRegistry:
+    """Creates one DataLoader per batch function on first use, and is thrown away with the request it was made for.
+
+    Declare one async batch function per key type, which takes a list of keys and returns their values in the same
+    order, and load through the request's registry from a resolver::
+
+        @strawberry.field
+        async def latest_measurement(self, info: strawberry.Info[GraphQLContext, None]) -> Measurement:
+            return await info.context.loaders.get(load_latest_measurements).load(self.id)
+
+    Every `load` made in the same event loop tick reaches the batch function as one call, and each key is loaded at
+    most once per request. Nothing is kept between requests, so each request sees fresh values. Batch sizes are
+    recorded both here (for the current request) and in the process-wide metrics.
+    """
+
+    def __init__(self, *, metrics: MetricsRegistry = METRICS) -> None:
+        self._metrics = metrics
+        self._loaders: dict[Callable[..., object], DataLoader[Hashable, object]] = {}
+        self.batch_stats: dict[str, BatchStats] = {}
+
+    def get[K: Hashable, V](self, load_fn: BatchLoadFn[K, V]) -> DataLoader[K, V]:
+        loader = self._loaders.get(load_fn)
+        if loader is None:
+            loader = self._loaders[load_fn] = cast(  # keyed by the batch function, so the types match it
+                "DataLoader[Hashable, object]", DataLoader(load_fn=self._counted(load_fn))
+            )
+        return cast("DataLoader[K, V]", loader)
+
+    def _counted[K: Hashable, V](self, load_fn: BatchLoadFn[K, V]) -> BatchLoadFn[K, V]:
+        name = load_fn.__qualname__
+        stats = self.batch_stats.setdefault(name, BatchStats())
+
+        async def counted_load_fn(keys: list[K]) -> Sequence[V | BaseException]:
+            stats.observe(len(keys))
+            self._metrics.observe_dataloader_batch(name, len(keys))
+            return await load_fn(keys)
+
+        return counted_load_fn
+
+
+class GraphQLContext(BaseContext):
+    def __init__(self) -> None:
+        super().__init__()
+        self.loaders = DataLoaderRegistry()
+
+
+async def get_graphql_context() -> GraphQLContext:
+    """Build a fresh context (and so fresh DataLoaders) for each GraphQL request."""
+    return GraphQLContext()
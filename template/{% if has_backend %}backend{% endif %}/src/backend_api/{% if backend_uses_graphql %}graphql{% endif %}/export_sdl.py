@@ -0,0 +1,60 @@
+# Run at codegen time (`uv --directory=backend run python -m backend_api.graphql.export_sdl`) rather than whenever the
+# schema is imported, so starting the app never prints the schema or writes to its (possibly read-only) install directory
+import argparse
+import hashlib
+import sys
+from pathlib import Path
+
+import strawberry
+
+SDL_PATH = Path(__file__).with_name("schema.graphql")
+
+
+def render_sdl(schema: strawberry.Schema) -> str:
+    # without trailing whitespace, so the pre-commit hooks leave the file alone
+    return "\n".join(line.rstrip() for line in schema.as_str().splitlines()) + "\n"
+
+
+def is_sdl_current(sdl: str, path: Path) -> bool:
+    if not path.is_file():
+        return False
+    return hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(sdl.encode("utf-8")).digest()
+
+
+def export_sdl(schema: strawberry.Schema, path: Path = SDL_PATH) -> bool:
+    """Write the schema's SDL to the path, unless the file already holds exactly that. Returns whether it was written."""
+    sdl = render_sdl(schema)
+    if is_sdl_current(sdl, path):
+        return False
+    _ = path.write_bytes(sdl.encode("utf-8"))  # bytes, so the line endings are the same on every OS
+    return True
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description="Write the GraphQL schema as SDL, for the frontend's and the E2E tests' code generators"
+    )
+    _ = parser.add_argument("--output", type=Path, default=SDL_PATH, help="Where to write the SDL")
+    _ = parser.add_argument(
+        "--check", action="store_true", help="Don't write anything, just exit with 1 if the file is out of date"
+    )
+    args = parser.parse_args(argv)
+    output = args.output
+    assert isinstance(output, Path), f"Expected output to be a Path, got {type(output)}"
+
+    from .schema import schema  # noqa: PLC0415 # so `--help` doesn't have to build the schema
+
+    if args.check:
+        if is_sdl_current(render_sdl(schema), output):
+            return 0
+        print(f"{output} is out of date, run `python -m backend_api.graphql.export_sdl` to update it")  # noqa: T201 # this is a CLI
+        return 1
+    if export_sdl(schema, output):
+        print(f"Wrote the GraphQL schema to {output}")  # noqa: T201 # this is a CLI
+    else:
+        print(f"{output} is already up to date")  # noqa: T201 # this is a CLI
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+from collections.abc import AsyncGenerator
+from typing import cast
+
+logger = logging.getLogger(__name__)
+
+# enough to ride out a burst of events while a client is briefly busy, but a client that falls this far behind is
+# better off resubscribing (and fetching the current state) than being sent a backlog of stale updates
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class SlowSubscriberError(Exception):
+    def __init__(self, topic: str, queue_size: int):
+        super().__init__(f"Unsubscribed from '{topic}' after falling {queue_size} messages behind")
+
+
+class Topic[T]:
+    """A named stream of one type of message, declared once (e.g. at module level) and shared by both sides."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Topic({self.name!r})"
+
+
+class _Subscriber:
+    def __init__(self, queue_size: int) -> None:
+        self.queue: asyncio.Queue[object] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+
+class Broker:
+    """In-process publish/subscribe, so resolvers and background tasks can push updates to GraphQL subscriptions.
+
+    Publishing never blocks: each subscriber has a bounded queue, and a subscriber whose queue is full is dropped
+    (its subscription raises `SlowSubscriberError`, which the client sees as an error ending the subscription) rather
+    than slowing down the publisher or everyone else. Like the metrics registry, it has no lock, so only publish from
+    the event loop thread; from another thread, use `loop.call_soon_threadsafe(broker.publish, topic, message)`.
+    """
+
+    def __init__(self, *, subscriber_queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE) -> None:
+        self.subscriber_queue_size = subscriber_queue_size
+        self._subscribers: dict[str, set[_Subscriber]] = {}
+        self.dropped_subscribers = 0
+
+    def subscriber_count[T](self, topic: Topic[T]) -> int:
+        return len(self._subscribers.get(topic.name, ()))
+
+    def publish[T](self, topic: Topic[T], message: T) -> int:
+        """Queue the message for every current subscriber of the topic, and return how many that was."""
+        subscribers = self._subscribers.get(topic.name)
+        if subscribers is None:
+            return 0
+        delivered = 0
+        for subscriber in list(subscribers):
+            try:
+                subscriber.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                subscriber.dropped = True
+                subscribers.discard(subscriber)
+                self.dropped_subscribers += 1
+                logger.warning(
+                    f"Dropped a subscriber to {topic.name} that fell {self.subscriber_queue_size} messages behind"
+                )
+            else:
+                delivered += 1
+        return delivered
+
+    async def subscribe[T](self, topic: Topic[T]) -> AsyncGenerator[T]:
+        """Yield every message published to the topic from now on, until the caller stops iterating."""
+        subscriber = _Subscriber(self.subscriber_queue_size)
+        subscribers = self._subscribers.setdefault(topic.name, set())
+        subscribers.add(subscriber)
+        try:
+            while True:
+                if subscriber.dropped:
+                    raise SlowSubscriberError(topic.name, self.subscriber_queue_size)
+                message = await subscriber.queue.get()
+                yield cast(
+                    "T", message
+                )  # only `publish` puts into the queue, and it takes a message of the topic's type
+        finally:
+            subscribers.discard(subscriber)
+            if len(subscribers) == 0 and self._subscribers.get(topic.name) is subscribers:
+                del self._subscribers[topic.name]
+
+
+BROKER = Broker()
@@ -1,9 +1,13 @@
 import logging
-from pathlib import Path
 
 import strawberry
 from backend_api.entrypoint.parser import get_version
 from backend_api.strawberry_router import AddErrorTrace
+from backend_api.strawberry_router import CacheParsedAndValidatedDocuments
+from backend_api.strawberry_router import LimitQueryCost
+from backend_api.strawberry_router import TraceResolvers
+from backend_api.strawberry_router import is_tracing_enabled
+from strawberry.extensions import SchemaExtension
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +24,11 @@ class Query:
         return SystemType(version=get_version())
 
 
-schema = strawberry.Schema(query=Query, extensions=[AddErrorTrace])
-sdl_path = Path(__file__).parent / "schema.graphql"
-schema_lines = [line.rstrip() for line in schema.as_str().splitlines()]
-_ = sdl_path.write_text("\n".join(schema_lines) + "\n")
-_ = sdl_path.write_text(f"{schema.as_str()}\n")
+extensions: list[SchemaExtension | type[SchemaExtension]] = [
+    AddErrorTrace,
+    CacheParsedAndValidatedDocuments,
+    LimitQueryCost(),
+]
+if is_tracing_enabled():
+    extensions.insert(0, TraceResolvers())
+schema = strawberry.Schema(query=Query, extensions=extensions)
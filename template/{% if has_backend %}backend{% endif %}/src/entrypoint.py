@@ -2,13 +2,34 @@ import pip_system_certs.wrapt_requests
 
 # ruff: noqa: E402 # we need to inject the truststore before we import anything else
 pip_system_certs.wrapt_requests.inject_truststore()
+import multiprocessing
 import sys
 
-from backend_api.app_def import app  # noqa: F401 # this needs to be imported for the FastAPI app to actually launch
+multiprocessing.freeze_support()  # lets PyInstaller executables act as the spawned child when serving with --workers
+
+from typing import TYPE_CHECKING
+
 from backend_api.entrypoint.cli import entrypoint
 
-exit_code = entrypoint(sys.argv[1:])
-if (  # needed to enable using hot-reloading with uvicorn. if we always call sys.exit even with 0, then the FastAPI app won't work correctly when launched directly by uvicorn
-    exit_code != 0
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+
+def __getattr__(name: str) -> "FastAPI":
+    # `uvicorn src.entrypoint:app` (hot reloading) looks the app up here, but importing it (FastAPI, pydantic, the
+    # routers...) costs as much as booting the server, so --version, --help and `service` commands skip it entirely
+    if name == "app":
+        from backend_api.app_def import app  # noqa: PLC0415 # deferred so the light commands never import the app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003 # same message Python gives for a missing module attribute
+
+
+if (  # with --workers, each spawned worker re-imports this module as __mp_main__; only the supervisor should parse argv and start serving
+    __name__ != "__mp_main__"
 ):
-    sys.exit(exit_code)
+    exit_code = entrypoint(sys.argv[1:])
+    if (  # needed to enable using hot-reloading with uvicorn. if we always call sys.exit even with 0, then the FastAPI app won't work correctly when launched directly by uvicorn
+        exit_code != 0
+    ):
+        sys.exit(exit_code)
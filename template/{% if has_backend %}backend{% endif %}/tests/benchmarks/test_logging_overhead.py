@@ -0,0 +1,94 @@
+import logging
+import statistics
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+from backend_api import configure_logging
+from backend_api.logger_config import LogQueueConfig
+from backend_api.logger_config import flush_log_queue
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+logger = logging.getLogger(__name__)
+
+REQUESTS = 300
+LOG_LINES_PER_REQUEST = 20
+# a server that isn't saturated has idle time between requests, which is when the listener thread catches up; with no
+# idle time at all, both modes do the same formatting work while holding the GIL, just on different threads
+IDLE_SECONDS_BETWEEN_REQUESTS = 0.01
+
+
+class Timings(NamedTuple):
+    request_latencies: list[float]
+    loop_blocked_by_logging: list[float]
+
+
+def _build_chatty_app(loop_blocked_by_logging: list[float]) -> FastAPI:
+    chatty_app = FastAPI()
+
+    @chatty_app.get("/chatty")
+    async def chatty() -> dict[str, int]:  # async, so the logging happens on the event loop like most route code
+        start = time.perf_counter()
+        for index in range(LOG_LINES_PER_REQUEST):
+            logger.info(f"Handling step {index} of the request", extra={"step": index})
+        loop_blocked_by_logging.append(time.perf_counter() - start)
+        return {"steps": LOG_LINES_PER_REQUEST}
+
+    return chatty_app
+
+
+def _measure(client: TestClient, timings: Timings) -> None:
+    for _ in range(REQUESTS):
+        start = time.perf_counter()
+        _ = client.get("/chatty")
+        timings.request_latencies.append(time.perf_counter() - start)
+        time.sleep(IDLE_SECONDS_BETWEEN_REQUESTS)
+
+
+def _written_step_count(log_filename_prefix: str) -> int:
+    lines = Path(f"{log_filename_prefix}backend.log").read_text().splitlines()
+    return sum(1 for line in lines if "Handling step" in line)  # the test client logs each request too
+
+
+@pytest.fixture(autouse=True)
+def isolate_app_logging() -> Iterator[None]:
+    # pytest's own capture handlers format every record on the calling thread in both modes, which would drown out the difference being measured
+    root_logger = logging.getLogger()
+    pytest_handlers = list(root_logger.handlers)
+    for handler in pytest_handlers:
+        root_logger.removeHandler(handler)
+    yield
+    configure_logging(log_filename_prefix="logs/pytest-")
+    for handler in pytest_handlers:
+        root_logger.addHandler(handler)
+
+
+def test_request_latency_with_heavy_logging__direct_vs_queued(tmp_path: Path):
+    results: dict[str, Timings] = {}
+    for mode, log_queue in (("direct", None), ("queued", LogQueueConfig(max_size=100_000))):
+        log_filename_prefix = f"{tmp_path}/{mode}-"
+        configure_logging(log_filename_prefix=log_filename_prefix, suppress_console_logging=True, log_queue=log_queue)
+        timings = Timings(request_latencies=[], loop_blocked_by_logging=[])
+        client = TestClient(_build_chatty_app(timings.loop_blocked_by_logging))
+        _ = client.get("/chatty")  # warm up
+        timings.loop_blocked_by_logging.clear()
+        _measure(client, timings)
+        flush_log_queue()
+        assert _written_step_count(log_filename_prefix) == (REQUESTS + 1) * LOG_LINES_PER_REQUEST  # nothing lost
+        results[mode] = timings
+
+    for mode, timings in results.items():
+        latency = statistics.quantiles(timings.request_latencies, n=100)
+        print(  # noqa: T201 # the app's log handlers are being benchmarked, so report outside of them
+            f"{mode}: request p50={latency[49] * 1e3:.2f}ms p99={latency[98] * 1e3:.2f}ms, "
+            f"event loop blocked by logging p50={statistics.median(timings.loop_blocked_by_logging) * 1e3:.2f}ms "
+            f"for {LOG_LINES_PER_REQUEST} log lines per request"
+        )
+    # end-to-end latency only improves when the listener thread isn't competing for the GIL (i.e. while the file
+    # write is stalled on I/O), so the stable signal is how long the route's own logging calls hold up the event loop
+    assert statistics.median(results["queued"].loop_blocked_by_logging) < statistics.median(
+        results["direct"].loop_blocked_by_logging
+    )
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+import time
+
+from backend_api.metrics import MetricsMiddleware
+from backend_api.metrics import MetricsRegistry
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+logger = logging.getLogger(__name__)
+
+REQUESTS_PER_ROUND = 20_000
+ROUNDS = 5
+# generous enough not to flake on a shared CI runner, while still catching a regression to e.g. BaseHTTPMiddleware (~50µs+)
+MAX_OVERHEAD_PER_REQUEST_SECONDS = 20e-6
+
+
+async def _bare_endpoint(scope: Scope, receive: Receive, send: Send) -> None:  # noqa: ARG001 # matches the ASGI signature
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message: Message) -> None:
+    pass
+
+
+async def _seconds_per_request(asgi_app: ASGIApp) -> float:
+    scope: Scope = {"type": "http", "method": "GET", "path": "/api/healthcheck", "root_path": "", "headers": []}
+    best = float("inf")
+    for _ in range(ROUNDS):  # best-of-N filters out the rounds that got interrupted by something else on the machine
+        start = time.perf_counter()
+        for _ in range(REQUESTS_PER_ROUND):
+            await asgi_app(dict(scope, endpoint=_bare_endpoint), _receive, _send)
+        best = min(best, (time.perf_counter() - start) / REQUESTS_PER_ROUND)
+    return best
+
+
+def test_metrics_middleware_overhead_per_request():
+    bare = asyncio.run(_seconds_per_request(_bare_endpoint))
+    instrumented = asyncio.run(_seconds_per_request(MetricsMiddleware(_bare_endpoint, registry=MetricsRegistry())))
+
+    overhead = instrumented - bare
+    logger.info(
+        f"Metrics middleware overhead: {overhead * 1e6:.2f}µs per request "
+        f"(bare ASGI app {bare * 1e6:.2f}µs, instrumented {instrumented * 1e6:.2f}µs)"
+    )
+    assert overhead < MAX_OVERHEAD_PER_REQUEST_SECONDS
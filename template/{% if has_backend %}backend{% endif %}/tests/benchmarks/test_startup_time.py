@@ -0,0 +1,238 @@
+import json
+import logging
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from pathlib import Path
+from typing import NamedTuple
+
+import httpx
+import pytest
+from pydantic import JsonValue
+
+from ..e2e.app_bootup import EXE_FILE_PATH
+from ..e2e.app_bootup import get_images_from_compose
+from ..e2e.app_bootup import get_random_open_port
+from ..e2e.app_bootup import image_exists_locally
+from ..e2e.jinja_constants import BACKEND_PORT
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).parents[2]
+# one JSON file per mode, so CI jobs that each measure a different mode can upload them side by side
+RESULTS_DIR = BACKEND_DIR / "dist" / "startup-benchmark"
+# budgets are generous by default, so a shared CI runner doesn't flake; tighten them per machine through the environment
+STARTUP_BUDGET_ENV_VAR_NAME = "BACKEND_STARTUP_BUDGET_SECONDS"
+DEFAULT_STARTUP_BUDGET_SECONDS = 20.0
+APP_IMPORT_BUDGET_ENV_VAR_NAME = "BACKEND_APP_IMPORT_BUDGET_SECONDS"
+DEFAULT_APP_IMPORT_BUDGET_SECONDS = 3.0
+APP_MODULE = "backend_api.app_def"
+SLOWEST_IMPORTS_TO_RECORD = 25
+HEALTHCHECK_POLL_INTERVAL_SECONDS = 0.02
+# `python -X importtime` (or PYTHONPROFILEIMPORTTIME) writes one line per module to stderr, with the module name
+# indented by how deeply it was nested inside other imports
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$", re.MULTILINE)
+
+
+class StartupMode(StrEnum):
+    SOURCE = "source"
+    DOCKER = "docker"
+    PYINSTALLER = "pyinstaller"
+
+
+class StartedBackend(NamedTuple):
+    port: int
+    stop: Callable[[], str]  # stops the backend, and returns what it wrote to stderr
+
+
+class ImportTimes(NamedTuple):
+    total_seconds: float
+    cumulative_seconds_by_module: dict[str, float]
+
+
+def _budget(env_var_name: str, default: float) -> float:
+    return float(os.environ.get(env_var_name, default))
+
+
+def parse_import_times(stderr: str) -> ImportTimes | None:
+    cumulative_seconds_by_module: dict[str, float] = {}
+    total_microseconds = 0
+    for match in _IMPORT_TIME_LINE.finditer(stderr):
+        cumulative_microseconds = int(match.group(2))
+        module = match.group(4)
+        _ = cumulative_seconds_by_module.setdefault(module, cumulative_microseconds / 1e6)
+        if match.group(3) == "":  # only top-level imports, since the nested ones are included in their parents' time
+            total_microseconds += cumulative_microseconds
+    if len(cumulative_seconds_by_module) == 0:
+        return None
+    return ImportTimes(
+        total_seconds=total_microseconds / 1e6, cumulative_seconds_by_module=cumulative_seconds_by_module
+    )
+
+
+def _stop_via_shutdown_route(process: subprocess.Popen[bytes], port: int) -> None:
+    try:
+        _ = httpx.get(f"http://127.0.0.1:{port}/api/shutdown", timeout=15.0)
+        _ = process.wait(timeout=15)
+    except (httpx.HTTPError, subprocess.TimeoutExpired):
+        logger.exception("The backend did not shut down cleanly, killing it")
+        process.kill()
+        _ = process.wait(timeout=10)
+
+
+def _start_process(command: list[str], *, env: dict[str, str], tmp_path: Path) -> StartedBackend:
+    port = get_random_open_port()
+    stderr_path = tmp_path / "stderr.log"
+    # to files rather than pipes, since the import timings alone can fill a pipe's buffer and block the backend
+    with stderr_path.open("wb") as stderr, (tmp_path / "stdout.log").open("wb") as stdout:
+        process = subprocess.Popen(  # noqa: S603 # we trust this input
+            [*command, "--port", str(port), "--host", "127.0.0.1", "--log-folder", str(tmp_path / "logs")],
+            cwd=BACKEND_DIR,
+            env=env,
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+    def stop() -> str:
+        _stop_via_shutdown_route(process, port)
+        return stderr_path.read_text(encoding="utf-8", errors="replace")
+
+    return StartedBackend(port=port, stop=stop)
+
+
+def _start_source(tmp_path: Path) -> StartedBackend:
+    return _start_process(
+        [sys.executable, "-X", "importtime", "src/entrypoint.py"], env=os.environ.copy(), tmp_path=tmp_path
+    )
+
+
+def _start_pyinstaller(tmp_path: Path) -> StartedBackend:
+    if not EXE_FILE_PATH.exists():
+        pytest.skip(f"The PyInstaller executable has not been built at {EXE_FILE_PATH}")
+    # the frozen interpreter may ignore this, in which case only the time to the first healthcheck is recorded
+    env = {**os.environ, "PYTHONPROFILEIMPORTTIME": "1"}
+    return _start_process([str(EXE_FILE_PATH)], env=env, tmp_path=tmp_path)
+
+
+def _start_docker(tmp_path: Path) -> StartedBackend:  # noqa: ARG001 # same signature as the other modes
+    compose_file = BACKEND_DIR.parent / "docker-compose.yaml"
+    if shutil.which("docker") is None or not compose_file.exists():
+        pytest.skip("The backend is not deployed with docker here")
+    image = next((image for image in get_images_from_compose(compose_file, services=["backend"])), None)
+    if image is None or not image_exists_locally(image):
+        pytest.skip(f"The backend image {image} has not been built")
+    port = get_random_open_port()
+    container_id = subprocess.run(  # noqa: S603 # we trust this input
+        [  # noqa: S607 # docker should definitely be in PATH
+            "docker",
+            "run",
+            "--detach",
+            "--env",
+            "PYTHONPROFILEIMPORTTIME=1",
+            "--publish",
+            f"{port}:{BACKEND_PORT}",
+            image,
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    ).stdout.strip()
+
+    def stop() -> str:
+        logs = subprocess.run(  # noqa: S603 # we trust this input
+            ["docker", "logs", container_id],  # noqa: S607 # docker should definitely be in PATH
+            check=True,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        _ = subprocess.run(  # noqa: S603 # we trust this input
+            ["docker", "rm", "--force", container_id],  # noqa: S607 # docker should definitely be in PATH
+            check=True,
+            capture_output=True,
+            timeout=30,
+        )
+        return logs.stderr
+
+    return StartedBackend(port=port, stop=stop)
+
+
+_STARTERS: dict[StartupMode, Callable[[Path], StartedBackend]] = {
+    StartupMode.SOURCE: _start_source,
+    StartupMode.DOCKER: _start_docker,
+    StartupMode.PYINSTALLER: _start_pyinstaller,
+}
+
+
+def _seconds_until_healthy(port: int, *, start: float, timeout: float) -> float | None:
+    url = f"http://127.0.0.1:{port}/api/healthcheck"
+    while time.perf_counter() - start < timeout:
+        try:
+            if httpx.get(url, timeout=1.0).is_success:
+                return time.perf_counter() - start
+        except httpx.HTTPError:
+            pass
+        time.sleep(HEALTHCHECK_POLL_INTERVAL_SECONDS)
+    return None
+
+
+def _write_results(mode: StartupMode, results: dict[str, JsonValue]) -> Path:
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    results_path = RESULTS_DIR / f"{mode}.json"
+    _ = results_path.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return results_path
+
+
+@pytest.mark.parametrize("mode", list(StartupMode))
+def test_startup_within_budget(mode: StartupMode, tmp_path: Path):
+    startup_budget = _budget(STARTUP_BUDGET_ENV_VAR_NAME, DEFAULT_STARTUP_BUDGET_SECONDS)
+    app_import_budget = _budget(APP_IMPORT_BUDGET_ENV_VAR_NAME, DEFAULT_APP_IMPORT_BUDGET_SECONDS)
+
+    start = time.perf_counter()
+    backend = _STARTERS[mode](tmp_path)
+    try:
+        # polled past the budget, so a regression still reports how slow it got rather than just that it was too slow
+        seconds_to_healthy = _seconds_until_healthy(backend.port, start=start, timeout=startup_budget * 3)
+    finally:
+        stderr = backend.stop()
+
+    import_times = parse_import_times(stderr)
+    app_import_seconds = None if import_times is None else import_times.cumulative_seconds_by_module.get(APP_MODULE)
+    slowest_imports: list[JsonValue] = []
+    if import_times is not None:
+        slowest = sorted(import_times.cumulative_seconds_by_module.items(), key=lambda item: item[1], reverse=True)
+        slowest_imports = [
+            {"module": module, "cumulativeSeconds": seconds} for module, seconds in slowest[:SLOWEST_IMPORTS_TO_RECORD]
+        ]
+    results_path = _write_results(
+        mode,
+        {
+            "mode": str(mode),
+            "platform": platform.platform(),
+            "secondsToFirstHealthcheck": seconds_to_healthy,
+            "startupBudgetSeconds": startup_budget,
+            "totalImportSeconds": None if import_times is None else import_times.total_seconds,
+            "appImportSeconds": app_import_seconds,
+            "appImportBudgetSeconds": app_import_budget,
+            "slowestImports": slowest_imports,
+        },
+    )
+    logger.info(f"Startup benchmark for {mode}: {seconds_to_healthy}s to the first healthcheck, see {results_path}")
+
+    assert seconds_to_healthy is not None, f"The backend never became healthy, see {results_path}"
+    assert seconds_to_healthy <= startup_budget, (
+        f"Took {seconds_to_healthy:.2f}s to the first healthcheck, over the {startup_budget}s budget "
+        f"(set {STARTUP_BUDGET_ENV_VAR_NAME} to change it), see {results_path}"
+    )
+    if app_import_seconds is not None:
+        assert app_import_seconds <= app_import_budget, (
+            f"Importing {APP_MODULE} took {app_import_seconds:.2f}s, over the {app_import_budget}s budget "
+            f"(set {APP_IMPORT_BUDGET_ENV_VAR_NAME} to change it), see {results_path}"
+        )
@@ -12,4 +12,4 @@ import pytest
 # module is registered here, so a new top-level test package needs adding to this list. The subpackages are
 # named individually rather than registering `tests`, which is already imported by the time this conftest runs
 # and would only warn.
-pytest.register_assert_rewrite("tests.unit", "tests.e2e")
+pytest.register_assert_rewrite("tests.unit", "tests.e2e", "tests.benchmarks")
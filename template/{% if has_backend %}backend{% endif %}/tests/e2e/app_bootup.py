@@ -24,6 +24,7 @@ EXE_DIR_PATH = Path(__file__).parent.parent.parent / "dist" / APP_NAME
 E2E_BACKEND_LOG_DIR = Path(__file__).parent.parent.parent / "dist" / "e2e-backend-logs"
 EXE_FILE_NAME = APP_NAME + (".exe" if IS_WINDOWS else "")
 EXE_FILE_PATH = EXE_DIR_PATH / EXE_FILE_NAME
+SHUTDOWN_DRAIN_TIMEOUT_SECONDS = 10.0  # the executable's default --shutdown-drain-timeout
 
 
 def get_random_open_port() -> int:
@@ -287,24 +288,21 @@ def start_exe(*, port: int, env: dict[str, str] | None = None) -> subprocess.Pop
 def stop_exe(*, process: subprocess.Popen[bytes], port: int):
     shutdown_url = f"http://localhost:{port}/api/shutdown"
     try:
-        response = httpx.get(shutdown_url, timeout=5.0)
+        # the response only comes back once the server has drained its in-flight requests
+        response = httpx.get(shutdown_url, timeout=SHUTDOWN_DRAIN_TIMEOUT_SECONDS + 5.0)
         if response.is_success:
-            logger.info("Shutdown request sent successfully.")
+            logger.info(f"Shutdown request completed: {response.json()}")
         else:
             logger.warning(f"Shutdown request returned status code {response.status_code}.")
     except httpx.HTTPError:
         logger.exception("Failed to send shutdown request")
 
-    # Poll to see if process shut down gracefully
-    max_attempts = 10
-    poll_interval = 0.5  # seconds
-    for attempt in range(max_attempts):
-        if process.poll() is not None:
-            logger.info(f"The /shutdown route successfully stopped the process. This took {attempt * poll_interval}s.")
-            return
-        time.sleep(poll_interval)
-
-    if process.poll() is None:
+    try:
+        # after draining, the server still runs the lifespan teardown and flushes its logs before exiting
+        _ = process.wait(timeout=10)
+        logger.info(f"The /shutdown route stopped the process with exit code {process.returncode}.")
+    except subprocess.TimeoutExpired:
+        logger.warning("The /shutdown route did not stop the process, terminating it.")
         process.terminate()
         try:
             _ = process.wait(timeout=10)
@@ -6,6 +6,10 @@ from typing import Any, Optional, TYPE_CHECKING, Union
 
 @dataclass
 class ShutdownResponse(Parsable):
+    # How many other requests were still running when the drain deadline passed, and will be cancelled
+    abandoned_requests: Optional[int] = None
+    # How many other in-flight requests finished before the server began exiting
+    drained_requests: Optional[int] = None
     # Message indicating the shutdown request was received
     message: Optional[str] = "Shutdown request received. Server will exit shortly."
     
@@ -26,6 +30,8 @@ class ShutdownResponse(Parsable):
         Returns: dict[str, Callable[[ParseNode], None]]
         """
         fields: dict[str, Callable[[Any], None]] = {
+            "abandonedRequests": lambda n : setattr(self, 'abandoned_requests', n.get_int_value()),
+            "drainedRequests": lambda n : setattr(self, 'drained_requests', n.get_int_value()),
             "message": lambda n : setattr(self, 'message', n.get_str_value()),
         }
         return fields
@@ -38,6 +44,8 @@ class ShutdownResponse(Parsable):
         """
         if writer is None:
             raise TypeError("writer cannot be null.")
+        writer.write_int_value("abandonedRequests", self.abandoned_requests)
+        writer.write_int_value("drainedRequests", self.drained_requests)
         writer.write_str_value("message", self.message)
     
 
@@ -1,3 +1,4 @@
+import logging
 import random
 import tempfile
 from collections.abc import Sequence
@@ -9,9 +10,15 @@ import pytest
 import uvicorn
 from backend_api import app_runner
 from backend_api.entrypoint.cli import entrypoint
+from backend_api.graceful_shutdown import DEFAULT_DRAIN_TIMEOUT_SECONDS
+from backend_api.graceful_shutdown import GRACEFUL_SHUTDOWN
 from backend_api.jinja_constants import APP_NAME
 from backend_api.jinja_constants import DEFAULT_DEPLOYED_HOST
 from backend_api.jinja_constants import DEPLOYED_PORT_NUMBER
+from backend_api.logger_config import BoundedQueueHandler
+from backend_api.logger_config import LogQueueConfig
+from backend_api.logger_config import LogQueueOverflowPolicy
+from backend_api.worker_supervisor import WorkerSupervisor
 from pytest_mock import MockerFixture
 
 from .fixtures import GENERIC_REQUIRED_CLI_ARGS
@@ -46,7 +53,9 @@ class TestCliArgParsing:
 
         self._run_entrypoint([f"--log-level={expected_log_level}"])
 
-        self.spied_configure_logging.assert_called_once_with(log_level=expected_log_level, log_filename_prefix=ANY)
+        self.spied_configure_logging.assert_called_once_with(
+            log_level=expected_log_level, log_filename_prefix=ANY, log_queue=ANY
+        )
 
     def test_Given_log_folder_specified__Then_log_folder_passed_to_configure_logging(self):
         self._spy_on_configure_logging()
@@ -58,6 +67,7 @@ class TestCliArgParsing:
         self.spied_configure_logging.assert_called_once_with(
             log_filename_prefix=str(Path(expected_log_folder) / f"{APP_NAME}-"),
             log_level=ANY,
+            log_queue=ANY,
         )
 
     def test_Given_log_level_specified__Then_log_level_passed_to_uvicorn(self):
@@ -98,8 +108,35 @@ class TestCliArgParsing:
         self._run_entrypoint(GENERIC_REQUIRED_CLI_ARGS)
 
         self.spied_configure_logging.assert_called_once_with(
-            log_filename_prefix=str(Path("logs") / f"{APP_NAME}-"), log_level="INFO"
+            log_filename_prefix=str(Path("logs") / f"{APP_NAME}-"), log_level="INFO", log_queue=None
+        )
+
+    def test_Given_log_queue_size_specified__Then_log_queue_passed_to_configure_logging(self):
+        expected_size = random.randint(1, 10000)
+        expected_policy = random.choice(list(LogQueueOverflowPolicy))
+        self._spy_on_configure_logging()
+        spied_flush_log_queue = self.mocker.spy(app_runner, app_runner.flush_log_queue.__name__)
+
+        self._run_entrypoint([f"--log-queue-size={expected_size}", f"--log-queue-overflow={expected_policy.value}"])
+
+        self.spied_configure_logging.assert_called_once_with(
+            log_filename_prefix=ANY, log_level=ANY, log_queue=LogQueueConfig(expected_size, expected_policy)
         )
+        spied_flush_log_queue.assert_called_once_with()
+        assert not any(isinstance(handler, BoundedQueueHandler) for handler in logging.getLogger().handlers)
+
+    def test_Given_shutdown_drain_timeout_specified__Then_used_by_uvicorn_and_the_shutdown_route(self):
+        expected_timeout = random.randint(1, 60)
+
+        self._run_entrypoint([f"--shutdown-drain-timeout={expected_timeout}"])
+
+        assert self._built_config().timeout_graceful_shutdown == expected_timeout
+        assert GRACEFUL_SHUTDOWN.drain_timeout_seconds == expected_timeout
+
+    def test_Given_no_args__Then_default_shutdown_drain_timeout_used(self):
+        self._run_entrypoint(GENERIC_REQUIRED_CLI_ARGS)
+
+        assert self._built_config().timeout_graceful_shutdown == DEFAULT_DRAIN_TIMEOUT_SECONDS
 
     def test_Given_no_args__Then_default_log_config_used_for_uvicorn(self):
         self._run_entrypoint(GENERIC_REQUIRED_CLI_ARGS)
@@ -110,3 +147,26 @@ class TestCliArgParsing:
         self._run_entrypoint(GENERIC_REQUIRED_CLI_ARGS)
 
         self.mocked_run.assert_called_once()
+
+    def test_Given_no_args__Then_single_server_run_without_worker_supervisor(self):
+        spied_supervisor_init = self.mocker.spy(WorkerSupervisor, WorkerSupervisor.__init__.__name__)
+
+        self._run_entrypoint(GENERIC_REQUIRED_CLI_ARGS)
+
+        spied_supervisor_init.assert_not_called()
+        self.mocked_run.assert_called_once()
+
+    def test_Given_workers_specified__Then_worker_supervisor_run_with_that_many_workers(self):
+        expected_workers = random.randint(2, 8)
+        _ = self.mocker.patch.object(uvicorn.Config, uvicorn.Config.bind_socket.__name__, autospec=True)
+        spied_supervisor_init = self.mocker.spy(WorkerSupervisor, WorkerSupervisor.__init__.__name__)
+        mocked_supervisor_run = self.mocker.patch.object(WorkerSupervisor, WorkerSupervisor.run.__name__, autospec=True)
+
+        self._run_entrypoint([f"--workers={expected_workers}", *GENERIC_REQUIRED_CLI_ARGS])
+
+        mocked_supervisor_run.assert_called_once()
+        self.mocked_run.assert_not_called()
+        built_config = spied_supervisor_init.call_args.kwargs["config"]
+        assert isinstance(built_config, uvicorn.Config)
+        assert built_config.workers == expected_workers
+        assert built_config.app == app_runner.APP_IMPORT_STRING
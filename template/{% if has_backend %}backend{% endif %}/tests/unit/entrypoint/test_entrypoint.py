@@ -1,3 +1,7 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
 from uuid import uuid4
 
 import pytest
@@ -10,6 +14,24 @@ from .fixtures import GENERIC_REQUIRED_CLI_ARGS
 from .fixtures import restore_logging_levels  # noqa: F401 # autouse fixture imported for side effect
 from .fixtures import restore_signal_handlers  # noqa: F401 # autouse fixture imported for side effect
 
+BACKEND_DIR = Path(__file__).parents[3]
+# what importing the app drags in; none of it should be needed to print the version or usage
+HEAVY_MODULES = ("backend_api.app_def", "backend_api.app_runner", "fastapi", "pydantic", "starlette", "uvicorn")
+# runs src/entrypoint.py as a fresh interpreter would, then reports which of the given modules got imported
+_ENTRYPOINT_PROBE = """\
+import json
+import runpy
+import sys
+
+argv, module_names = json.loads(sys.argv[1])
+sys.argv = ["entrypoint.py", *argv]
+try:
+    runpy.run_path("src/entrypoint.py", run_name="__main__")
+except SystemExit:
+    pass
+print(json.dumps([name for name in module_names if name in sys.modules]))
+"""
+
 
 def test_Given_invalid_cli_args__Then_exit_code_is_2():
     # TODO: capture the log message so the stderr is not overrun with log messages during testing
@@ -55,3 +77,35 @@ def test_Given_launched_directly_via_uvicorn__Then_return_zero():
     exit_code = entrypoint(["src.entrypoint:app"])
 
     assert exit_code == 0
+
+
+@pytest.mark.parametrize("argv", [["--version"], ["--help"]], ids=["version", "help"])
+def test_When_light_command__Then_app_not_imported(argv: list[str]):
+    result = subprocess.run(  # noqa: S603 # we trust this input
+        [sys.executable, "-c", _ENTRYPOINT_PROBE, json.dumps([argv, HEAVY_MODULES])],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imported_heavy_modules = json.loads(result.stdout.splitlines()[-1])
+    assert imported_heavy_modules == []
+
+
+def test_When_app_looked_up_on_entrypoint_module_like_uvicorn_does__Then_it_is_the_app():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import importlib, sys; sys.argv = ['uvicorn', 'src.entrypoint:app']; "
+            "from backend_api.app_def import app; "
+            "print(importlib.import_module('src.entrypoint').app is app)",
+        ],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.splitlines()[-1] == "True"
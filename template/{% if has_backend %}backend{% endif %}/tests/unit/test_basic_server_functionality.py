@@ -1,6 +1,3 @@
-import time
-
-from backend_api import app_def
 from backend_api import fast_api_exception_handlers
 from backend_api.app_def import HealthcheckResponse
 from backend_api.app_def import app
@@ -45,21 +42,6 @@ def test_When_swagger_route_called__Then_rendered():
     assert "Swagger UI" in response.text
 
 
-def test_When_shutdown_route_called__Then_system_exit(mocker: MockerFixture):
-    client = TestClient(app)
-    mocked_os_exit = mocker.patch.object(app_def.os, "_exit", autospec=True)
-
-    response = client.get("/api/shutdown")
-
-    assert response.status_code == codes.OK
-
-    for _ in range(1000):  # wait for the thread to finish
-        if mocked_os_exit.call_count > 0:
-            break
-        time.sleep(0.001)
-    mocked_os_exit.assert_called_once_with(0)
-
-
 def test_openapi_schema(snapshot_json: SnapshotAssertion, mocker: MockerFixture):
     client = TestClient(app)
     app.openapi_schema = None  # reset cache populated by other tests
@@ -0,0 +1,95 @@
+import asyncio
+import signal
+import threading
+from collections.abc import Callable
+
+import pytest
+from backend_api import app_def
+from backend_api import graceful_shutdown
+from backend_api.app_def import ShutdownResponse
+from backend_api.app_def import app
+from backend_api.graceful_shutdown import GracefulShutdown
+from backend_api.metrics import MetricsMiddleware
+from backend_api.metrics import MetricsRegistry
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import codes
+from pytest_mock import MockerFixture
+
+
+def _build_app(shutdown: GracefulShutdown, *, release_slow_request: threading.Event) -> tuple[FastAPI, MetricsRegistry]:
+    registry = MetricsRegistry()
+    draining_app = FastAPI()
+    draining_app.add_middleware(MetricsMiddleware, registry=registry)
+
+    @draining_app.get("/slow")
+    async def slow() -> None:
+        _ = await asyncio.to_thread(release_slow_request.wait)
+
+    @draining_app.get("/shutdown")
+    async def shut_down() -> dict[str, int]:
+        return (await shutdown.drain(registry))._asdict()
+
+    return draining_app, registry
+
+
+class TestDrain:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.release_slow_request = threading.Event()
+        self.stop_requests: list[None] = []
+
+    def _shutdown_with_a_slow_request_in_flight(self, shutdown: GracefulShutdown) -> dict[str, int]:
+        draining_app, registry = _build_app(shutdown, release_slow_request=self.release_slow_request)
+        with TestClient(draining_app) as client:
+            slow_request = threading.Thread(target=client.get, args=("/slow",), daemon=True)
+            slow_request.start()
+            try:
+                for _ in range(1000):
+                    if registry.requests_in_progress["GET"] > 0:
+                        break
+                    _ = threading.Event().wait(timeout=0.001)
+
+                response = client.get("/shutdown")
+            finally:
+                self.release_slow_request.set()
+                slow_request.join(timeout=2)
+        assert response.status_code == codes.OK
+        result: dict[str, int] = response.json()
+        return result
+
+    def _request_stop(self) -> Callable[[], None]:
+        def request_stop() -> None:
+            self.stop_requests.append(None)
+            self.release_slow_request.set()  # like a real server, stopping lets the in-flight request finish
+
+        return request_stop
+
+    def test_When_drained__Then_stop_requested_and_in_flight_request_waited_for(self):
+        shutdown = GracefulShutdown()
+        shutdown.install(request_stop=self._request_stop(), drain_timeout_seconds=5)
+
+        result = self._shutdown_with_a_slow_request_in_flight(shutdown)
+
+        assert result == {"drained": 1, "abandoned": 0}
+        assert len(self.stop_requests) == 1
+
+    def test_Given_request_outlives_deadline__When_drained__Then_reported_as_abandoned(self):
+        shutdown = GracefulShutdown()
+        shutdown.install(request_stop=lambda: None, drain_timeout_seconds=0)
+
+        result = self._shutdown_with_a_slow_request_in_flight(shutdown)
+
+        assert result == {"drained": 0, "abandoned": 1}
+
+
+def test_Given_nothing_installed__When_drained__Then_sigterm_raised_for_uvicorn_to_handle(mocker: MockerFixture):
+    mocked_raise_signal = mocker.patch.object(graceful_shutdown.signal, signal.raise_signal.__name__, autospec=True)
+    _ = mocker.patch.object(app_def, "GRACEFUL_SHUTDOWN", GracefulShutdown())
+    client = TestClient(app)
+
+    response = client.get("/api/shutdown")
+
+    assert response.status_code == codes.OK
+    assert ShutdownResponse.model_validate(response.json()).drained_requests == 0
+    mocked_raise_signal.assert_called_once_with(signal.SIGTERM)
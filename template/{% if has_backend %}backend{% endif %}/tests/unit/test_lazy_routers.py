@@ -0,0 +1,86 @@
+from collections.abc import Callable
+
+import pytest
+from backend_api.lazy_routers import LazyRouter
+from backend_api.lazy_routers import include_lazy_router
+from backend_api.lazy_routers import load_lazy_routers
+from fastapi import APIRouter
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from httpx import codes
+from starlette.routing import Mount
+from starlette.routing import NoMatchFound
+
+
+def _build_optional_router() -> APIRouter:
+    router = APIRouter()
+
+    @router.get("/things")
+    def list_things() -> list[str]:
+        return ["thing"]
+
+    return router
+
+
+def _build_app(spied_load: Callable[[], APIRouter]) -> tuple[FastAPI, LazyRouter]:
+    lazy_app = FastAPI()
+    lazy_router = include_lazy_router(lazy_app, load=spied_load, prefix="/api/optional", tags=["optional"])
+    lazy_app.mount("/", PlainTextResponse("catch-all"))  # like the static files, this must not shadow the lazy routes
+    return lazy_app, lazy_router
+
+
+class TestLazyRouter:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.load_count = 0
+        self.app, self.lazy_router = _build_app(self._counted_load)
+        self.client = TestClient(self.app)
+
+    def _counted_load(self) -> APIRouter:
+        self.load_count += 1
+        return _build_optional_router()
+
+    def test_When_nothing_under_prefix_requested__Then_not_loaded(self):
+        response = self.client.get("/api/optionalish")
+
+        assert response.text == "catch-all"
+        assert self.load_count == 0
+        assert self.lazy_router in self.app.router.routes
+
+    def test_When_requested__Then_loaded_and_served(self):
+        response = self.client.get("/api/optional/things")
+
+        assert response.status_code == codes.OK
+        assert response.json() == ["thing"]
+        assert self.lazy_router.loaded is True
+
+    def test_When_requested_again__Then_loaded_once(self):
+        for _ in range(3):
+            _ = self.client.get("/api/optional/things")
+
+        assert self.load_count == 1
+
+    def test_When_loaded__Then_routes_take_the_placeholders_place_before_the_catch_all(self):
+        self.lazy_router.load()
+
+        routes = self.app.router.routes
+        assert self.lazy_router not in routes
+        assert isinstance(routes[-1], Mount)
+        assert self.client.get("/api/optional/things").json() == ["thing"]
+
+    def test_Given_openapi_already_generated__When_loaded__Then_openapi_includes_new_routes(self):
+        assert "/api/optional/things" not in self.app.openapi()["paths"]
+
+        load_lazy_routers(self.app)
+
+        assert "/api/optional/things" in self.app.openapi()["paths"]
+        assert self.app.openapi()["paths"]["/api/optional/things"]["get"]["tags"] == ["optional"]
+
+    def test_When_url_looked_up_before_loading__Then_no_match(self):
+        with pytest.raises(NoMatchFound, match="list_things"):
+            _ = self.app.url_path_for("list_things")
+
+        self.lazy_router.load()
+
+        assert self.app.url_path_for("list_things") == "/api/optional/things"
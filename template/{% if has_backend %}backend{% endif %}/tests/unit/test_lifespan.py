@@ -0,0 +1,61 @@
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+import pytest
+from backend_api.lifespan import wrap_lifespan
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+class TestWrapLifespan:
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        self.events: list[str] = []
+        self.fail_startup = False
+
+        @asynccontextmanager
+        async def app_lifespan(_: FastAPI) -> AsyncGenerator[None]:
+            self.events.append("app startup")
+            if self.fail_startup:
+                raise RuntimeError("device not found")
+            yield
+            self.events.append("app teardown")
+
+        self.app = FastAPI(lifespan=app_lifespan)
+
+    def _on_startup(self) -> None:
+        self.events.append("startup")
+
+    async def _on_shutdown(self) -> None:
+        self.events.append("shutdown")
+
+    def test_When_app_runs__Then_called_inside_its_lifespan(self):
+        wrap_lifespan(self.app, self._on_startup, self._on_shutdown)
+
+        with TestClient(self.app):
+            pass
+
+        assert self.events == ["app startup", "startup", "shutdown", "app teardown"]
+
+    def test_Given_around_app_lifespan__When_app_runs__Then_called_around_its_lifespan(self):
+        wrap_lifespan(self.app, self._on_startup, self._on_shutdown, around_app_lifespan=True)
+
+        with TestClient(self.app):
+            pass
+
+        assert self.events == ["startup", "app startup", "app teardown", "shutdown"]
+
+    @pytest.mark.parametrize(
+        ("around_app_lifespan", "expected_events"),
+        [(False, ["app startup"]), (True, ["startup", "app startup", "shutdown"])],
+    )
+    def test_When_app_fails_to_start__Then_shut_down_only_if_started(
+        self, around_app_lifespan: bool, expected_events: list[str]
+    ):
+        self.fail_startup = True
+        wrap_lifespan(self.app, self._on_startup, self._on_shutdown, around_app_lifespan=around_app_lifespan)
+
+        with pytest.raises(RuntimeError, match="device not found"), TestClient(self.app):
+            pass
+
+        assert self.events == expected_events
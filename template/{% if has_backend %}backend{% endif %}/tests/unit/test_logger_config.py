@@ -0,0 +1,157 @@
+import json
+import logging
+import queue
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import structlog
+from backend_api import configure_logging
+from backend_api.logger_config import BoundedQueueHandler
+from backend_api.logger_config import LogQueueConfig
+from backend_api.logger_config import LogQueueOverflowPolicy
+from backend_api.logger_config import SingleFormatRotatingFileHandler
+from backend_api.logger_config import flush_log_queue
+from pytest_mock import MockerFixture
+
+logger = logging.getLogger(__name__)
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord(
+        name=__name__, level=logging.INFO, pathname=__file__, lineno=0, msg=msg, args=None, exc_info=None
+    )
+
+
+def _drain(records: "queue.Queue[logging.LogRecord | None]") -> list[str]:
+    messages: list[str] = []
+    while not records.empty():
+        record = records.get_nowait()
+        assert record is not None
+        messages.append(record.getMessage())
+    return messages
+
+
+class TestQueuedLogging:
+    @pytest.fixture(autouse=True)
+    def _setup(self, tmp_path: Path) -> Iterator[None]:
+        self.log_filename_prefix = f"{tmp_path}/app-"
+        configure_logging(
+            log_filename_prefix=self.log_filename_prefix,
+            suppress_console_logging=True,
+            log_queue=LogQueueConfig(max_size=100),
+        )
+        yield
+        configure_logging(log_filename_prefix="logs/pytest-")  # back to the session-wide config from conftest
+
+    def _written_records(self) -> list[dict[str, object]]:
+        log_file = Path(f"{self.log_filename_prefix}backend.log")
+        return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+    def test_When_logging__Then_root_logger_only_enqueues(self):
+        handlers = logging.getLogger().handlers
+
+        assert len([handler for handler in handlers if isinstance(handler, BoundedQueueHandler)]) == 1
+        assert not any(handler.name == "file" for handler in handlers)
+
+    def test_When_flushed__Then_records_written_with_context_and_exceptions(self):
+        mutable_arg = ["before"]
+        _ = structlog.contextvars.bind_contextvars(request_id="abc123")
+        try:
+            logger.info("args resolved on the calling thread: %s", mutable_arg)
+            logger.info("explicit extra", extra={"request_id": "from-extra"})
+            mutable_arg[0] = "after"
+            try:
+                raise ValueError("boom")  # noqa: TRY301 # raising here is the simplest way to get real exception info
+            except ValueError:
+                logger.exception("it failed")
+        finally:
+            _ = structlog.contextvars.unbind_contextvars("request_id")
+
+        flush_log_queue()
+
+        written = self._written_records()
+        assert written[0]["message"] == "args resolved on the calling thread: ['before']"
+        assert written[0]["request_id"] == "abc123"
+        assert written[1]["request_id"] == "from-extra"  # an explicit extra takes precedence over the context var
+        assert written[2]["message"] == "it failed"
+        assert "ValueError" in json.dumps(written[2]["exception"])
+        assert not any(isinstance(handler, BoundedQueueHandler) for handler in logging.getLogger().handlers)
+
+    def test_Given_already_flushed__When_flushed_again__Then_no_error(self):
+        flush_log_queue()
+
+        flush_log_queue()
+
+        logger.info("written directly")
+        assert self._written_records()[-1]["message"] == "written directly"
+
+
+def test_Given_drop_policy__When_queue_full__Then_records_discarded():
+    records: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=1)
+    handler = BoundedQueueHandler(records, overflow_policy=LogQueueOverflowPolicy.DROP)
+
+    for index in range(3):
+        handler.emit(_record(f"record {index}"))
+
+    assert _drain(records) == ["record 0"]
+    handler.emit(_record("record 3"))
+    assert _drain(records) == ["record 3"]  # no report of what was dropped
+
+
+def test_Given_count_policy__When_queue_has_room_again__Then_drops_reported():
+    records: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(records, overflow_policy=LogQueueOverflowPolicy.COUNT)
+    for index in range(4):
+        handler.emit(_record(f"record {index}"))
+    assert _drain(records) == ["record 0", "record 1"]
+
+    handler.emit(_record("record 4"))
+
+    assert _drain(records) == ["record 4", "Dropped 2 log records because the log queue was full"]
+    assert handler.dropped_count == 2  # noqa: PLR2004 # the two records that didn't fit above
+
+
+def test_Given_count_policy__When_no_room_for_the_report__Then_reported_with_a_later_record():
+    records: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(records, overflow_policy=LogQueueOverflowPolicy.COUNT)
+    for index in range(3):
+        handler.emit(_record(f"record {index}"))
+    _ = records.get_nowait()  # room for exactly one more record
+
+    handler.emit(_record("record 3"))  # takes the last slot, so the report doesn't fit
+    assert _drain(records) == ["record 1", "record 3"]
+    handler.emit(_record("record 4"))
+
+    assert _drain(records) == ["record 4", "Dropped 1 log records because the log queue was full"]
+
+
+def test_Given_block_policy__When_queue_full__Then_caller_waits_for_room():
+    records: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=1)
+    handler = BoundedQueueHandler(records, overflow_policy=LogQueueOverflowPolicy.BLOCK)
+    handler.emit(_record("record 0"))
+    blocked_emit = threading.Thread(target=handler.emit, args=(_record("record 1"),), daemon=True)
+    blocked_emit.start()
+    blocked_emit.join(timeout=0.05)
+    assert blocked_emit.is_alive()
+
+    assert _drain(records) == ["record 0"]
+    blocked_emit.join(timeout=2)
+
+    assert not blocked_emit.is_alive()
+    assert _drain(records) == ["record 1"]
+    assert handler.dropped_count == 0
+
+
+def test_When_rotating_file_handler_emits__Then_record_formatted_once(tmp_path: Path, mocker: MockerFixture):
+    handler = SingleFormatRotatingFileHandler(str(tmp_path / "app.log"), max_bytes=1_000, backup_count=1)
+    spied_format = mocker.spy(logging.Formatter, logging.Formatter.format.__name__)
+    try:
+        for index in range(3):  # the first emit skips the rollover check on an empty file, so check a few
+            handler.emit(_record(f"record {index}"))
+    finally:
+        handler.close()
+
+    assert spied_format.call_count == 3  # noqa: PLR2004 # one per record emitted above
+    assert (tmp_path / "app.log").read_text().splitlines() == ["record 0", "record 1", "record 2"]
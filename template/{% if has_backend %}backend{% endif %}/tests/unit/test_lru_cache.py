@@ -0,0 +1,42 @@
+import pytest
+from backend_api.lru_cache import LruCache
+from backend_api.metrics import CacheStats
+
+
+def test_When_looked_up__Then_hits_and_misses_counted():
+    cache = LruCache[str, int](max_entries=2)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats() == CacheStats(hits=1, misses=1, entries=1, max_entries=2)
+
+
+def test_Given_full__When_put__Then_least_recently_used_evicted():
+    cache = LruCache[str, int](max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    _ = cache.get("a")  # now "b" is the least recently used
+
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2  # noqa: PLR2004 # the max entries above
+
+
+def test_When_existing_key_put__Then_replaced_without_evicting():
+    cache = LruCache[str, int](max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    cache.put("a", 10)
+
+    assert cache.get("a") == 10  # noqa: PLR2004 # the value put above
+    assert "b" in cache
+
+
+def test_When_created_with_no_room__Then_error():
+    with pytest.raises(ValueError, match="at least 1"):
+        _ = LruCache[str, int](max_entries=0)
@@ -0,0 +1,149 @@
+import time
+
+import pytest
+from backend_api.app_def import app
+from backend_api.metrics import PROMETHEUS_CONTENT_TYPE
+from backend_api.metrics import CacheStats
+from backend_api.metrics import Histogram
+from backend_api.metrics import MetricsMiddleware
+from backend_api.metrics import MetricsRegistry
+from backend_api.metrics import RequestKey
+from backend_api.metrics import ThreadpoolStats
+from fastapi import FastAPI
+from fastapi import WebSocket
+from fastapi.testclient import TestClient
+from httpx import codes
+
+
+class BoomError(Exception):
+    pass
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry(latency_buckets=(0.1, 1.0))
+
+
+@pytest.fixture
+def instrumented_app(registry: MetricsRegistry) -> FastAPI:
+    instrumented = FastAPI()
+    instrumented.add_middleware(MetricsMiddleware, registry=registry, loop_lag_interval_seconds=0.01)
+
+    @instrumented.get("/items/{item_id}")
+    def get_item(item_id: int) -> dict[str, int]:
+        return {"itemId": item_id}
+
+    @instrumented.websocket("/ws")
+    async def echo(websocket: WebSocket) -> None:
+        await websocket.accept()
+        await websocket.send_text(await websocket.receive_text())
+        await websocket.close()
+
+    @instrumented.get("/boom")
+    def boom() -> None:
+        raise BoomError
+
+    return instrumented
+
+
+def test_When_route_with_path_params_called__Then_counted_under_route_template(
+    instrumented_app: FastAPI, registry: MetricsRegistry
+):
+    client = TestClient(instrumented_app)
+
+    for item_id in range(3):
+        _ = client.get(f"/items/{item_id}")
+
+    assert dict(registry.request_counts) == {RequestKey("GET", "/items/{item_id}", "200"): 3}
+    assert registry.request_latencies[("GET", "/items/{item_id}")].counts[-1] == 0  # nothing took over a second
+    assert sum(registry.request_latencies[("GET", "/items/{item_id}")].counts) == 3  # noqa: PLR2004 # three requests made above
+
+
+def test_When_route_raises__Then_counted_as_500_and_not_left_in_progress(
+    instrumented_app: FastAPI, registry: MetricsRegistry
+):
+    client = TestClient(instrumented_app, raise_server_exceptions=False)
+
+    response = client.get("/boom")
+
+    assert response.status_code == codes.INTERNAL_SERVER_ERROR
+    assert registry.request_counts[RequestKey("GET", "/boom", "500")] == 1
+    assert registry.requests_in_progress["GET"] == 0
+
+
+def test_When_no_route_matches__Then_counted_as_unmatched(instrumented_app: FastAPI, registry: MetricsRegistry):
+    client = TestClient(instrumented_app)
+
+    _ = client.get("/does-not-exist")
+
+    assert registry.request_counts[RequestKey("GET", "<unmatched>", "404")] == 1
+
+
+def test_When_websocket_connected__Then_passed_through_without_counting(
+    instrumented_app: FastAPI, registry: MetricsRegistry
+):
+    client = TestClient(instrumented_app)
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_text("hello")
+        assert websocket.receive_text() == "hello"
+
+    assert len(registry.request_counts) == 0
+
+
+def test_Given_lifespan_running__Then_event_loop_lag_sampled(instrumented_app: FastAPI, registry: MetricsRegistry):
+    with TestClient(instrumented_app):
+        for _ in range(500):
+            if sum(registry.event_loop_lag.counts) > 0:
+                break
+            time.sleep(0.01)
+
+    assert sum(registry.event_loop_lag.counts) > 0
+
+
+def test_When_histogram_rendered__Then_buckets_are_cumulative():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value)
+
+    lines = histogram.render("latency", (("route", "/a"),))
+
+    assert lines == [
+        'latency_bucket{route="/a",le="0.1"} 1',
+        'latency_bucket{route="/a",le="1"} 3',
+        'latency_bucket{route="/a",le="+Inf"} 4',
+        'latency_sum{route="/a"} 6.05',
+        'latency_count{route="/a"} 4',
+    ]
+
+
+def test_When_label_value_has_special_characters__Then_escaped(registry: MetricsRegistry):
+    registry.observe_request(RequestKey("GET", '/a"b\\c', "200"), 0.01)
+
+    rendered = registry.render(ThreadpoolStats(threads_in_use=1, threads_limit=40, tasks_waiting=0))
+
+    assert 'http_requests_total{method="GET",route="/a\\"b\\\\c",status="200"} 1' in rendered
+    assert "threadpool_threads_limit 40\n" in rendered
+
+
+def test_Given_cache_registered__When_rendered__Then_hits_misses_and_size_reported(registry: MetricsRegistry):
+    registry.register_cache("documents", lambda: CacheStats(hits=7, misses=3, entries=3, max_entries=10))
+
+    rendered = registry.render(ThreadpoolStats(threads_in_use=0, threads_limit=40, tasks_waiting=0))
+
+    assert 'cache_lookups_total{cache="documents",result="hit"} 7\n' in rendered
+    assert 'cache_lookups_total{cache="documents",result="miss"} 3\n' in rendered
+    assert 'cache_entries{cache="documents"} 3\n' in rendered
+    assert 'cache_max_entries{cache="documents"} 10\n' in rendered
+
+
+def test_When_metrics_route_called__Then_prometheus_text_returned():
+    client = TestClient(app)
+    _ = client.get("/api/healthcheck")
+
+    response = client.get("/api/metrics")
+
+    assert response.status_code == codes.OK
+    assert response.headers["content-type"] == PROMETHEUS_CONTENT_TYPE
+    assert 'http_requests_total{method="GET",route="/api/healthcheck",status="200"}' in response.text
+    assert "threadpool_threads_in_use" in response.text
@@ -0,0 +1,140 @@
+import json
+import threading
+
+import pytest
+from backend_api import openapi_document
+from backend_api.openapi_document import serve_preencoded_openapi
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import codes
+from pydantic import JsonValue
+from pytest_mock import MockerFixture
+from starlette.routing import Route
+
+
+def _build_app(*, root_path: str = "") -> FastAPI:
+    documented_app = FastAPI(openapi_url="/api/openapi.json", root_path=root_path)
+
+    @documented_app.get("/api/items/{item_id}")
+    def get_item(item_id: int) -> dict[str, int]:
+        return {"itemId": item_id}
+
+    _ = serve_preencoded_openapi(documented_app)
+    return documented_app
+
+
+@pytest.fixture
+def documented_app() -> FastAPI:
+    return _build_app()
+
+
+def test_When_requested__Then_same_bytes_as_fastapi_would_render(documented_app: FastAPI):
+    client = TestClient(documented_app)
+
+    response = client.get("/api/openapi.json", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == codes.OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in response.headers
+    assert response.content == json.dumps(documented_app.openapi(), separators=(",", ":")).encode()
+
+
+def test_Given_gzip_accepted__When_requested__Then_gzip_variant_with_its_own_etag(documented_app: FastAPI):
+    client = TestClient(documented_app)
+    identity_etag = client.get("/api/openapi.json", headers={"Accept-Encoding": "identity"}).headers["etag"]
+
+    response = client.get("/api/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] != identity_etag
+    assert response.json() == documented_app.openapi()  # httpx transparently decompresses
+    assert int(response.headers["content-length"]) < len(json.dumps(documented_app.openapi()))
+
+
+@pytest.mark.parametrize("accept_encoding", ["identity", "gzip"])
+def test_Given_matching_etag__When_revalidated__Then_not_modified(documented_app: FastAPI, accept_encoding: str):
+    client = TestClient(documented_app)
+    etag = client.get("/api/openapi.json", headers={"Accept-Encoding": accept_encoding}).headers["etag"]
+
+    response = client.get("/api/openapi.json", headers={"Accept-Encoding": accept_encoding, "If-None-Match": etag})
+
+    assert response.status_code == codes.NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_Given_app_started__When_requested__Then_document_encoded_once_by_the_startup_warmup(
+    documented_app: FastAPI, mocker: MockerFixture
+):
+    spied_encode = mocker.spy(openapi_document, openapi_document.encode_openapi_document.__name__)
+
+    with TestClient(documented_app) as client:
+        for _ in range(3):  # the first request waits for the warmup rather than encoding the document again
+            _ = client.get("/api/openapi.json")
+
+    assert spied_encode.call_count == 1
+
+
+def test_Given_document_still_building__When_other_route_requested__Then_answered_without_waiting(
+    documented_app: FastAPI, mocker: MockerFixture
+):
+    build_may_finish = threading.Event()
+    original_encode = openapi_document.encode_openapi_document
+
+    def slow_encode(schema: dict[str, JsonValue]) -> openapi_document.PreencodedDocument:
+        assert build_may_finish.wait(timeout=10)
+        return original_encode(schema)
+
+    _ = mocker.patch.object(
+        openapi_document, openapi_document.encode_openapi_document.__name__, side_effect=slow_encode
+    )
+
+    with TestClient(documented_app) as client:
+        response = client.get("/api/items/1")
+
+        assert response.status_code == codes.OK
+        build_may_finish.set()
+        assert client.get("/api/openapi.json").status_code == codes.OK
+
+
+def test_Given_schema_cache_cleared__When_requested__Then_reencoded(documented_app: FastAPI):
+    client = TestClient(documented_app)
+    _ = client.get("/api/openapi.json")
+    documented_app.openapi_schema = None
+    documented_app.title = "Renamed"
+
+    response = client.get("/api/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+    assert response.json()["info"]["title"] == "Renamed"
+
+
+def test_Given_root_path__When_requested__Then_root_path_listed_in_servers_once():
+    documented_app = _build_app(root_path="/prefix")
+
+    with TestClient(documented_app) as client:  # startup encodes the document for the bare root path only
+        response = client.get("/api/openapi.json")
+
+        assert response.json()["servers"] == [{"url": "/prefix"}]
+        documented_app.openapi_schema = None
+        documented_app.servers = [{"url": "/prefix"}, {"url": "https://example.com"}]
+        assert client.get("/api/openapi.json").json()["servers"] == documented_app.servers
+
+
+def test_When_document_requested_twice__Then_encoded_once():
+    preencoded = serve_preencoded_openapi(FastAPI(openapi_url="/api/openapi.json"))
+
+    assert preencoded.document("") is preencoded.document("")
+
+
+def test_Given_no_openapi_route__Then_error():
+    documented_app = FastAPI(openapi_url="/api/openapi.json")
+    documented_app.router.routes[:] = [
+        route
+        for route in documented_app.router.routes
+        if not (isinstance(route, Route) and route.path == "/api/openapi.json")
+    ]
+
+    with pytest.raises(NotImplementedError, match="No route found"):
+        _ = serve_preencoded_openapi(documented_app)
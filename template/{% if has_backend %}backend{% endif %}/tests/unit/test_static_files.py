@@ -0,0 +1,157 @@
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+from backend_api.app_def import app
+from backend_api.static_files import FINGERPRINTED_CACHE_CONTROL
+from backend_api.static_files import HTML_CACHE_CONTROL
+from backend_api.static_files import REVALIDATE_CACHE_CONTROL
+from backend_api.static_files import PrecompressedStaticFiles
+from backend_api.static_files import accepted_encodings
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import codes
+from pytest_mock import MockerFixture
+
+COMPRESSIBLE_CONTENT = "console.log('hello world');\n" * 200
+
+
+@pytest.fixture
+def static_dir(tmp_path: Path) -> Path:
+    (tmp_path / "_nuxt").mkdir()
+    _ = (tmp_path / "_nuxt" / "entry.abc123.js").write_text(COMPRESSIBLE_CONTENT)
+    _ = (tmp_path / "index.html").write_text("<html><body>" + "hello " * 500 + "</body></html>")
+    _ = (tmp_path / "favicon.png").write_bytes(os.urandom(2048))
+    return tmp_path
+
+
+@pytest.fixture
+def client(static_dir: Path) -> TestClient:
+    static_app = FastAPI()
+    static_app.mount("/", PrecompressedStaticFiles(directory=static_dir, html=True), name="static")
+    return TestClient(static_app)
+
+
+def test_When_fingerprinted_asset_requested__Then_immutable(client: TestClient):
+    response = client.get("/_nuxt/entry.abc123.js")
+
+    assert response.status_code == codes.OK
+    assert response.headers["cache-control"] == FINGERPRINTED_CACHE_CONTROL
+
+
+def test_When_index_requested__Then_no_cache(client: TestClient):
+    response = client.get("/")
+
+    assert response.status_code == codes.OK
+    assert response.headers["cache-control"] == HTML_CACHE_CONTROL
+    assert response.headers["pragma"] == "no-cache"
+
+
+def test_When_other_asset_requested__Then_must_revalidate(client: TestClient):
+    response = client.get("/favicon.png")
+
+    assert response.status_code == codes.OK
+    assert response.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+
+def test_Given_gzip_accepted__When_compressible_asset_requested__Then_gzip_variant_served(client: TestClient):
+    response = client.get("/_nuxt/entry.abc123.js", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert response.text == COMPRESSIBLE_CONTENT  # httpx transparently decodes it
+
+
+def test_Given_no_encoding_accepted__When_compressible_asset_requested__Then_identity_served(client: TestClient):
+    response = client.get("/_nuxt/entry.abc123.js", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == COMPRESSIBLE_CONTENT
+
+
+def test_Given_incompressible_asset__When_requested_with_gzip__Then_identity_served(client: TestClient):
+    response = client.get("/favicon.png", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_Given_incompressible_asset__When_served__Then_hashed_without_reading_it_whole(
+    client: TestClient, mocker: MockerFixture
+):
+    spy = mocker.spy(Path, "read_bytes")
+
+    response = client.get("/favicon.png")
+
+    assert response.status_code == codes.OK
+    assert "etag" in response.headers
+    spy.assert_not_called()
+
+
+def test_Given_compressible_suffix_but_random_content__When_requested_with_gzip__Then_identity_served(
+    client: TestClient, static_dir: Path
+):
+    _ = (static_dir / "_nuxt" / "random.js").write_bytes(os.urandom(2048))
+
+    response = client.get("/_nuxt/random.js", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers  # gzip would have made it bigger, so no variant is kept
+
+
+def test_Given_brotli_precompressed_at_build_time__When_br_accepted__Then_br_file_served(static_dir: Path):
+    precompressed_body = gzip.compress(b"stand-in for brotli bytes")  # the engine serves the sibling file verbatim
+    _ = (static_dir / "_nuxt" / "entry.abc123.js.br").write_bytes(precompressed_body)
+    static_files = PrecompressedStaticFiles(directory=static_dir)
+    full_path, stat_result = static_files.lookup_path("_nuxt/entry.abc123.js")
+    assert stat_result is not None
+    response = static_files.file_response(
+        full_path, stat_result, {"type": "http", "headers": [(b"accept-encoding", b"gzip, br")]}
+    )
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.body == precompressed_body
+
+
+@pytest.mark.parametrize("accept_encoding", ["gzip", "identity"])
+def test_Given_etag_from_prior_response__When_requested_with_if_none_match__Then_not_modified(
+    client: TestClient, accept_encoding: str
+):
+    first = client.get("/_nuxt/entry.abc123.js", headers={"Accept-Encoding": accept_encoding})
+
+    response = client.get(
+        "/_nuxt/entry.abc123.js",
+        headers={"Accept-Encoding": accept_encoding, "If-None-Match": first.headers["etag"]},
+    )
+
+    assert response.status_code == codes.NOT_MODIFIED
+    assert response.headers["etag"] == first.headers["etag"]
+
+
+def test_Given_file_changed__When_requested_with_old_etag__Then_new_content_served(
+    client: TestClient, static_dir: Path
+):
+    first = client.get("/_nuxt/entry.abc123.js")
+    _ = (static_dir / "_nuxt" / "entry.abc123.js").write_text(COMPRESSIBLE_CONTENT + "// changed\n")
+
+    response = client.get("/_nuxt/entry.abc123.js", headers={"If-None-Match": first.headers["etag"]})
+
+    assert response.status_code == codes.OK
+    assert response.headers["etag"] != first.headers["etag"]
+    assert response.text.endswith("// changed\n")
+
+
+def test_When_q_zero__Then_encoding_refused():
+    assert accepted_encodings("gzip;q=0, br;q=0.5, deflate") == {"br", "deflate"}
+
+
+def test_When_swagger_static_asset_requested__Then_served_with_etag():
+    client = TestClient(app)
+
+    response = client.get("/static/swagger/swagger-ui-bundle.js", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == codes.OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert "etag" in response.headers
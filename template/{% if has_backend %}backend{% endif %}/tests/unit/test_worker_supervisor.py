@@ -0,0 +1,177 @@
+import random
+import threading
+from collections.abc import Callable
+from functools import partial
+
+import pytest
+import uvicorn
+from backend_api import worker_supervisor
+from backend_api.logger_config import LogQueueConfig
+from backend_api.logger_config import LogQueueOverflowPolicy
+from backend_api.worker_supervisor import WorkerLogging
+from backend_api.worker_supervisor import WorkerProcess
+from backend_api.worker_supervisor import WorkerSupervisor
+from pytest_mock import MockerFixture
+from uvicorn.config import STARTUP_FAILURE
+from uvicorn.supervisors import multiprocess
+
+
+class FakeWorkerProcess:
+    def __init__(
+        self,
+        *_args: object,  # noqa: ARG002 # mirrors the config and sockets uvicorn's Process takes
+        configure_child_logging: Callable[[], None],
+        request_shutdown: Callable[[], None],
+    ) -> None:
+        assert isinstance(configure_child_logging, partial), f"Expected a partial, got {type(configure_child_logging)}"
+        self.logging_kwargs = configure_child_logging.keywords
+        self.request_shutdown = request_shutdown
+        self.pid = random.randint(1000, 99999)
+        self.exitcode: int | None = None
+        self.alive = True
+        self.started = False
+        self.terminated = False
+        self.joined = False
+
+    def start(self) -> None:
+        self.started = True
+
+    def is_alive(self, timeout: float) -> bool:  # noqa: ARG002 # signature must match uvicorn's Process
+        return self.alive
+
+    def kill(self) -> None:
+        self.alive = False
+
+    def terminate(self) -> None:
+        self.terminated = True
+
+    def join(self) -> None:
+        self.joined = True
+
+
+@pytest.mark.timeout(10)
+def test_When_worker_process_created__Then_child_runs_the_logging_configuring_target(mocker: MockerFixture):
+    mocked_get_subprocess = mocker.patch.object(multiprocess, multiprocess.get_subprocess.__name__, autospec=True)
+    config = uvicorn.Config("backend_api.app_def:app")
+
+    process = WorkerProcess(config, [], configure_child_logging=lambda: None, request_shutdown=lambda: None)
+
+    try:
+        mocked_get_subprocess.assert_called_once_with(config, process.target, [])
+    finally:
+        process.parent_conn.close()
+        process.child_conn.close()
+
+
+class TestWorkerSupervisor:
+    @pytest.fixture(autouse=True)
+    def _setup(self, mocker: MockerFixture):
+        self.spawned: list[FakeWorkerProcess] = []
+
+        def _create_process(*args: object, **kwargs: Callable[[], None]) -> FakeWorkerProcess:
+            process = FakeWorkerProcess(*args, **kwargs)
+            self.spawned.append(process)
+            return process
+
+        _ = mocker.patch.object(
+            worker_supervisor, worker_supervisor.WorkerProcess.__name__, side_effect=_create_process
+        )
+        self.stop_event = threading.Event()
+        self.num_workers = random.randint(2, 5)
+        self.supervisor = WorkerSupervisor(
+            config=uvicorn.Config("backend_api.app_def:app", workers=self.num_workers, log_level="info"),
+            sockets=[],
+            stop_event=self.stop_event,
+            worker_logging=WorkerLogging(
+                log_filename_prefix="logs/app-",
+                log_queue=LogQueueConfig(max_size=100, overflow_policy=LogQueueOverflowPolicy.COUNT),
+            ),
+            health_check_interval=0.001,
+        )
+        self._supervisor_thread: threading.Thread | None = None
+
+    def _start_supervisor(self) -> None:
+        self._supervisor_thread = threading.Thread(target=self.supervisor.run, daemon=True)
+        self._supervisor_thread.start()
+        for _ in range(1000):
+            if len(self.spawned) >= self.num_workers:
+                return
+            _ = threading.Event().wait(timeout=0.001)
+        raise AssertionError("supervisor never spawned all of its workers")
+
+    def _stop_supervisor(self) -> None:
+        assert self._supervisor_thread is not None
+        self.stop_event.set()
+        self._supervisor_thread.join(timeout=2)
+        assert not self._supervisor_thread.is_alive(), "supervisor did not exit within 2s"
+
+    def _wait_for_spawn_count(self, expected_count: int) -> None:
+        for _ in range(1000):
+            if len(self.spawned) >= expected_count:
+                return
+            _ = threading.Event().wait(timeout=0.001)
+        raise AssertionError(f"expected {expected_count} spawned workers, got {len(self.spawned)}")
+
+    def test_When_run__Then_configured_number_of_workers_started(self):
+        self._start_supervisor()
+        self._stop_supervisor()
+
+        assert len(self.spawned) == self.num_workers
+        assert all(process.started for process in self.spawned)
+
+    def test_When_run__Then_each_worker_logs_to_its_own_file(self):
+        self._start_supervisor()
+        self._stop_supervisor()
+
+        prefixes = [process.logging_kwargs["log_filename_prefix"] for process in self.spawned]
+        assert len(set(prefixes)) == self.num_workers
+        assert all(prefix.startswith("logs/app-") for prefix in prefixes)
+        assert all(process.logging_kwargs["log_level"] == "INFO" for process in self.spawned)
+        assert all(
+            process.logging_kwargs["log_queue"] == LogQueueConfig(100, LogQueueOverflowPolicy.COUNT)
+            for process in self.spawned
+        )
+
+    def test_Given_stop_event_set__Then_every_worker_terminated_and_joined(self):
+        self._start_supervisor()
+
+        self._stop_supervisor()
+
+        assert all(process.terminated for process in self.spawned)
+        assert all(process.joined for process in self.spawned)
+
+    def test_Given_worker_requests_shutdown__Then_supervisor_stops_every_worker(self):
+        self._start_supervisor()
+
+        self.spawned[0].request_shutdown()
+
+        assert self._supervisor_thread is not None
+        self._supervisor_thread.join(timeout=2)
+        assert not self._supervisor_thread.is_alive(), "supervisor did not exit within 2s"
+        assert self.stop_event.is_set()
+        assert all(process.terminated for process in self.spawned)
+
+    def test_Given_worker_dies__Then_replacement_spawned(self):
+        self._start_supervisor()
+        dead_worker = self.spawned[0]
+        dead_worker.exitcode = 1
+
+        dead_worker.alive = False
+        self._wait_for_spawn_count(self.num_workers + 1)
+        self._stop_supervisor()
+
+        assert dead_worker not in self.supervisor.processes
+        assert len(self.supervisor.processes) == self.num_workers
+        assert self.spawned[-1] in self.supervisor.processes
+
+    def test_Given_worker_fails_at_startup__Then_no_replacement_and_stop_event_set(self):
+        self._start_supervisor()
+        failed_worker = self.spawned[0]
+        failed_worker.exitcode = STARTUP_FAILURE
+
+        failed_worker.alive = False
+        assert self.stop_event.wait(timeout=2)
+        self._stop_supervisor()
+
+        assert len(self.spawned) == self.num_workers
+        assert all(process.terminated for process in self.spawned)
@@ -0,0 +1,138 @@
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from ..unit.copier_tasks.helpers import SCRIPT_PATH_ROOT
+from ..unit.template_scripts.helpers import load_template_script
+
+copier_provenance = load_template_script(SCRIPT_PATH_ROOT / "copier_provenance.py")
+
+DIRECTORY_COUNT = 60
+FILES_PER_DIRECTORY = 50
+LARGE_FILE_COUNT = 20
+LARGE_FILE_BYTES = 2 * 1024 * 1024
+_SUFFIXES = (".py", ".ts", ".md", ".yaml", ".jinja", ".sh", ".css", ".html")
+
+
+def _build_template_and_destination(tmp_path: Path, *, large_file_count: int = LARGE_FILE_COUNT) -> tuple[Path, Path]:
+    template_dir = tmp_path / "template"
+    dst_dir = tmp_path / "destination"
+    for directory_index in range(DIRECTORY_COUNT):
+        template_subdir = template_dir / f"package_{directory_index}"
+        dst_subdir = dst_dir / f"package_{directory_index}"
+        template_subdir.mkdir(parents=True)
+        dst_subdir.mkdir(parents=True)
+        for file_index in range(FILES_PER_DIRECTORY):
+            filename = f"module_{file_index}{_SUFFIXES[file_index % len(_SUFFIXES)]}"
+            (template_subdir / f"{filename}.jinja-base").touch()
+            _ = (dst_subdir / filename).write_text(f"line {file_index}\n" * 40, encoding="utf-8")
+    large_files_dir = dst_dir / "generated"
+    large_files_dir.mkdir()
+    (template_dir / "generated").mkdir()
+    for large_file_index in range(large_file_count):
+        (template_dir / "generated" / f"schema_{large_file_index}.ts").touch()
+        _ = (large_files_dir / f"schema_{large_file_index}.ts").write_text(
+            "export const value = 1;\n" * (LARGE_FILE_BYTES // 24), encoding="utf-8"
+        )
+    return template_dir, dst_dir
+
+
+def _mtimes(dst_dir: Path) -> dict[Path, int]:
+    return {file: file.stat().st_mtime_ns for file in dst_dir.rglob("*") if file.is_file()}
+
+
+def _time_apply_file_markers(template_dir: Path, dst_dir: Path) -> float:
+    start = time.perf_counter()
+    _ = copier_provenance.apply_file_markers(
+        src_template_directory=template_dir, dst_directory=dst_dir, template_src="gh:example/template.git"
+    )
+    return time.perf_counter() - start
+
+
+def test_apply_file_markers__first_stamp_vs_restamp(tmp_path: Path):
+    template_dir, dst_dir = _build_template_and_destination(tmp_path)
+
+    first_stamp_seconds = _time_apply_file_markers(template_dir, dst_dir)
+    mtimes_after_first_stamp = _mtimes(dst_dir)
+    restamp_seconds = _time_apply_file_markers(template_dir, dst_dir)
+
+    print(  # noqa: T201 # report both timings alongside the pass/fail comparison
+        f"{DIRECTORY_COUNT * FILES_PER_DIRECTORY} files and {LARGE_FILE_COUNT} x "
+        f"{LARGE_FILE_BYTES // (1024 * 1024)}MB files: "
+        f"first stamp={first_stamp_seconds * 1e3:.0f}ms re-stamp={restamp_seconds * 1e3:.0f}ms"
+    )
+    assert _mtimes(dst_dir) == mtimes_after_first_stamp  # reading dominates both timings, but nothing is rewritten
+
+
+NODE_MODULES_PACKAGE_COUNT = 4000
+FILES_PER_NODE_MODULES_PACKAGE = 25
+
+
+def test_apply_file_markers__vs_walking_an_instantiated_destination(tmp_path: Path):
+    template_dir, dst_dir = _build_template_and_destination(tmp_path, large_file_count=0)
+    for package_index in range(NODE_MODULES_PACKAGE_COUNT):
+        package_dir = dst_dir / "node_modules" / f"package-{package_index}"
+        package_dir.mkdir(parents=True)
+        for file_index in range(FILES_PER_NODE_MODULES_PACKAGE):
+            _ = (package_dir / f"file_{file_index}.js").write_text("module.exports = {};\n", encoding="utf-8")
+    _ = _time_apply_file_markers(template_dir, dst_dir)  # stamp once, so the timed run measures the lookups
+
+    walk_start = time.perf_counter()
+    walked_files = [Path(root) / fname for root, _, files in os.walk(dst_dir, followlinks=True) for fname in files]
+    walk_seconds = time.perf_counter() - walk_start
+    restamp_seconds = _time_apply_file_markers(template_dir, dst_dir)
+
+    print(  # noqa: T201 # report both timings alongside the pass/fail comparison
+        f"{len(walked_files)} files in the destination: "
+        f"walking it={walk_seconds * 1e3:.0f}ms re-stamp={restamp_seconds * 1e3:.0f}ms"
+    )
+    assert restamp_seconds < walk_seconds
+
+
+SHALLOW_CHAIN_DEPTH = 10
+DEEP_CHAIN_DEPTH = 40
+FILES_PER_ANCESTOR_TEMPLATE = 2000
+
+
+def _time_main_with_ancestor_chain(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, *, chain_depth: int) -> float:
+    template_dir, dst_dir = _build_template_and_destination(tmp_path, large_file_count=0)
+    ancestor_srcs = [f"gh:example/template-{depth}.git" for depth in range(chain_depth)]
+    # every ancestor owns one real file, plus a long tail of paths the destination doesn't have
+    ancestor_manifest = {
+        "templates": [
+            {
+                "src": src,
+                "parent_src": ancestor_srcs[depth - 1] if depth > 0 else "gh:example/root.git",
+                "managed_files": [f"template/package_{depth}/module_0.py.jinja-base"]
+                + [f"template/{src}/unused_{file_index}.txt" for file_index in range(FILES_PER_ANCESTOR_TEMPLATE)],
+            }
+            for depth, src in enumerate(ancestor_srcs)
+        ]
+    }
+    (tmp_path / ".config").mkdir()
+    _ = (tmp_path / ".config" / ".copier-managed-files.json").write_text(json.dumps(ancestor_manifest))
+    monkeypatch.setattr(
+        sys, "argv", ["copier_provenance.py", str(template_dir), str(dst_dir), "--template-src", "gh:example/child.git"]
+    )
+    copier_provenance.main()  # stamp once, so the timed run measures attribution and the manifest update
+
+    start = time.perf_counter()
+    copier_provenance.main()
+    return time.perf_counter() - start
+
+
+def test_main__deep_template_inheritance_chain_scales_linearly(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    (tmp_path / "shallow").mkdir()
+    (tmp_path / "deep").mkdir()
+    shallow_seconds = _time_main_with_ancestor_chain(tmp_path / "shallow", monkeypatch, chain_depth=SHALLOW_CHAIN_DEPTH)
+    deep_seconds = _time_main_with_ancestor_chain(tmp_path / "deep", monkeypatch, chain_depth=DEEP_CHAIN_DEPTH)
+
+    print(  # noqa: T201 # report both timings alongside the pass/fail comparison
+        f"{FILES_PER_ANCESTOR_TEMPLATE} paths per ancestor template: "
+        f"{SHALLOW_CHAIN_DEPTH} deep={shallow_seconds * 1e3:.0f}ms {DEEP_CHAIN_DEPTH} deep={deep_seconds * 1e3:.0f}ms"
+    )
+    assert deep_seconds < shallow_seconds * DEEP_CHAIN_DEPTH / SHALLOW_CHAIN_DEPTH
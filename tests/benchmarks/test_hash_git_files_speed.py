@@ -0,0 +1,78 @@
+import time
+from pathlib import Path
+
+from ..unit.template_scripts.helpers import PROJECT_ROOT
+from ..unit.template_scripts.helpers import commit_all
+from ..unit.template_scripts.helpers import init_git_repo
+from ..unit.template_scripts.helpers import load_template_script
+from ..unit.template_scripts.helpers import run_git
+
+hash_git_files = load_template_script(PROJECT_ROOT / "template" / ".github" / "workflows" / "hash_git_files.py")
+
+LOCKFILE_COUNT = 8
+LOCKFILE_BYTES = 8 * 1024 * 1024
+SOURCE_FILE_COUNT = 2000
+UV_LOCK_PACKAGE_COUNT = 2000
+REPEATS = 5
+RACY_GIT_TIMESTAMP_GRANULARITY_SECONDS = 1.1
+
+
+def _build_repo_with_large_lockfiles(repo_path: Path) -> None:
+    init_git_repo(repo_path)
+    # the content varies line to line, like a real lockfile, so nothing gets an unrealistically easy ride
+    for lockfile_index in range(LOCKFILE_COUNT):
+        lockfile_dir = repo_path / f"package_{lockfile_index}"
+        lockfile_dir.mkdir()
+        line_count = LOCKFILE_BYTES // 64
+        _ = (lockfile_dir / "pnpm-lock.yaml").write_text(
+            "".join(
+                f"  /dependency-{index}@1.{index % 97}.0:\n    resolution: {{integrity: sha512-{index:x}}}\n"
+                for index in range(line_count // 2)
+            )
+        )
+    _ = (repo_path / "uv.lock").write_text(
+        'version = 1\n\n[[package]]\nname = "app"\nversion = "1.0.0"\nsource = { virtual = "." }\n'
+        + "".join(
+            f'\n[[package]]\nname = "dependency-{index}"\nversion = "1.{index}.0"\n'
+            for index in range(UV_LOCK_PACKAGE_COUNT)
+        )
+    )
+    source_dir = repo_path / "src"
+    source_dir.mkdir()
+    for source_index in range(SOURCE_FILE_COUNT):
+        _ = (source_dir / f"module_{source_index}.py").write_text(f"VALUE = {source_index}\n" * 50)
+    commit_all(repo_path)
+    # git can't trust the timestamps of files written in the same second as its index, so would re-read all of them
+    # ("racy git"). A real checkout is older than that, so wait it out and let `git status` refresh the index
+    time.sleep(RACY_GIT_TIMESTAMP_GRANULARITY_SECONDS)
+    _ = run_git(repo_path, "status", "--porcelain")
+
+
+def _best_of(measure) -> float:  # noqa: ANN001 # any zero-argument callable
+    timings: list[float] = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        measure()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_hash_git_files__content_vs_git_blob_ids(tmp_path: Path):
+    _build_repo_with_large_lockfiles(tmp_path)
+    _ = (tmp_path / "src" / "module_0.py").write_text("VALUE = 'modified'\n")  # one file differs from the index
+
+    def hash_contents() -> None:
+        _ = hash_git_files.compute_adler32(tmp_path, hash_git_files.get_tracked_files(tmp_path))
+
+    def hash_blob_ids() -> None:
+        index_entries = hash_git_files.get_git_index_entries(tmp_path)
+        _ = hash_git_files.compute_git_blob_checksum(tmp_path, list(index_entries), index_entries)
+
+    content_seconds = _best_of(hash_contents)
+    blob_id_seconds = _best_of(hash_blob_ids)
+
+    print(  # noqa: T201 # report both timings alongside the pass/fail comparison
+        f"{LOCKFILE_COUNT} x {LOCKFILE_BYTES // (1024 * 1024)}MB lockfiles and {SOURCE_FILE_COUNT} source files: "
+        f"content={content_seconds * 1e3:.0f}ms git blob IDs={blob_id_seconds * 1e3:.0f}ms"
+    )
+    assert blob_id_seconds < content_seconds
@@ -6,6 +6,7 @@
 # but if the change should be shared with other projects, please backport it to the template repo.
 # =====================================================================================================
 import json
+import os
 import subprocess
 from pathlib import Path
 from typing import NotRequired
@@ -442,6 +443,113 @@ class TestExistingUserCommentsPreserved:
         assert content == file_content
 
 
+class TestRewriteSkipping:
+    def test_already_stamped_file_is_not_rewritten(self, tmp_path: Path) -> None:
+        template_dir = tmp_path / "template"
+        template_dir.mkdir()
+        (template_dir / "script.py").touch()
+
+        dst_dir = tmp_path / "destination"
+        dst_dir.mkdir()
+        dst_file = dst_dir / "script.py"
+        _ = dst_file.write_text(expected_hash_comment + "\nprint('hello')\n", encoding="utf-8")
+        old_mtime_ns = 1_000_000_000_000_000_000
+        os.utime(dst_file, ns=(old_mtime_ns, old_mtime_ns))
+
+        _ = _run_script(src_template_dir=template_dir, dst_dir=dst_dir)
+
+        assert dst_file.stat().st_mtime_ns == old_mtime_ns
+
+    def test_crlf_file_is_rewritten_with_lf_endings(self, tmp_path: Path) -> None:
+        template_dir = tmp_path / "template"
+        template_dir.mkdir()
+        (template_dir / "script.py").touch()
+
+        dst_dir = tmp_path / "destination"
+        dst_dir.mkdir()
+        file_content = expected_hash_comment + "\nprint('hello')\n"
+        _ = (dst_dir / "script.py").write_bytes(file_content.replace("\n", "\r\n").encode("utf-8"))
+
+        _ = _run_script(src_template_dir=template_dir, dst_dir=dst_dir)
+
+        assert (dst_dir / "script.py").read_bytes() == file_content.encode("utf-8")
+
+    def test_binary_file_is_not_marked(self, tmp_path: Path) -> None:
+        template_dir = tmp_path / "template"
+        template_dir.mkdir()
+        (template_dir / "logo.md").touch()
+
+        dst_dir = tmp_path / "destination"
+        dst_dir.mkdir()
+        binary_content = bytes(range(256))
+        _ = (dst_dir / "logo.md").write_bytes(binary_content)
+
+        _ = _run_script(src_template_dir=template_dir, dst_dir=dst_dir)
+
+        assert (dst_dir / "logo.md").read_bytes() == binary_content
+
+    def test_existing_bottom_marker_in_large_file_is_replaced_not_duplicated(self, tmp_path: Path) -> None:
+        template_dir = tmp_path / "template"
+        template_dir.mkdir()
+        (template_dir / "deploy.sh").touch()
+
+        dst_dir = tmp_path / "destination"
+        dst_dir.mkdir()
+        file_content = "echo hello\n" * 10_000 + "\n" + expected_hash_comment + "\n"
+        _ = (dst_dir / "deploy.sh").write_text(file_content, encoding="utf-8")
+
+        _ = _run_script(src_template_dir=template_dir, dst_dir=dst_dir)
+
+        assert (dst_dir / "deploy.sh").read_text(encoding="utf-8") == file_content
+
+    def test_marker_quoted_in_the_middle_of_a_large_file_is_not_stripped(self, tmp_path: Path) -> None:
+        template_dir = tmp_path / "template"
+        template_dir.mkdir()
+        (template_dir / "notes.txt").touch()
+
+        dst_dir = tmp_path / "destination"
+        dst_dir.mkdir()
+        padding = "some content\n" * 5_000
+        file_content = padding + expected_hash_comment + "\n" + padding
+        _ = (dst_dir / "notes.txt").write_text(file_content, encoding="utf-8")
+
+        _ = _run_script(src_template_dir=template_dir, dst_dir=dst_dir)
+
+        assert (dst_dir / "notes.txt").read_text(encoding="utf-8") == expected_hash_comment + "\n" + file_content
+
+
+class TestDestinationLookup:
+    def test_broken_symlink_at_template_path_is_skipped(self, tmp_path: Path) -> None:
+        template_dir = tmp_path / "template"
+        template_dir.mkdir()
+        (template_dir / "script.py").touch()
+
+        dst_dir = tmp_path / "destination"
+        dst_dir.mkdir()
+        (dst_dir / "script.py").symlink_to(dst_dir / "missing.py")
+
+        _ = _run_script(src_template_dir=template_dir, dst_dir=dst_dir)
+
+        assert _read_manifest(dst_dir)["templates"][0]["managed_files"] == []
+
+    def test_heavy_directories_in_template_are_not_walked(self, tmp_path: Path) -> None:
+        template_dir = tmp_path / "template"
+        (template_dir / "node_modules" / "left-pad").mkdir(parents=True)
+        (template_dir / "node_modules" / "left-pad" / "index.js").touch()
+        (template_dir / "index.js").touch()
+
+        dst_dir = tmp_path / "destination"
+        (dst_dir / "node_modules" / "left-pad").mkdir(parents=True)
+        file_content = "module.exports = 1;\n"
+        _ = (dst_dir / "node_modules" / "left-pad" / "index.js").write_text(file_content, encoding="utf-8")
+        _ = (dst_dir / "index.js").write_text(file_content, encoding="utf-8")
+
+        _ = _run_script(src_template_dir=template_dir, dst_dir=dst_dir)
+
+        assert (dst_dir / "node_modules" / "left-pad" / "index.js").read_text(encoding="utf-8") == file_content
+        assert _read_manifest(dst_dir)["templates"][0]["managed_files"] == ["index.js"]
+
+
 class TestManifest:
     def test_manifest_created_with_managed_files(self, tmp_path: Path) -> None:
         template_dir = tmp_path / "template"
@@ -492,6 +600,49 @@ class TestManifest:
         manifest = _read_manifest(dst_dir)
         assert len(manifest["templates"]) == 1
 
+    def test_manifest_written_with_no_temporary_file_left_behind(self, tmp_path: Path) -> None:
+        template_dir = tmp_path / "template"
+        template_dir.mkdir()
+        (template_dir / "a.txt").touch()
+
+        dst_dir = tmp_path / "destination"
+        dst_dir.mkdir()
+        _ = (dst_dir / "a.txt").write_text("content", encoding="utf-8")
+
+        _ = _run_script(src_template_dir=template_dir, dst_dir=dst_dir)
+
+        assert [f.name for f in (dst_dir / ".config").iterdir()] == [".copier-managed-files.json"]
+
+    def test_path_in_several_ancestor_manifests_attributed_to_the_first(self, tmp_path: Path) -> None:
+        template_root = tmp_path / "template_root"
+        template_dir = template_root / "template"
+        template_dir.mkdir(parents=True)
+        (template_dir / "shared.txt").touch()
+        (template_root / ".config").mkdir()
+        ancestor_manifest: _Manifest = {
+            "templates": [
+                {"src": "https://github.com/org/base-template", "managed_files": ["template/shared.txt"]},
+                {"src": "https://github.com/org/other-template", "managed_files": ["shared.txt"]},
+            ]
+        }
+        _ = (template_root / ".config" / ".copier-managed-files.json").write_text(
+            json.dumps(ancestor_manifest), encoding="utf-8"
+        )
+
+        dst_dir = tmp_path / "destination"
+        dst_dir.mkdir()
+        _ = (dst_dir / "shared.txt").write_text("content", encoding="utf-8")
+
+        _ = _run_script(
+            src_template_dir=template_dir, dst_dir=dst_dir, template_src="https://github.com/org/child-template"
+        )
+
+        srcs = {t["src"]: t["managed_files"] for t in _read_manifest(dst_dir)["templates"]}
+        assert srcs == {
+            "https://github.com/org/base-template": ["shared.txt"],
+            "https://github.com/org/child-template": [],
+        }
+
     def test_manifest_layering_preserves_other_template_entries(self, tmp_path: Path) -> None:
         template_dir = tmp_path / "template"
         template_dir.mkdir()
@@ -0,0 +1,276 @@
+/* tslint:disable */
+/* eslint-disable */
+// Generated by Microsoft Kiota
+// @ts-ignore
+import { type Parsable, type ParseNode, type SerializationWriter } from '@microsoft/kiota-abstractions';
+
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_0_strings(writer: SerializationWriter, key: string, model0Response_field_0_strings: Partial< string[]> | undefined | null = {}) : void {
+ if (model0Response_field_0_strings === undefined || model0Response_field_0_strings === null) return;
+ if (!model0Response_field_0_strings || typeof model0Response_field_0_strings === "string[]") { return; }
+ 
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_1_strings(writer: SerializationWriter, key: string, model0Response_field_1_strings: Partial< string[]> | undefined | null = {}) : void {
+ if (model0Response_field_1_strings === undefined || model0Response_field_1_strings === null) return;
+ if (!model0Response_field_1_strings || typeof model0Response_field_1_strings === "string[]") { return; }
+ 
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_2_number(writer: SerializationWriter, key: string, model0Response_field_2_number: Partial< number> | undefined | null = {}) : void {
+ if (model0Response_field_2_number === undefined || model0Response_field_2_number === null) return;
+ if (!model0Response_field_2_number || typeof model0Response_field_2_number === "number") { return; }
+ 
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_3_number(writer: SerializationWriter, key: string, model0Response_field_3_number: Partial< number> | undefined | null = {}) : void {
+ if (model0Response_field_3_number === undefined || model0Response_field_3_number === null) return;
+ if (!model0Response_field_3_number || typeof model0Response_field_3_number === "number") { return; }
+ 
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel0Response(model0Response: Partial<Model0Response> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+ return {
+ "id": n => { model0Response.id = n.getNumberValue(); },
+ "label": n => { model0Response.label = n.getStringValue(); },
+ "field_0_strings": n => { model0Response.field0Strings = n.getCollectionOfPrimitiveValues<string>(); },
+ "field_1_strings": n => { model0Response.field1Strings = n.getCollectionOfPrimitiveValues<string>(); },
+ "field_2_number": n => { model0Response.field2Number = n.getNumberValue(); },
+ "field_3_number": n => { model0Response.field3Number = n.getNumberValue(); },
+ }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response(writer: SerializationWriter, model0Response: Partial<Model0Response> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+ if (!model0Response || isSerializingDerivedType) { return; }
+ writer.writeNumberValue("id", model0Response.id);
+ writer.writeStringValue("label", model0Response.label);
+ writer.writeCollectionOfPrimitiveValues<string[]>("field_0_strings", model0Response.field0Strings as string[]);
+ writer.writeCollectionOfPrimitiveValues<string[]>("field_1_strings", model0Response.field1Strings as string[]);
+ writer.writeCollectionOfPrimitiveValues<number>("field_2_number", model0Response.field2Number as number);
+ writer.writeCollectionOfPrimitiveValues<number>("field_3_number", model0Response.field3Number as number);
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel1Response_field_0_boolean(writer: SerializationWriter, key: string, model1Response_field_0_boolean: Partial< boolean> | undefined | null = {}) : void {
+ if (model1Response_field_0_boolean === undefined || model1Response_field_0_boolean === null) return;
+ if (!model1Response_field_0_boolean || typeof model1Response_field_0_boolean === "boolean") { return; }
+ 
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel1Response_field_1_string(writer: SerializationWriter, key: string, model1Response_field_1_string: Partial< string> | undefined | null = {}) : void {
+ if (model1Response_field_1_string === undefined || model1Response_field_1_string === null) return;
+ if (!model1Response_field_1_string || typeof model1Response_field_1_string === "string") { return; }
+ 
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel1Response(model1Response: Partial<Model1Response> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+ return {
+ "id": n => { model1Response.id = n.getNumberValue(); },
+ "label": n => { model1Response.label = n.getStringValue(); },
+ "field_0_boolean": n => { model1Response.field0Boolean = n.getBooleanValue(); },
+ "field_1_string": n => { model1Response.field1String = n.getStringValue(); },
+ }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel1Response(writer: SerializationWriter, model1Response: Partial<Model1Response> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+ if (!model1Response || isSerializingDerivedType) { return; }
+ writer.writeNumberValue("id", model1Response.id);
+ writer.writeStringValue("label", model1Response.label);
+ writer.writeCollectionOfPrimitiveValues<boolean>("field_0_boolean", model1Response.field0Boolean as boolean);
+ writer.writeCollectionOfPrimitiveValues<string>("field_1_string", model1Response.field1String ?? "unset" as string as string);
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel2Response_field_0_number(writer: SerializationWriter, key: string, model2Response_field_0_number: Partial< number> | undefined | null = {}) : void {
+ if (model2Response_field_0_number === undefined || model2Response_field_0_number === null) return;
+ if (!model2Response_field_0_number || typeof model2Response_field_0_number === "number") { return; }
+ 
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel2Response_field_1_string(writer: SerializationWriter, key: string, model2Response_field_1_string: Partial< string> | undefined | null = {}) : void {
+ if (model2Response_field_1_string === undefined || model2Response_field_1_string === null) return;
+ if (!model2Response_field_1_string || typeof model2Response_field_1_string === "string") { return; }
+ 
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel2Response(model2Response: Partial<Model2Response> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+ return {
+ "id": n => { model2Response.id = n.getNumberValue(); },
+ "label": n => { model2Response.label = n.getStringValue(); },
+ "field_0_number": n => { model2Response.field0Number = n.getNumberValue(); },
+ "field_1_string": n => { model2Response.field1String = n.getStringValue(); },
+ }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel2Response(writer: SerializationWriter, model2Response: Partial<Model2Response> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+ if (!model2Response || isSerializingDerivedType) { return; }
+ writer.writeNumberValue("id", model2Response.id);
+ writer.writeStringValue("label", model2Response.label);
+ writer.writeCollectionOfPrimitiveValues<number>("field_0_number", model2Response.field0Number as number);
+ writer.writeCollectionOfPrimitiveValues<string>("field_1_string", model2Response.field1String as string);
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_0_string(writer: SerializationWriter, key: string, model3Response_field_0_string: Partial< string> | undefined | null = {}) : void {
+ if (model3Response_field_0_string === undefined || model3Response_field_0_string === null) return;
+ if (!model3Response_field_0_string || typeof model3Response_field_0_string === "string") { return; }
+ 
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_1_boolean(writer: SerializationWriter, key: string, model3Response_field_1_boolean: Partial< boolean> | undefined | null = {}) : void {
+ if (model3Response_field_1_boolean === undefined || model3Response_field_1_boolean === null) return;
+ if (!model3Response_field_1_boolean || typeof model3Response_field_1_boolean === "boolean") { return; }
+ 
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_2_strings(writer: SerializationWriter, key: string, model3Response_field_2_strings: Partial< string[]> | undefined | null = {}) : void {
+ if (model3Response_field_2_strings === undefined || model3Response_field_2_strings === null) return;
+ if (!model3Response_field_2_strings || typeof model3Response_field_2_strings === "string[]") { return; }
+ 
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_3_number(writer: SerializationWriter, key: string, model3Response_field_3_number: Partial< number> | undefined | null = {}) : void {
+ if (model3Response_field_3_number === undefined || model3Response_field_3_number === null) return;
+ if (!model3Response_field_3_number || typeof model3Response_field_3_number === "number") { return; }
+ 
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel3Response(model3Response: Partial<Model3Response> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+ return {
+ "id": n => { model3Response.id = n.getNumberValue(); },
+ "label": n => { model3Response.label = n.getStringValue(); },
+ "field_0_string": n => { model3Response.field0String = n.getStringValue(); },
+ "field_1_boolean": n => { model3Response.field1Boolean = n.getBooleanValue(); },
+ "field_2_strings": n => { model3Response.field2Strings = n.getCollectionOfPrimitiveValues<string>(); },
+ "field_3_number": n => { model3Response.field3Number = n.getNumberValue(); },
+ }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response(writer: SerializationWriter, model3Response: Partial<Model3Response> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+ if (!model3Response || isSerializingDerivedType) { return; }
+ writer.writeNumberValue("id", model3Response.id);
+ writer.writeStringValue("label", model3Response.label);
+ writer.writeCollectionOfPrimitiveValues<string>("field_0_string", model3Response.field0String as string);
+ writer.writeCollectionOfPrimitiveValues<boolean>("field_1_boolean", model3Response.field1Boolean as boolean);
+ writer.writeCollectionOfPrimitiveValues<string[]>("field_2_strings", model3Response.field2Strings as string[]);
+ writer.writeCollectionOfPrimitiveValues<number>("field_3_number", model3Response.field3Number as number);
+}
+export type Model0Response_field_0_strings = string[] | null;
+export type Model0Response_field_1_strings = string[] | null;
+export type Model0Response_field_2_number = number | null;
+export type Model0Response_field_3_number = number | null;
+export interface Model0Response extends Parsable {
+ id: number;
+ label?: string;
+ field0Strings?: string[] | null;
+ field1Strings?: string[] | null;
+ field2Number?: number | null;
+ field3Number?: number | null;
+}
+export type Model1Response_field_0_boolean = boolean | null;
+export type Model1Response_field_1_string = string | null;
+export interface Model1Response extends Parsable {
+ id: number;
+ label?: string;
+ field0Boolean?: boolean | null;
+ field1String?: string | null;
+}
+export type Model2Response_field_0_number = number | null;
+export type Model2Response_field_1_string = string | null;
+export interface Model2Response extends Parsable {
+ id: number;
+ label?: string;
+ field0Number?: number | null;
+ field1String?: string | null;
+}
+export type Model3Response_field_0_string = string | null;
+export type Model3Response_field_1_boolean = boolean | null;
+export type Model3Response_field_2_strings = string[] | null;
+export type Model3Response_field_3_number = number | null;
+export interface Model3Response extends Parsable {
+ id: number;
+ label?: string;
+ field0String?: string | null;
+ field1Boolean?: boolean | null;
+ field2Strings?: string[] | null;
+ field3Number?: number | null;
+}
+/* tslint:enable */
+/* eslint-enable */
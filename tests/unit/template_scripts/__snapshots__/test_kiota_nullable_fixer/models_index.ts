@@ -0,0 +1,612 @@
+/* tslint:disable */
+/* eslint-disable */
+// Generated by Microsoft Kiota
+// @ts-ignore
+import { type Parsable, type ParseNode, type SerializationWriter } from '@microsoft/kiota-abstractions';
+
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model0Response_field_0_stringsMember1}
+ */
+// @ts-ignore
+export function createModel0Response_field_0_stringsMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel0Response_field_0_stringsMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel0Response_field_0_stringsMember1(model0Response_field_0_stringsMember1: Partial<Model0Response_field_0_stringsMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_0_stringsMember1(writer: SerializationWriter, model0Response_field_0_stringsMember1: Partial<Model0Response_field_0_stringsMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model0Response_field_0_stringsMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_0_strings(writer: SerializationWriter, key: string, model0Response_field_0_strings: Partial<Model0Response_field_0_stringsMember1 | string[]> | undefined | null = {}) : void {
+    if (model0Response_field_0_strings === undefined || model0Response_field_0_strings === null) return;
+    if (!model0Response_field_0_strings | typeof model0Response_field_0_strings === "string[]") { return; }
+    serializeModel0Response_field_0_stringsMember1(writer, model0Response_field_0_strings as Model0Response_field_0_stringsMember1);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model0Response_field_1_stringsMember1}
+ */
+// @ts-ignore
+export function createModel0Response_field_1_stringsMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel0Response_field_1_stringsMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel0Response_field_1_stringsMember1(model0Response_field_1_stringsMember1: Partial<Model0Response_field_1_stringsMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_1_stringsMember1(writer: SerializationWriter, model0Response_field_1_stringsMember1: Partial<Model0Response_field_1_stringsMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model0Response_field_1_stringsMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_1_strings(writer: SerializationWriter, key: string, model0Response_field_1_strings: Partial<Model0Response_field_1_stringsMember1 | string[]> | undefined | null = {}) : void {
+    if (model0Response_field_1_strings === undefined || model0Response_field_1_strings === null) return;
+    if (!model0Response_field_1_strings | typeof model0Response_field_1_strings === "string[]") { return; }
+    serializeModel0Response_field_1_stringsMember1(writer, model0Response_field_1_strings as Model0Response_field_1_stringsMember1);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model0Response_field_2_numberMember1}
+ */
+// @ts-ignore
+export function createModel0Response_field_2_numberMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel0Response_field_2_numberMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel0Response_field_2_numberMember1(model0Response_field_2_numberMember1: Partial<Model0Response_field_2_numberMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_2_numberMember1(writer: SerializationWriter, model0Response_field_2_numberMember1: Partial<Model0Response_field_2_numberMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model0Response_field_2_numberMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_2_number(writer: SerializationWriter, key: string, model0Response_field_2_number: Partial<Model0Response_field_2_numberMember1 | number> | undefined | null = {}) : void {
+    if (model0Response_field_2_number === undefined || model0Response_field_2_number === null) return;
+    if (!model0Response_field_2_number | typeof model0Response_field_2_number === "number") { return; }
+    serializeModel0Response_field_2_numberMember1(writer, model0Response_field_2_number as Model0Response_field_2_numberMember1);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model0Response_field_3_numberMember1}
+ */
+// @ts-ignore
+export function createModel0Response_field_3_numberMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel0Response_field_3_numberMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel0Response_field_3_numberMember1(model0Response_field_3_numberMember1: Partial<Model0Response_field_3_numberMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_3_numberMember1(writer: SerializationWriter, model0Response_field_3_numberMember1: Partial<Model0Response_field_3_numberMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model0Response_field_3_numberMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response_field_3_number(writer: SerializationWriter, key: string, model0Response_field_3_number: Partial<Model0Response_field_3_numberMember1 | number> | undefined | null = {}) : void {
+    if (model0Response_field_3_number === undefined || model0Response_field_3_number === null) return;
+    if (!model0Response_field_3_number | typeof model0Response_field_3_number === "number") { return; }
+    serializeModel0Response_field_3_numberMember1(writer, model0Response_field_3_number as Model0Response_field_3_numberMember1);
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel0Response(model0Response: Partial<Model0Response> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+        "id": n => { model0Response.id = n.getNumberValue(); },
+        "label": n => { model0Response.label = n.getStringValue(); },
+        "field_0_strings": n => { model0Response.field0Strings = n.getObjectValue<Model0Response_field_0_stringsMember1>(createModel0Response_field_0_stringsMember1FromDiscriminatorValue) ?? n.getCollectionOfPrimitiveValues<string>(); },
+        "field_1_strings": n => { model0Response.field1Strings = n.getObjectValue<Model0Response_field_1_stringsMember1>(createModel0Response_field_1_stringsMember1FromDiscriminatorValue) ?? n.getCollectionOfPrimitiveValues<string>(); },
+        "field_2_number": n => { model0Response.field2Number = n.getNumberValue() ?? n.getObjectValue<Model0Response_field_2_numberMember1>(createModel0Response_field_2_numberMember1FromDiscriminatorValue); },
+        "field_3_number": n => { model0Response.field3Number = n.getNumberValue() ?? n.getObjectValue<Model0Response_field_3_numberMember1>(createModel0Response_field_3_numberMember1FromDiscriminatorValue); },
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel0Response(writer: SerializationWriter, model0Response: Partial<Model0Response> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model0Response || isSerializingDerivedType) { return; }
+    writer.writeNumberValue("id", model0Response.id);
+    writer.writeStringValue("label", model0Response.label);
+    writer.writeObjectValue<Model0Response_field_0_stringsMember1 | string[]>("field_0_strings", model0Response.field0Strings as Model0Response_field_0_stringsMember1 | string[], serializeModel0Response_field_0_strings);
+    writer.writeObjectValue<Model0Response_field_1_stringsMember1 | string[]>("field_1_strings", model0Response.field1Strings as Model0Response_field_1_stringsMember1 | string[], serializeModel0Response_field_1_strings);
+    writer.writeObjectValue<Model0Response_field_2_numberMember1 | number>("field_2_number", model0Response.field2Number as Model0Response_field_2_numberMember1 | number, serializeModel0Response_field_2_number);
+    writer.writeObjectValue<Model0Response_field_3_numberMember1 | number>("field_3_number", model0Response.field3Number as Model0Response_field_3_numberMember1 | number, serializeModel0Response_field_3_number);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model1Response_field_0_booleanMember1}
+ */
+// @ts-ignore
+export function createModel1Response_field_0_booleanMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel1Response_field_0_booleanMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel1Response_field_0_booleanMember1(model1Response_field_0_booleanMember1: Partial<Model1Response_field_0_booleanMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel1Response_field_0_booleanMember1(writer: SerializationWriter, model1Response_field_0_booleanMember1: Partial<Model1Response_field_0_booleanMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model1Response_field_0_booleanMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel1Response_field_0_boolean(writer: SerializationWriter, key: string, model1Response_field_0_boolean: Partial<Model1Response_field_0_booleanMember1 | boolean> | undefined | null = {}) : void {
+    if (model1Response_field_0_boolean === undefined || model1Response_field_0_boolean === null) return;
+    if (!model1Response_field_0_boolean | typeof model1Response_field_0_boolean === "boolean") { return; }
+    serializeModel1Response_field_0_booleanMember1(writer, model1Response_field_0_boolean as Model1Response_field_0_booleanMember1);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model1Response_field_1_stringMember1}
+ */
+// @ts-ignore
+export function createModel1Response_field_1_stringMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel1Response_field_1_stringMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel1Response_field_1_stringMember1(model1Response_field_1_stringMember1: Partial<Model1Response_field_1_stringMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel1Response_field_1_stringMember1(writer: SerializationWriter, model1Response_field_1_stringMember1: Partial<Model1Response_field_1_stringMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model1Response_field_1_stringMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel1Response_field_1_string(writer: SerializationWriter, key: string, model1Response_field_1_string: Partial<Model1Response_field_1_stringMember1 | string> | undefined | null = {}) : void {
+    if (model1Response_field_1_string === undefined || model1Response_field_1_string === null) return;
+    if (!model1Response_field_1_string | typeof model1Response_field_1_string === "string") { return; }
+    serializeModel1Response_field_1_stringMember1(writer, model1Response_field_1_string as Model1Response_field_1_stringMember1);
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel1Response(model1Response: Partial<Model1Response> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+        "id": n => { model1Response.id = n.getNumberValue(); },
+        "label": n => { model1Response.label = n.getStringValue(); },
+        "field_0_boolean": n => { model1Response.field0Boolean = n.getObjectValue<Model1Response_field_0_booleanMember1>(createModel1Response_field_0_booleanMember1FromDiscriminatorValue) ?? n.getBooleanValue(); },
+        "field_1_string": n => { model1Response.field1String = n.getStringValue() ?? n.getObjectValue<Model1Response_field_1_stringMember1>(createModel1Response_field_1_stringMember1FromDiscriminatorValue); },
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel1Response(writer: SerializationWriter, model1Response: Partial<Model1Response> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model1Response || isSerializingDerivedType) { return; }
+    writer.writeNumberValue("id", model1Response.id);
+    writer.writeStringValue("label", model1Response.label);
+    writer.writeObjectValue<Model1Response_field_0_booleanMember1 | boolean>("field_0_boolean", model1Response.field0Boolean as Model1Response_field_0_booleanMember1 | boolean, serializeModel1Response_field_0_boolean);
+    writer.writeObjectValue<Model1Response_field_1_stringMember1 | string>("field_1_string", model1Response.field1String ?? "unset" as string as Model1Response_field_1_stringMember1 | string, serializeModel1Response_field_1_string);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model2Response_field_0_numberMember1}
+ */
+// @ts-ignore
+export function createModel2Response_field_0_numberMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel2Response_field_0_numberMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel2Response_field_0_numberMember1(model2Response_field_0_numberMember1: Partial<Model2Response_field_0_numberMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel2Response_field_0_numberMember1(writer: SerializationWriter, model2Response_field_0_numberMember1: Partial<Model2Response_field_0_numberMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model2Response_field_0_numberMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel2Response_field_0_number(writer: SerializationWriter, key: string, model2Response_field_0_number: Partial<Model2Response_field_0_numberMember1 | number> | undefined | null = {}) : void {
+    if (model2Response_field_0_number === undefined || model2Response_field_0_number === null) return;
+    if (!model2Response_field_0_number | typeof model2Response_field_0_number === "number") { return; }
+    serializeModel2Response_field_0_numberMember1(writer, model2Response_field_0_number as Model2Response_field_0_numberMember1);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model2Response_field_1_stringMember1}
+ */
+// @ts-ignore
+export function createModel2Response_field_1_stringMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel2Response_field_1_stringMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel2Response_field_1_stringMember1(model2Response_field_1_stringMember1: Partial<Model2Response_field_1_stringMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel2Response_field_1_stringMember1(writer: SerializationWriter, model2Response_field_1_stringMember1: Partial<Model2Response_field_1_stringMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model2Response_field_1_stringMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel2Response_field_1_string(writer: SerializationWriter, key: string, model2Response_field_1_string: Partial<Model2Response_field_1_stringMember1 | string> | undefined | null = {}) : void {
+    if (model2Response_field_1_string === undefined || model2Response_field_1_string === null) return;
+    if (!model2Response_field_1_string | typeof model2Response_field_1_string === "string") { return; }
+    serializeModel2Response_field_1_stringMember1(writer, model2Response_field_1_string as Model2Response_field_1_stringMember1);
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel2Response(model2Response: Partial<Model2Response> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+        "id": n => { model2Response.id = n.getNumberValue(); },
+        "label": n => { model2Response.label = n.getStringValue(); },
+        "field_0_number": n => { model2Response.field0Number = n.getObjectValue<Model2Response_field_0_numberMember1>(createModel2Response_field_0_numberMember1FromDiscriminatorValue) ?? n.getNumberValue(); },
+        "field_1_string": n => { model2Response.field1String = n.getStringValue() ?? n.getObjectValue<Model2Response_field_1_stringMember1>(createModel2Response_field_1_stringMember1FromDiscriminatorValue); },
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel2Response(writer: SerializationWriter, model2Response: Partial<Model2Response> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model2Response || isSerializingDerivedType) { return; }
+    writer.writeNumberValue("id", model2Response.id);
+    writer.writeStringValue("label", model2Response.label);
+    writer.writeObjectValue<Model2Response_field_0_numberMember1 | number>("field_0_number", model2Response.field0Number as Model2Response_field_0_numberMember1 | number, serializeModel2Response_field_0_number);
+    writer.writeObjectValue<Model2Response_field_1_stringMember1 | string>("field_1_string", model2Response.field1String as Model2Response_field_1_stringMember1 | string, serializeModel2Response_field_1_string);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model3Response_field_0_stringMember1}
+ */
+// @ts-ignore
+export function createModel3Response_field_0_stringMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel3Response_field_0_stringMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel3Response_field_0_stringMember1(model3Response_field_0_stringMember1: Partial<Model3Response_field_0_stringMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_0_stringMember1(writer: SerializationWriter, model3Response_field_0_stringMember1: Partial<Model3Response_field_0_stringMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model3Response_field_0_stringMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_0_string(writer: SerializationWriter, key: string, model3Response_field_0_string: Partial<Model3Response_field_0_stringMember1 | string> | undefined | null = {}) : void {
+    if (model3Response_field_0_string === undefined || model3Response_field_0_string === null) return;
+    if (!model3Response_field_0_string | typeof model3Response_field_0_string === "string") { return; }
+    serializeModel3Response_field_0_stringMember1(writer, model3Response_field_0_string as Model3Response_field_0_stringMember1);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model3Response_field_1_booleanMember1}
+ */
+// @ts-ignore
+export function createModel3Response_field_1_booleanMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel3Response_field_1_booleanMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel3Response_field_1_booleanMember1(model3Response_field_1_booleanMember1: Partial<Model3Response_field_1_booleanMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_1_booleanMember1(writer: SerializationWriter, model3Response_field_1_booleanMember1: Partial<Model3Response_field_1_booleanMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model3Response_field_1_booleanMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_1_boolean(writer: SerializationWriter, key: string, model3Response_field_1_boolean: Partial<Model3Response_field_1_booleanMember1 | boolean> | undefined | null = {}) : void {
+    if (model3Response_field_1_boolean === undefined || model3Response_field_1_boolean === null) return;
+    if (!model3Response_field_1_boolean | typeof model3Response_field_1_boolean === "boolean") { return; }
+    serializeModel3Response_field_1_booleanMember1(writer, model3Response_field_1_boolean as Model3Response_field_1_booleanMember1);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model3Response_field_2_stringsMember1}
+ */
+// @ts-ignore
+export function createModel3Response_field_2_stringsMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel3Response_field_2_stringsMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel3Response_field_2_stringsMember1(model3Response_field_2_stringsMember1: Partial<Model3Response_field_2_stringsMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_2_stringsMember1(writer: SerializationWriter, model3Response_field_2_stringsMember1: Partial<Model3Response_field_2_stringsMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model3Response_field_2_stringsMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_2_strings(writer: SerializationWriter, key: string, model3Response_field_2_strings: Partial<Model3Response_field_2_stringsMember1 | string[]> | undefined | null = {}) : void {
+    if (model3Response_field_2_strings === undefined || model3Response_field_2_strings === null) return;
+    if (!model3Response_field_2_strings | typeof model3Response_field_2_strings === "string[]") { return; }
+    serializeModel3Response_field_2_stringsMember1(writer, model3Response_field_2_strings as Model3Response_field_2_stringsMember1);
+}
+/**
+ * Creates a new instance of the appropriate class based on discriminator value
+ * @param parseNode The parse node to use to read the discriminator value and create the object
+ * @returns {Model3Response_field_3_numberMember1}
+ */
+// @ts-ignore
+export function createModel3Response_field_3_numberMember1FromDiscriminatorValue(parseNode: ParseNode | undefined) : ((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {
+    return deserializeIntoModel3Response_field_3_numberMember1;
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel3Response_field_3_numberMember1(model3Response_field_3_numberMember1: Partial<Model3Response_field_3_numberMember1> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_3_numberMember1(writer: SerializationWriter, model3Response_field_3_numberMember1: Partial<Model3Response_field_3_numberMember1> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model3Response_field_3_numberMember1 || isSerializingDerivedType) { return; }
+}
+/**
+ * Serializes the union
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response_field_3_number(writer: SerializationWriter, key: string, model3Response_field_3_number: Partial<Model3Response_field_3_numberMember1 | number> | undefined | null = {}) : void {
+    if (model3Response_field_3_number === undefined || model3Response_field_3_number === null) return;
+    if (!model3Response_field_3_number | typeof model3Response_field_3_number === "number") { return; }
+    serializeModel3Response_field_3_numberMember1(writer, model3Response_field_3_number as Model3Response_field_3_numberMember1);
+}
+/**
+ * The deserialization information for the current model
+ * @returns {Record<string, (node: ParseNode) => void>}
+ */
+// @ts-ignore
+export function deserializeIntoModel3Response(model3Response: Partial<Model3Response> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+    return {
+        "id": n => { model3Response.id = n.getNumberValue(); },
+        "label": n => { model3Response.label = n.getStringValue(); },
+        "field_0_string": n => { model3Response.field0String = n.getObjectValue<Model3Response_field_0_stringMember1>(createModel3Response_field_0_stringMember1FromDiscriminatorValue) ?? n.getStringValue(); },
+        "field_1_boolean": n => { model3Response.field1Boolean = n.getBooleanValue() ?? n.getObjectValue<Model3Response_field_1_booleanMember1>(createModel3Response_field_1_booleanMember1FromDiscriminatorValue); },
+        "field_2_strings": n => { model3Response.field2Strings = n.getObjectValue<Model3Response_field_2_stringsMember1>(createModel3Response_field_2_stringsMember1FromDiscriminatorValue) ?? n.getCollectionOfPrimitiveValues<string>(); },
+        "field_3_number": n => { model3Response.field3Number = n.getObjectValue<Model3Response_field_3_numberMember1>(createModel3Response_field_3_numberMember1FromDiscriminatorValue) ?? n.getNumberValue(); },
+    }
+}
+/**
+ * Serializes information the current object
+ * @param writer Serialization writer to use to serialize this model
+ */
+// @ts-ignore
+export function serializeModel3Response(writer: SerializationWriter, model3Response: Partial<Model3Response> | undefined | null = {}, isSerializingDerivedType: boolean = false) : void {
+    if (!model3Response || isSerializingDerivedType) { return; }
+    writer.writeNumberValue("id", model3Response.id);
+    writer.writeStringValue("label", model3Response.label);
+    writer.writeObjectValue<Model3Response_field_0_stringMember1 | string>("field_0_string", model3Response.field0String as Model3Response_field_0_stringMember1 | string, serializeModel3Response_field_0_string);
+    writer.writeObjectValue<Model3Response_field_1_booleanMember1 | boolean>("field_1_boolean", model3Response.field1Boolean as Model3Response_field_1_booleanMember1 | boolean, serializeModel3Response_field_1_boolean);
+    writer.writeObjectValue<Model3Response_field_2_stringsMember1 | string[]>("field_2_strings", model3Response.field2Strings as Model3Response_field_2_stringsMember1 | string[], serializeModel3Response_field_2_strings);
+    writer.writeObjectValue<Model3Response_field_3_numberMember1 | number>("field_3_number", model3Response.field3Number as Model3Response_field_3_numberMember1 | number, serializeModel3Response_field_3_number);
+}
+export type Model0Response_field_0_strings = Model0Response_field_0_stringsMember1 | string[];
+export interface Model0Response_field_0_stringsMember1 extends Parsable {
+}
+export type Model0Response_field_1_strings = Model0Response_field_1_stringsMember1 | string[];
+export interface Model0Response_field_1_stringsMember1 extends Parsable {
+}
+export type Model0Response_field_2_number = Model0Response_field_2_numberMember1 | number;
+export interface Model0Response_field_2_numberMember1 extends Parsable {
+}
+export type Model0Response_field_3_number = Model0Response_field_3_numberMember1 | number;
+export interface Model0Response_field_3_numberMember1 extends Parsable {
+}
+export interface Model0Response extends Parsable {
+    id: number;
+    label?: string;
+    field0Strings?: Model0Response_field_0_stringsMember1 | string[] | null;
+    field1Strings?: Model0Response_field_1_stringsMember1 | string[] | null;
+    field2Number?: Model0Response_field_2_numberMember1 | number | null;
+    field3Number?: Model0Response_field_3_numberMember1 | number | null;
+}
+export type Model1Response_field_0_boolean = Model1Response_field_0_booleanMember1 | boolean;
+export interface Model1Response_field_0_booleanMember1 extends Parsable {
+}
+export type Model1Response_field_1_string = Model1Response_field_1_stringMember1 | string;
+export interface Model1Response_field_1_stringMember1 extends Parsable {
+}
+export interface Model1Response extends Parsable {
+    id: number;
+    label?: string;
+    field0Boolean?: Model1Response_field_0_booleanMember1 | boolean | null;
+    field1String?: Model1Response_field_1_stringMember1 | string | null;
+}
+export type Model2Response_field_0_number = Model2Response_field_0_numberMember1 | number;
+export interface Model2Response_field_0_numberMember1 extends Parsable {
+}
+export type Model2Response_field_1_string = Model2Response_field_1_stringMember1 | string;
+export interface Model2Response_field_1_stringMember1 extends Parsable {
+}
+export interface Model2Response extends Parsable {
+    id: number;
+    label?: string;
+    field0Number?: Model2Response_field_0_numberMember1 | number | null;
+    field1String?: Model2Response_field_1_stringMember1 | string | null;
+}
+export type Model3Response_field_0_string = Model3Response_field_0_stringMember1 | string;
+export interface Model3Response_field_0_stringMember1 extends Parsable {
+}
+export type Model3Response_field_1_boolean = Model3Response_field_1_booleanMember1 | boolean;
+export interface Model3Response_field_1_booleanMember1 extends Parsable {
+}
+export type Model3Response_field_2_strings = Model3Response_field_2_stringsMember1 | string[];
+export interface Model3Response_field_2_stringsMember1 extends Parsable {
+}
+export type Model3Response_field_3_number = Model3Response_field_3_numberMember1 | number;
+export interface Model3Response_field_3_numberMember1 extends Parsable {
+}
+export interface Model3Response extends Parsable {
+    id: number;
+    label?: string;
+    field0String?: Model3Response_field_0_stringMember1 | string | null;
+    field1Boolean?: Model3Response_field_1_booleanMember1 | boolean | null;
+    field2Strings?: Model3Response_field_2_stringsMember1 | string[] | null;
+    field3Number?: Model3Response_field_3_numberMember1 | number | null;
+}
+/* tslint:enable */
+/* eslint-enable */
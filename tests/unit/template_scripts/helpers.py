@@ -0,0 +1,166 @@
+import importlib.util
+import random
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+FRONTEND_TEMPLATE_DIR = PROJECT_ROOT / "template" / "frontend"
+SNAPSHOTS_DIR = Path(__file__).parent / "__snapshots__"
+
+
+def load_template_script(script_path: Path) -> ModuleType:
+    """Import a script that ships inside the template (so isn't on the path of this repo's own tests) by its path."""
+    spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
+    assert spec is not None, f"Could not load a module spec from {script_path}"
+    assert spec.loader is not None, f"Expected a loader for {script_path}"
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[script_path.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# field kind -> (TypeScript type, Kiota's getter for the primitive side of the anyOf)
+_NULLABLE_FIELD_KINDS = {
+    "string": ("string", "n.getStringValue()"),
+    "boolean": ("boolean", "n.getBooleanValue()"),
+    "number": ("number", "n.getNumberValue()"),
+    "strings": ("string[]", "n.getCollectionOfPrimitiveValues<string>()"),
+}
+
+
+def _jsdoc(*lines: str) -> str:
+    return "/**\n" + "".join(f" * {line}\n" for line in lines) + " */\n"
+
+
+def _member1_helpers(union_name: str) -> str:
+    member1 = f"{union_name}Member1"
+    var_name = member1[0].lower() + member1[1:]
+    return (
+        _jsdoc(
+            "Creates a new instance of the appropriate class based on discriminator value",
+            "@param parseNode The parse node to use to read the discriminator value and create the object",
+            f"@returns {{{member1}}}",
+        )
+        + "// @ts-ignore\n"
+        + f"export function create{member1}FromDiscriminatorValue(parseNode: ParseNode | undefined) : "
+        + "((instance?: Parsable) => Record<string, (node: ParseNode) => void>) {\n"
+        + f"    return deserializeInto{member1};\n}}\n"
+        + _jsdoc(
+            "The deserialization information for the current model",
+            "@returns {Record<string, (node: ParseNode) => void>}",
+        )
+        + "// @ts-ignore\n"
+        + f"export function deserializeInto{member1}({var_name}: Partial<{member1}> | undefined = {{}}) : "
+        + "Record<string, (node: ParseNode) => void> {\n    return {\n    }\n}\n"
+        + _jsdoc(
+            "Serializes information the current object",
+            "@param writer Serialization writer to use to serialize this model",
+        )
+        + "// @ts-ignore\n"
+        + f"export function serialize{member1}(writer: SerializationWriter, {var_name}: Partial<{member1}> | undefined | null = {{}}, "
+        + "isSerializingDerivedType: boolean = false) : void {\n"
+        + f"    if (!{var_name} || isSerializingDerivedType) {{ return; }}\n}}\n"
+    )
+
+
+def build_kiota_models_index(*, model_count: int, seed: int) -> str:
+    """Build a models/index.ts shaped like Kiota's TypeScript output for models with ``anyOf: [type, null]`` fields.
+
+    Each model mixes nullable fields of every kind the fixer handles with plain required fields, in both orders
+    Kiota emits the getter coalesce in, and with and without a schema default.
+    """
+    rng = random.Random(seed)
+    interfaces: list[str] = []
+    functions: list[str] = []
+    for model_index in range(model_count):
+        model = f"Model{model_index}Response"
+        var_name = model[0].lower() + model[1:]
+        props = ["    id: number;", "    label?: string;"]
+        deserializers = [
+            f'        "id": n => {{ {var_name}.id = n.getNumberValue(); }},',
+            f'        "label": n => {{ {var_name}.label = n.getStringValue(); }},',
+        ]
+        serializers = [
+            f'    writer.writeNumberValue("id", {var_name}.id);',
+            f'    writer.writeStringValue("label", {var_name}.label);',
+        ]
+        for field_index in range(rng.randint(1, 4)):
+            kind = rng.choice(list(_NULLABLE_FIELD_KINDS))
+            ts_type, getter = _NULLABLE_FIELD_KINDS[kind]
+            field = f"field_{field_index}_{kind}"
+            camel_field = f"field{field_index}{kind.capitalize()}"
+            union_name = f"{model}_{field}"
+            member1 = f"{union_name}Member1"
+            props.append(f"    {camel_field}?: {member1} | {ts_type} | null;")
+            object_getter = f"n.getObjectValue<{member1}>(create{member1}FromDiscriminatorValue)"
+            if rng.random() < 0.5:  # noqa: PLR2004 # even split between the two orders Kiota emits
+                coalesce = f"{object_getter} ?? {getter}"
+            else:
+                coalesce = f"{getter} ?? {object_getter}"
+            deserializers.append(f'        "{field}": n => {{ {var_name}.{camel_field} = {coalesce}; }},')
+            default = ' ?? "unset" as string' if kind == "string" and rng.random() < 0.3 else ""  # noqa: PLR2004 # some fields have a schema default
+            serializers.append(
+                f'    writer.writeObjectValue<{member1} | {ts_type}>("{field}", {var_name}.{camel_field}{default} as {member1} | {ts_type}, serialize{union_name});'
+            )
+            interfaces.append(f"export type {union_name} = {member1} | {ts_type};\n")
+            interfaces.append(f"export interface {member1} extends Parsable {{\n}}\n")
+            functions.append(_member1_helpers(union_name))
+            functions.append(
+                _jsdoc("Serializes the union", "@param writer Serialization writer to use to serialize this model")
+                + "// @ts-ignore\n"
+                + f"export function serialize{union_name}(writer: SerializationWriter, key: string, {var_name}_{field}: Partial<{member1} | {ts_type}> | undefined | null = {{}}) : void {{\n"
+                + f"    if ({var_name}_{field} === undefined || {var_name}_{field} === null) return;\n"
+                + f'    if (!{var_name}_{field} | typeof {var_name}_{field} === "{ts_type}") {{ return; }}\n'
+                + f"    serialize{member1}(writer, {var_name}_{field} as {member1});\n}}\n"
+            )
+        interfaces.append(f"export interface {model} extends Parsable {{\n" + "\n".join(props) + "\n}\n")
+        functions.append(
+            _jsdoc(
+                "The deserialization information for the current model",
+                "@returns {Record<string, (node: ParseNode) => void>}",
+            )
+            + "// @ts-ignore\n"
+            + f"export function deserializeInto{model}({var_name}: Partial<{model}> | undefined = {{}}) : Record<string, (node: ParseNode) => void> {{\n"
+            + "    return {\n"
+            + "\n".join(deserializers)
+            + "\n    }\n}\n"
+        )
+        functions.append(
+            _jsdoc(
+                "Serializes information the current object",
+                "@param writer Serialization writer to use to serialize this model",
+            )
+            + "// @ts-ignore\n"
+            + f"export function serialize{model}(writer: SerializationWriter, {var_name}: Partial<{model}> | undefined | null = {{}}, isSerializingDerivedType: boolean = false) : void {{\n"
+            + f"    if (!{var_name} || isSerializingDerivedType) {{ return; }}\n"
+            + "\n".join(serializers)
+            + "\n}\n"
+        )
+    header = (
+        "/* tslint:disable */\n/* eslint-disable */\n// Generated by Microsoft Kiota\n"
+        "// @ts-ignore\nimport { type Parsable, type ParseNode, type SerializationWriter } from '@microsoft/kiota-abstractions';\n\n"
+    )
+    return header + "".join(functions) + "".join(interfaces) + "/* tslint:enable */\n/* eslint-enable */\n"
+
+
+def run_git(repo_path: Path, *args: str) -> str:
+    return subprocess.run(  # noqa: S603 # these are our own fixed git commands
+        ["git", "-C", str(repo_path), *args],  # noqa: S607 # git is always on the PATH where these tests run
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def init_git_repo(repo_path: Path) -> None:
+    _ = run_git(repo_path, "init", "--quiet")
+    _ = run_git(repo_path, "config", "user.name", "Test")
+    _ = run_git(repo_path, "config", "user.email", "test@example.com")
+    _ = run_git(repo_path, "config", "core.autocrlf", "false")
+
+
+def commit_all(repo_path: Path) -> None:
+    _ = run_git(repo_path, "add", "--all")
+    _ = run_git(repo_path, "commit", "--quiet", "--message", "Snapshot")
@@ -0,0 +1,137 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from .helpers import PROJECT_ROOT
+from .helpers import commit_all
+from .helpers import init_git_repo
+from .helpers import load_template_script
+from .helpers import run_git
+
+_SCRIPT_PATH = PROJECT_ROOT / "template" / ".github" / "workflows" / "hash_git_files.py"
+hash_git_files = load_template_script(_SCRIPT_PATH)
+
+_UV_LOCK = """\
+version = 1
+
+[[package]]
+name = "my-app"
+version = "{root_version}"
+source = {{ virtual = "." }}
+
+[[package]]
+name = "requests"
+version = "{requests_version}"
+"""
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    init_git_repo(tmp_path)
+    _ = (tmp_path / "app.py").write_text("print('hello')\n")
+    (tmp_path / "data").mkdir()
+    _ = (tmp_path / "data" / "pnpm-lock.yaml").write_text("lockfileVersion: '9.0'\n" * 100)
+    _ = (tmp_path / "uv.lock").write_text(_UV_LOCK.format(root_version="1.0.0", requests_version="2.32.0"))
+    commit_all(tmp_path)
+    return tmp_path
+
+
+def _blob_checksum(repo_path: Path) -> int:
+    index_entries = hash_git_files.get_git_index_entries(repo_path)
+    return hash_git_files.compute_git_blob_checksum(repo_path, list(index_entries), index_entries)
+
+
+def test_Given_committed_files__Then_blob_ids_match_git(repo: Path):
+    index_entries = hash_git_files.get_git_index_entries(repo)
+
+    for file in ("app.py", "data/pnpm-lock.yaml"):
+        expected_object_id = run_git(repo, "hash-object", file).strip()
+        assert index_entries[file].object_id == expected_object_id
+        content = (repo / file).read_bytes()
+        assert hash_git_files.git_blob_id(content, object_id_length=len(expected_object_id)).hex() == expected_object_id
+
+
+def test_Given_unmodified_lf_files__Then_contents_not_read(repo: Path, monkeypatch: pytest.MonkeyPatch):
+    read_files: list[str] = []
+    original_read_bytes = Path.read_bytes
+
+    def spy_read_bytes(path: Path) -> bytes:
+        read_files.append(path.name)
+        return original_read_bytes(path)
+
+    monkeypatch.setattr(Path, Path.read_bytes.__name__, spy_read_bytes)
+
+    _ = _blob_checksum(repo)
+
+    assert read_files == []  # uv.lock is read too, but as text, for its root package version line
+
+
+def test_Given_worktree_modification__Then_checksum_changes_and_reverting_restores_it(repo: Path):
+    original_checksum = _blob_checksum(repo)
+    lock_file = repo / "data" / "pnpm-lock.yaml"
+    original_content = lock_file.read_text()
+
+    _ = lock_file.write_text(original_content + "packages: {}\n")
+    modified_checksum = _blob_checksum(repo)
+    _ = lock_file.write_text(original_content)
+
+    assert modified_checksum != original_checksum
+    assert _blob_checksum(repo) == original_checksum
+
+
+def test_Given_checkout_with_crlf_line_endings__Then_same_checksum_as_lf(repo: Path):
+    lf_checksum = _blob_checksum(repo)
+
+    for file in ("app.py", "data/pnpm-lock.yaml", "uv.lock"):  # like a windows checkout
+        _ = (repo / file).write_bytes((repo / file).read_bytes().replace(b"\n", b"\r\n"))
+
+    assert _blob_checksum(repo) == lf_checksum
+
+
+@pytest.mark.parametrize(
+    ("root_version", "requests_version", "expect_changed"),
+    [
+        pytest.param("1.1.0", "2.32.0", False, id="root-package-version-bump"),
+        pytest.param("1.0.0", "2.33.0", True, id="dependency-version-change"),
+    ],
+)
+def test_Given_uv_lock_change__Then_only_dependency_changes_alter_checksum(
+    repo: Path,
+    root_version: str,
+    requests_version: str,
+    expect_changed: bool,
+):
+    original_checksum = _blob_checksum(repo)
+
+    _ = (repo / "uv.lock").write_text(_UV_LOCK.format(root_version=root_version, requests_version=requests_version))
+    commit_all(repo)
+
+    assert (_blob_checksum(repo) != original_checksum) is expect_changed
+
+
+def test_Given_symlink__Then_target_content_hashed(repo: Path):
+    _ = (repo / "untracked.txt").write_text("before\n")
+    (repo / "linked.txt").symlink_to("untracked.txt")
+    _ = run_git(repo, "add", "linked.txt")
+    original_checksum = _blob_checksum(repo)
+
+    _ = (repo / "untracked.txt").write_text("after\n")
+
+    assert _blob_checksum(repo) != original_checksum
+
+
+def test_When_run_with_git_blob_ids__Then_checksum_printed(repo: Path):
+    result = subprocess.run(  # noqa: S603 # this is our own script
+        [sys.executable, str(_SCRIPT_PATH), str(repo), "--git-blob-ids"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == f"{_blob_checksum(repo):08x}"
+
+
+def test_Then_repo_copy_matches_the_template_copy():
+    assert (PROJECT_ROOT / ".github" / "workflows" / "hash_git_files.py").read_text() == _SCRIPT_PATH.read_text()
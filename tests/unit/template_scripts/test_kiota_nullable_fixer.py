@@ -0,0 +1,165 @@
+from pathlib import Path
+
+import pytest
+
+from .helpers import FRONTEND_TEMPLATE_DIR
+from .helpers import SNAPSHOTS_DIR
+from .helpers import build_kiota_models_index
+from .helpers import load_template_script
+
+kiota_nullable_fixer = load_template_script(FRONTEND_TEMPLATE_DIR / "kiota_nullable_fixer.py")
+
+_SNAPSHOT_DIR = SNAPSHOTS_DIR / "test_kiota_nullable_fixer"
+
+_FUNCTIONS_WITH_ONE_MEMBER1_HELPER = """\
+/**
+ * Kept
+ */
+export function serializeThing(writer: SerializationWriter) : void {
+ if (x) { return; }
+}
+/**
+ * Removed
+ */
+// @ts-ignore
+export function serializeThingMember1(writer: SerializationWriter) : void {
+ if (x) { return; }
+}
+/**
+ * Also kept
+ */
+export function deserializeIntoThing() : Record<string, (node: ParseNode) => void> {
+ return {
+ }
+}
+"""
+
+_UNCLOSED_MEMBER1_HELPER = """\
+/**
+ * Never closed
+ */
+export function createThingMember1FromDiscriminatorValue() : void {
+ return {
+"""
+
+
+def _fix(tmp_path: Path, content: str) -> tuple[str, int]:
+    index_file = tmp_path / "index.ts"
+    _ = index_file.write_text(content)
+    fixes_applied = kiota_nullable_fixer.fix_anyof_nullable_types(index_file)
+    return index_file.read_text(), fixes_applied
+
+
+def test_Given_generated_models__When_fixed__Then_identical_to_the_output_of_the_per_type_regex_fixer(tmp_path: Path):
+    # the expected output was produced by the fixer as it was before it was rewritten to make a single pass per pattern
+    fixed, fixes_applied = _fix(tmp_path, (_SNAPSHOT_DIR / "models_index.ts").read_text())
+
+    assert fixed == (_SNAPSHOT_DIR / "models_index.fixed.ts").read_text()
+    assert fixes_applied == 96  # noqa: PLR2004 # the count the previous fixer reported for the same file
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_Given_generated_models__When_fixed__Then_no_member1_left(tmp_path: Path, seed: int):
+    fixed, fixes_applied = _fix(tmp_path, build_kiota_models_index(model_count=10, seed=seed))
+
+    assert "Member1" not in fixed
+    assert fixes_applied > 0
+
+
+def test_Given_no_member1__When_fixed__Then_file_untouched(tmp_path: Path):
+    content = "export interface Thing extends Parsable {\n name?: string | null;\n}\n"
+
+    fixed, fixes_applied = _fix(tmp_path, content)
+
+    assert fixed == content
+    assert fixes_applied == 0
+
+
+def test_Given_member1_helper_between_other_functions__When_fixed__Then_only_the_helper_removed(tmp_path: Path):
+    fixed, fixes_applied = _fix(tmp_path, _FUNCTIONS_WITH_ONE_MEMBER1_HELPER)
+
+    assert fixed == _FUNCTIONS_WITH_ONE_MEMBER1_HELPER.replace(
+        "/**\n * Removed\n */\n// @ts-ignore\nexport function serializeThingMember1(writer: SerializationWriter) : void {\n if (x) { return; }\n}\n",
+        "",
+    )
+    assert fixes_applied == 1
+
+
+def test_Given_member1_helper_never_closed__When_fixed__Then_rest_of_file_left_as_is(tmp_path: Path):
+    content = _FUNCTIONS_WITH_ONE_MEMBER1_HELPER + _UNCLOSED_MEMBER1_HELPER
+
+    fixed, _ = _fix(tmp_path, content)
+
+    assert fixed.endswith(_UNCLOSED_MEMBER1_HELPER)
+    assert "serializeThingMember1" not in fixed
+
+
+_TWO_MODELS = """\
+export interface Gadget extends Parsable {
+    label?: string | null;
+    notes?: string | null;
+}
+export interface Widget extends Parsable {
+    label?: string | null;
+}
+"""
+
+
+def test_Given_required_fields_for_several_models__When_fixed__Then_only_those_fields_made_required():
+    fixed, fixed_count = kiota_nullable_fixer.fix_required_fields(
+        _TWO_MODELS, {"Widget": {"label"}, "Gadget": {"label"}, "NotGenerated": {"label"}}
+    )
+
+    assert fixed == _TWO_MODELS.replace("label?: string | null;", "label: string;")
+    assert fixed_count == 2  # noqa: PLR2004 # the model missing from the file isn't counted
+
+
+def test_Given_model_declared_twice__When_indexed__Then_first_declaration_used():
+    content = _TWO_MODELS + "export interface Widget extends Parsable {\n}\n"
+
+    block_offsets = kiota_nullable_fixer.index_model_blocks(content)
+
+    start_pos, end_pos = block_offsets["Widget"]
+    assert content[start_pos:end_pos] == "export interface Widget extends Parsable {\n    label?: string | null;\n}"
+
+
+_MODEL_WITH_DROPPED_FIELDS = """\
+export function deserializeIntoTaggedThing(taggedThing: Partial<TaggedThing> | undefined = {}) : Record<string, (node: ParseNode) => void> {
+ return {
+ }
+}
+export interface TaggedThing extends Parsable {
+}
+"""
+
+
+def test_Given_schema__When_main_run__Then_every_fix_applied_with_a_single_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    index_file = tmp_path / "index.ts"
+    _ = index_file.write_text(build_kiota_models_index(model_count=3, seed=0) + _MODEL_WITH_DROPPED_FIELDS)
+    schema = {
+        "components": {
+            "schemas": {
+                "Model0Response": {"required": ["label"], "properties": {"label": {"type": "string"}}},
+                "TaggedThing": {"properties": {"tags": {"type": "array", "items": {"type": "string"}}}},
+            }
+        }
+    }
+    monkeypatch.setattr(kiota_nullable_fixer, "MODELS_DIR", tmp_path, raising=False)  # only set when run as a script
+    written: list[Path] = []
+    original_write_text = Path.write_text
+
+    def spy_write_text(path: Path, data: str) -> int:
+        written.append(path)
+        return original_write_text(path, data)
+
+    monkeypatch.setattr(Path, Path.write_text.__name__, spy_write_text)
+
+    kiota_nullable_fixer.main(schema)
+
+    assert written == [index_file]
+    fixed = index_file.read_text()
+    assert " label: string;" in fixed
+    assert "Member1" not in fixed
+    assert '"tags": n => { taggedThing.tags = n.getCollectionOfPrimitiveValues<string>(); },' in fixed
@@ -0,0 +1,169 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from .helpers import PROJECT_ROOT
+
+_SCRIPT_PATH = PROJECT_ROOT / "template" / ".devcontainer" / "manual-setup-deps.py"
+# each fake records its install in the install directory's log, creating the directory the way the real tool would
+_FAKE_UV = """\
+#!/bin/sh
+if [ "$1" = "--version" ]; then echo "uv ${FAKE_UV_VERSION:-0.1.0}"; exit 0; fi
+echo "uv $1 output"
+mkdir -p "$3/.venv" && echo "$1" >> "$3/.venv/installs.log"
+exit "${FAKE_UV_EXIT_CODE:-0}"
+"""
+_FAKE_PNPM = """\
+#!/bin/sh
+if [ "$1" = "--version" ]; then echo "9.0.0"; exit 0; fi
+echo "pnpm $1 output"
+mkdir -p "$3/node_modules" && echo "$1" >> "$3/node_modules/installs.log"
+sleep "${FAKE_PNPM_SECONDS:-0}"
+"""
+_CANCELLED_PNPM_SECONDS = 30
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    devcontainer_dir = tmp_path / ".devcontainer"
+    devcontainer_dir.mkdir()
+    _ = shutil.copy(_SCRIPT_PATH, devcontainer_dir / _SCRIPT_PATH.name)
+    _ = (devcontainer_dir / "envs.json").write_text(
+        json.dumps(
+            [
+                {"description": "frontend", "relative_directory": "frontend", "package_manager": "pnpm"},
+                {"description": "backend", "relative_directory": "backend", "package_manager": "uv"},
+            ]
+        )
+    )
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, script in (("uv", _FAKE_UV), ("pnpm", _FAKE_PNPM)):
+        _ = (bin_dir / name).write_text(script)
+        (bin_dir / name).chmod(0o755)
+    return tmp_path
+
+
+def _run(repo: Path, *args: str, **fake_env: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PATH": f"{repo / 'bin'}{os.pathsep}{os.environ['PATH']}", **fake_env}
+    return subprocess.run(  # noqa: S603 # this is our own script
+        [
+            sys.executable,
+            str(repo / ".devcontainer" / _SCRIPT_PATH.name),
+            "--skip-check-lock",
+            "--skip-updating-devcontainer-hash",
+            *args,
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+def test_When_run_sequentially__Then_output_passed_through_unprefixed(repo: Path):
+    result = _run(repo)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert result.stdout.splitlines() == ["pnpm install output", "uv sync output"]
+
+
+def test_When_run_in_parallel__Then_output_prefixed_by_environment_and_timed(repo: Path):
+    result = _run(repo, "--parallel")
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    lines = result.stdout.splitlines()
+    assert "[frontend] pnpm install output" in lines
+    assert "[backend] uv sync output" in lines
+    assert any(line.startswith("[frontend] succeeded after ") for line in lines)
+    assert any(line.startswith("[backend] succeeded after ") for line in lines)
+
+
+def test_Given_environment_fails__When_run_in_parallel__Then_others_cancelled_and_exit_code_nonzero(repo: Path):
+    start = time.perf_counter()
+    result = _run(repo, "--parallel", FAKE_UV_EXIT_CODE="3", FAKE_PNPM_SECONDS=str(_CANCELLED_PNPM_SECONDS))
+    elapsed_seconds = time.perf_counter() - start
+
+    assert result.returncode == 1
+    assert elapsed_seconds < _CANCELLED_PNPM_SECONDS / 2  # the sleeping child of the pnpm shell was stopped too
+    lines = result.stdout.splitlines()
+    assert any(line.startswith("[backend] failed after ") for line in lines)
+    assert any(line.startswith("[frontend] cancelled after ") for line in lines)
+    assert lines[-1].startswith("Not all environments were installed: ")
+
+
+def test_Then_repo_copy_matches_the_template_copy():
+    assert (PROJECT_ROOT / ".devcontainer" / _SCRIPT_PATH.name).read_text() == _SCRIPT_PATH.read_text()
+
+
+def _install_count(install_dir: Path) -> int:
+    return len((install_dir / "installs.log").read_text().splitlines())
+
+
+def test_Given_nothing_changed__When_run_again__Then_installs_skipped(repo: Path):
+    _ = _run(repo)
+
+    result = _run(repo, "--parallel")
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert _install_count(repo / "frontend" / "node_modules") == 1
+    assert _install_count(repo / "backend" / ".venv") == 1
+    assert f"[backend] Skipping environment {repo / 'backend'} as nothing has changed" in result.stdout
+
+
+@pytest.mark.parametrize(
+    ("change", "expected_frontend_installs", "expected_backend_installs"),
+    [
+        pytest.param(lambda repo: (repo / "backend" / "uv.lock").write_text("version = 1\n"), 1, 2, id="lock-file"),
+        pytest.param(lambda repo: (repo / "frontend" / "package.json").write_text("{}\n"), 2, 1, id="manifest-file"),
+        pytest.param(lambda repo: (repo / ".python-version").write_text("3.13\n"), 1, 2, id="python-version"),
+        pytest.param(lambda repo: shutil.rmtree(repo / "frontend" / "node_modules"), 1, 1, id="install-deleted"),
+    ],
+)
+def test_Given_install_input_changed__When_run_again__Then_only_that_environment_reinstalled(
+    repo: Path,
+    change: Callable[[Path], object],
+    expected_frontend_installs: int,
+    expected_backend_installs: int,
+):
+    _ = _run(repo)
+    _ = change(repo)
+
+    result = _run(repo)
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert _install_count(repo / "frontend" / "node_modules") == expected_frontend_installs
+    assert _install_count(repo / "backend" / ".venv") == expected_backend_installs
+
+
+def test_Given_package_manager_upgraded__When_run_again__Then_reinstalled(repo: Path):
+    _ = _run(repo)
+
+    _ = _run(repo, FAKE_UV_VERSION="0.2.0")
+
+    assert _install_count(repo / "backend" / ".venv") == 2  # noqa: PLR2004 # installed once per uv version
+
+
+def test_Given_nothing_changed__When_run_with_force__Then_reinstalled(repo: Path):
+    _ = _run(repo)
+
+    _ = _run(repo, "--force")
+
+    assert _install_count(repo / "frontend" / "node_modules") == 2  # noqa: PLR2004 # both runs installed
+    assert _install_count(repo / "backend" / ".venv") == 2  # noqa: PLR2004 # both runs installed
+
+
+def test_Given_install_failed__When_run_again__Then_not_skipped(repo: Path):
+    _ = _run(repo)
+    _ = _run(repo, "--force", FAKE_UV_EXIT_CODE="1")
+
+    _ = _run(repo)
+
+    assert _install_count(repo / "backend" / ".venv") == 3  # noqa: PLR2004 # the failed install left no stamp behind